@@ -9,6 +9,8 @@ from .feed_parser import FeedParser
 from .article_extractor import ArticleExtractor
 from .filter import Filter
 from .parallel_processor import ParallelFeedProcessor
+from .pipeline_processor import PipelineFeedProcessor
+from .async_processor import AsyncFeedProcessor
 
 __all__ = [
     "Config",
@@ -17,4 +19,6 @@ __all__ = [
     "ArticleExtractor",
     "Filter",
     "ParallelFeedProcessor",
+    "PipelineFeedProcessor",
+    "AsyncFeedProcessor",
 ]
\ No newline at end of file
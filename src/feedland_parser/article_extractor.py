@@ -6,25 +6,49 @@
 3. CSS 选择器（兜底）
 4. 描述内容（最终回退）
 
+页面只下载、解析一次：ArticleExtractor 先下载页面得到 FetchedPage，
+FetchedPage.document 惰性解析出 lxml DOM（ParsedDocument），
+所有提取策略和图片提取共享同一份页面内容和 DOM。
+
 网络错误检测：当检测到网络错误时，立即停止后续尝试，直接使用描述内容。
+
+异步模式：extract_async 在事件循环上下载页面，解析和提取放到线程池执行。
 """
 
+import asyncio
+import contextlib
+import copy
+import functools
 import logging
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cached_property
 from typing import Optional, Dict, Any, List, Callable
-from dataclasses import dataclass
-from urllib.parse import urljoin
+from dataclasses import dataclass, field, replace
+from urllib.parse import urljoin, urlsplit, urlunsplit
 import requests
-from bs4 import BeautifulSoup
+import charset_normalizer
+import lxml.html
+from lxml import etree
 from newspaper import Article
 from dateutil import parser as date_parser
 from readability.readability import Unparseable
 from readability import Document as ReadabilityDocument
+from .scraper_pool import CLOUDSCRAPER_AVAILABLE, ScraperPool
+from .http_cache import HttpCache, CachedResponse
+from .strategy_stats import StrategyStats
+from .dom_matcher import SelectorSet, longest_matches
+from .single_flight import SingleFlight
+from .circuit_breaker import CircuitBreaker
+from .latency_tracker import LatencyTracker
 
 try:
-    import cloudscraper
-    CLOUDSCRAPER_AVAILABLE = True
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
 except ImportError:
-    CLOUDSCRAPER_AVAILABLE = False
+    AIOHTTP_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +62,11 @@ class NetworkError(Exception):
     pass
 
 
+class RequestTimeout(NetworkError):
+    """请求超时"""
+    pass
+
+
 @dataclass
 class ArticleContent:
     """文章内容"""
@@ -49,12 +78,40 @@ class ArticleContent:
     images: List[str] = None
     success: bool = True
     extraction_method: Optional[str] = None
+    images_future: Optional[Future] = None  # 延迟模式下后台提取图片的任务
 
     def __post_init__(self):
         if self.images is None:
             self.images = []
 
 
+class _FallbackText(str):
+    """兜底提取的文本（可以作为结果使用，但不计为策略成功）"""
+    pass
+
+
+@dataclass
+class FetchedPage:
+    """已下载的文章页面（同一次提取中所有策略共享）"""
+    url: str
+    status_code: int = 0
+    headers: Dict[str, str] = field(default_factory=dict)
+    content: bytes = b""
+    text: str = ""
+    fetcher: str = "requests"
+    encoding: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """页面是否下载成功且有内容"""
+        return 200 <= self.status_code < 400 and bool(self.text)
+
+    @cached_property
+    def document(self) -> "ParsedDocument":
+        """页面 DOM（首次访问时解析，之后复用）"""
+        return ParsedDocument(self.text, self.content)
+
+
 # ============================================================================
 # 常量定义
 # ============================================================================
@@ -83,6 +140,41 @@ CSS_SELECTORS = [
     "[class*='article-body']", "[class*='post-content']",
 ]
 
+# 图片提取模式
+IMAGE_MODE_FULL = "full"          # 在整个页面中提取
+IMAGE_MODE_SUMMARY = "summary"    # 只从 Readability 正文中提取
+IMAGE_MODE_DEFERRED = "deferred"  # 正文结果先返回，图片在后台线程中提取
+IMAGE_MODE_NONE = "none"          # 不提取图片
+IMAGE_MODES = (IMAGE_MODE_FULL, IMAGE_MODE_SUMMARY, IMAGE_MODE_DEFERRED, IMAGE_MODE_NONE)
+
+# feed 自带全文的判定阈值：纯文本最少字符数、纯文本占 HTML 的最小比例
+FULL_TEXT_MIN_LENGTH = 800
+FULL_TEXT_MIN_RATIO = 0.15
+
+# 有耗时统计时，耗时超过本次读取超时的该比例才计为慢请求（慢但正常的域名不会因此熔断）
+_SLOW_CALL_TIMEOUT_RATIO = 0.8
+
+# 全文被截断的常见结尾标记
+_TRUNCATION_MARKERS = (
+    "read more", "continue reading", "read the full", "阅读全文", "阅读原文", "查看全文", "[…]", "[...]",
+)
+
+# 图片所在容器（下标即优先级）：article、Readability 正文容器、IMAGE_SELECTORS 中的容器
+_IMAGE_CONTAINERS = SelectorSet(
+    ["article", "div#readability-content"] + [selector[:-len(" img")] for selector in IMAGE_SELECTORS]
+)
+
+# 图片 URL 过滤：追踪域名、图标等小图关键词
+_SKIP_IMAGE_DOMAINS = re.compile(
+    "googletagmanager|google-analytics|facebook\\.net|analytics|tracking|pixel|beacon|adsystem", re.IGNORECASE
+)
+_SKIP_IMAGE_PATTERNS = re.compile("icon|logo|avatar|user-pic|profile|button|btn", re.IGNORECASE)
+
+_CSS_SELECTOR_SET = SelectorSet(CSS_SELECTORS)  # 单次遍历匹配全部兜底选择器
+
+# 纯文本节点（跳过 script/style，注释不属于 text()）
+_TEXT_NODES = etree.XPath(".//text()[not(ancestor::script) and not(ancestor::style)]")
+
 
 # ============================================================================
 # 工具函数
@@ -159,6 +251,195 @@ def _is_content_valid(content: str) -> bool:
     return True
 
 
+def _element_text(element) -> str:
+    """
+    提取元素纯文本
+
+    跳过 script/style，每段文本去除首尾空白后按行拼接，
+    与 BeautifulSoup 的 get_text(separator="\\n", strip=True) 一致。
+
+    Args:
+        element: lxml 元素
+
+    Returns:
+        纯文本
+    """
+    parts = (text.strip() for text in _TEXT_NODES(element))
+    return "\n".join(part for part in parts if part)
+
+
+class ParsedDocument:
+    """解析后的页面 DOM
+
+    每个页面只解析一次 lxml 树，Readability 摘要等派生视图在首次访问时生成。
+    """
+
+    def __init__(self, html: str, raw: bytes = b""):
+        self._html = html
+        self._raw = raw
+
+    @cached_property
+    def tree(self):
+        """lxml 根元素，解析失败时为 None"""
+        try:
+            return lxml.html.document_fromstring(self._html)
+        except ValueError:
+            # 带编码声明的 XML 字符串不能直接解析，改用原始字节
+            try:
+                return lxml.html.document_fromstring(self._raw)
+            except Exception:
+                return None
+        except Exception:
+            return None
+
+    @cached_property
+    def readability_summary(self) -> Optional[str]:
+        """Readability 提取的正文 HTML"""
+        if self.tree is None:
+            return None
+        try:
+            # Readability 会修改传入的树，使用副本保护共享 DOM
+            return ReadabilityDocument(copy.deepcopy(self.tree)).summary() or None
+        except Unparseable:
+            return None
+        except Exception:
+            return None
+
+    @cached_property
+    def readability_text(self) -> Optional[str]:
+        """Readability 正文的纯文本"""
+        summary = self.readability_summary
+        if not summary:
+            return None
+        try:
+            return _element_text(lxml.html.fromstring(summary))
+        except Exception:
+            return None
+
+
+def _image_rank(img, primary: tuple) -> Optional[int]:
+    """
+    图片所在容器的优先级
+
+    Args:
+        img: img 元素
+        primary: 页面中第一个 article 和第一个 #readability-content 元素（前两级容器只使用这两个元素，
+            其他 article 中的图片按 IMAGE_SELECTORS 中的 "article img" 排序）
+
+    Returns:
+        最优先容器在 _IMAGE_CONTAINERS 中的下标，不在任何容器中时返回 None
+    """
+    rank = None
+    for ancestor in img.iterancestors():
+        for matched in _IMAGE_CONTAINERS.match(ancestor):
+            if matched < len(primary) and ancestor is not primary[matched]:
+                continue
+            if rank is None or matched < rank:
+                rank = matched
+            break
+        if rank == 0:
+            break
+    return rank
+
+
+def _looks_like_full_text(html: str, text: str, min_length: int = FULL_TEXT_MIN_LENGTH) -> bool:
+    """
+    判断 feed 内嵌内容是否为完整正文
+
+    Args:
+        html: 内嵌内容 HTML
+        text: 内嵌内容纯文本
+        min_length: 纯文本最少字符数
+
+    Returns:
+        长度足够、文本占比足够且结尾没有截断标记时返回 True
+    """
+    if len(text) < min_length:
+        return False
+    if len(text) / max(len(html), 1) < FULL_TEXT_MIN_RATIO:
+        return False
+    tail = text[-60:].lower()
+    return not any(marker in tail for marker in _TRUNCATION_MARKERS)
+
+
+def _fetch_page(url: str, session, timeout: tuple, label: str = "",
+                fetcher: str = "requests", headers: Optional[Dict[str, str]] = None) -> FetchedPage:
+    """
+    下载页面
+
+    HTTP 错误不抛异常，而是返回带状态码的 FetchedPage；
+    超时和连接失败（包括下载中途断开）抛出 NetworkError；
+    其他请求错误（无效 URL、不支持的协议、重定向过多等）返回状态码为 0 的不可用页面。
+
+    Args:
+        url: 页面 URL
+        session: requests.Session 或 cloudscraper 实例
+        timeout: (连接超时, 读取超时)
+        label: 日志/异常中使用的名称
+        fetcher: 下载方式标识
+        headers: 额外的请求头（例如条件请求头）
+
+    Returns:
+        已下载的页面
+    """
+    try:
+        response = session.get(url, timeout=timeout, headers=headers)
+    except requests.exceptions.Timeout:
+        raise RequestTimeout(f"{label} 请求超时")
+    except (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError) as e:
+        raise NetworkError(f"{label} 连接失败: {e}")
+    except requests.exceptions.RequestException as e:
+        logger.debug(f"{label} 请求失败: {url} - {e}")
+        return FetchedPage(url=url, fetcher=fetcher)
+
+    # 修复编码检测问题：使用 apparent_encoding 而不是默认的 ISO-8859-1
+    if response.encoding == 'ISO-8859-1':
+        response.encoding = response.apparent_encoding or 'utf-8'
+
+    try:
+        text = response.text if response.ok else ""
+    except Exception:
+        text = ""
+
+    return FetchedPage(
+        url=url,
+        status_code=response.status_code,
+        headers=dict(response.headers),
+        content=response.content or b"",
+        text=text,
+        fetcher=fetcher,
+        encoding=response.encoding,
+    )
+
+
+def _decode_content(content: bytes, encoding: Optional[str]) -> str:
+    """
+    按声明的编码解码页面，未声明或声明为 ISO-8859-1 时自动检测
+
+    与 requests 的处理方式保持一致（见 _fetch_page 中的编码修复）。
+
+    Args:
+        content: 页面字节
+        encoding: 响应头声明的编码
+
+    Returns:
+        解码后的文本
+    """
+    if not encoding or encoding.lower() == "iso-8859-1":
+        best = charset_normalizer.from_bytes(content).best()
+        encoding = best.encoding if best else None
+    try:
+        return content.decode(encoding or "utf-8", errors="replace")
+    except LookupError:
+        return content.decode("utf-8", errors="replace")
+
+
+def _article_key(url: str) -> str:
+    """合并重复提取使用的文章 key（忽略片段、协议和主机名大小写）"""
+    parts = urlsplit(url.strip())
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", parts.query, ""))
+
+
 def _parse_timestamp(timestamp: Optional[str]) -> Optional[str]:
     """解析时间戳为 ISO 8601 格式"""
     if not timestamp:
@@ -178,54 +459,24 @@ class ExtractionStrategy:
     """提取策略基类"""
 
     name: str = ""
-    timeout: tuple = (3, 10)
 
-    def extract(self, url: str, session: requests.Session) -> Optional[str]:
-        raise NotImplementedError
+    def prepare(self, page: FetchedPage, extractor: "ArticleExtractor") -> FetchedPage:
+        """准备本策略使用的页面（默认直接复用共享页面）"""
+        return page
 
-    def _get_html(self, url: str, session: requests.Session, use_cloudscraper: bool = False) -> Optional[str]:
-        """获取 HTML 内容"""
-        try:
-            if use_cloudscraper:
-                scraper = cloudscraper.create_scraper()
-                response = scraper.get(url, timeout=self.timeout)
-            else:
-                response = session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-
-            # 修复编码检测问题：使用 apparent_encoding 而不是默认的 ISO-8859-1
-            if response.encoding == 'ISO-8859-1':
-                response.encoding = response.apparent_encoding or 'utf-8'
-
-            return response.text
-        except requests.exceptions.Timeout:
-            raise NetworkError(f"{self.name} 请求超时")
-        except requests.exceptions.ConnectionError as e:
-            raise NetworkError(f"{self.name} 连接失败: {e}")
-        except requests.exceptions.HTTPError:
-            return None
-        except Exception:
-            return None
+    def applies(self, page: FetchedPage) -> bool:
+        """本策略能否处理该页面（不适用时跳过，不计入策略统计）"""
+        return page.ok
 
-    def _html_to_text(self, html: str) -> Optional[str]:
-        """HTML 转纯文本"""
-        if not html:
-            return None
-        try:
-            soup = BeautifulSoup(html, "lxml")
-            doc = ReadabilityDocument(html)
-            content = doc.summary()
-            if not content:
-                return None
-            soup = BeautifulSoup(content, "lxml")
-            for script in soup(["script", "style"]):
-                script.decompose()
-            text = soup.get_text(separator="\n", strip=True)
-            return _clean_text(text) if len(text) >= 100 else None
-        except Unparseable:
-            return None
-        except Exception:
+    def extract(self, page: FetchedPage) -> Optional[str]:
+        raise NotImplementedError
+
+    def _readability_text(self, page: FetchedPage) -> Optional[str]:
+        """使用共享 DOM 上的 Readability 结果提取纯文本"""
+        text = page.document.readability_text
+        if not text:
             return None
+        return _clean_text(text) if len(text) >= 100 else None
 
 
 class ReadabilityStrategy(ExtractionStrategy):
@@ -233,21 +484,37 @@ class ReadabilityStrategy(ExtractionStrategy):
 
     name = "Readability"
 
-    def extract(self, url: str, session: requests.Session) -> Optional[str]:
-        html = self._get_html(url, session)
-        return self._html_to_text(html)
+    def extract(self, page: FetchedPage) -> Optional[str]:
+        if not page.ok:
+            return None
+        return self._readability_text(page)
 
 
 class CloudscraperStrategy(ExtractionStrategy):
-    """cloudscraper + Readability 提取"""
+    """cloudscraper + Readability 提取
+
+    仅在普通请求未拿到页面（如被 Cloudflare 拦截）时用 cloudscraper 重新下载，
+    下载成功的页面会替换共享页面，供后续策略和图片提取使用。
+    """
 
     name = "cloudscraper+Readability"
 
-    def extract(self, url: str, session: requests.Session) -> Optional[str]:
-        if not CLOUDSCRAPER_AVAILABLE:
+    def prepare(self, page: FetchedPage, extractor: "ArticleExtractor") -> FetchedPage:
+        if not CLOUDSCRAPER_AVAILABLE or page.ok:
+            return page
+        # 复用该域名的 scraper，保留已通过验证的 cookies 和连接
+        scraper = extractor.scraper_pool.get(page.url)
+        scraped = extractor._fetch_page(page.url, client=scraper, fetcher="cloudscraper", label=self.name)
+        return scraped if scraped.ok else page
+
+    def applies(self, page: FetchedPage) -> bool:
+        # 普通请求拿到的页面已由 Readability 处理过，无需重复
+        return page.ok and page.fetcher == "cloudscraper"
+
+    def extract(self, page: FetchedPage) -> Optional[str]:
+        if not self.applies(page):
             return None
-        html = self._get_html(url, session, use_cloudscraper=True)
-        return self._html_to_text(html)
+        return self._readability_text(page)
 
 
 class NewspaperStrategy(ExtractionStrategy):
@@ -255,15 +522,15 @@ class NewspaperStrategy(ExtractionStrategy):
 
     name = "Newspaper3k"
 
-    def extract(self, url: str, session: requests.Session) -> Optional[str]:
+    def extract(self, page: FetchedPage) -> Optional[str]:
+        if not page.ok:
+            return None
         try:
-            article = Article(url, timeout=10)
-            article.download()
+            article = Article(page.url)
+            article.download(input_html=page.text)
             article.parse()
             content = article.text
             return _clean_text(content) if content and len(content) >= 100 else None
-        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
-            raise NetworkError(f"Newspaper3k {e}")
         except Exception:
             return None
 
@@ -273,32 +540,26 @@ class CSSSelectorStrategy(ExtractionStrategy):
 
     name = "CSS-Selectors"
 
-    def extract(self, url: str, session: requests.Session) -> Optional[str]:
+    def extract(self, page: FetchedPage) -> Optional[str]:
+        if not page.ok:
+            return None
         try:
-            response = session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, "lxml")
-
-            # 尝试各选择器
-            for selector in CSS_SELECTORS:
-                elements = soup.select(selector)
-                if elements:
-                    best = max(elements, key=lambda e: len(e.get_text()))
-                    for script in best(["script", "style"]):
-                        script.decompose()
-                    text = best.get_text(separator="\n", strip=True)
-                    if len(text) >= 100:
-                        return _clean_text(text)
-
-            # 兜底：使用 body
-            body = soup.find("body")
-            if body:
-                for script in body(["script", "style"]):
-                    script.decompose()
-                return _clean_text(body.get_text(separator="\n", strip=True))
+            tree = page.document.tree
+            if tree is None:
+                return None
+
+            # 遍历一次 DOM，按优先级尝试各选择器匹配的最长元素
+            best = longest_matches(tree, _CSS_SELECTOR_SET)
+            for index in sorted(best):
+                text = _element_text(best[index])
+                if len(text) >= 100:
+                    return _clean_text(text)
+
+            # 兜底：使用 body（整页文本，不计为策略成功）
+            body = tree.find("body")
+            if body is not None:
+                return _FallbackText(_clean_text(_element_text(body)))
             return None
-        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
-            raise NetworkError(f"CSS-Selectors {e}")
         except Exception:
             return None
 
@@ -310,17 +571,41 @@ class CSSSelectorStrategy(ExtractionStrategy):
 class ArticleExtractor:
     """文章内容提取器"""
 
-    def __init__(self, timeout: int = 10, blacklist=None, connect_timeout: int = 3):
+    def __init__(self, timeout: int = 10, blacklist=None, connect_timeout: int = 3,
+                 host_scheduler=None, scraper_pool: Optional[ScraperPool] = None,
+                 http_cache: Optional[HttpCache] = None,
+                 strategy_stats: Optional[StrategyStats] = None,
+                 image_mode: str = IMAGE_MODE_FULL,
+                 single_flight: Optional[SingleFlight] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 latency_tracker: Optional[LatencyTracker] = None):
+        self._session = None  # 参数校验失败时 __del__ 仍可安全调用 close
+        if image_mode not in IMAGE_MODES:
+            raise ValueError(f"不支持的图片提取模式: {image_mode}")
         self.timeout = timeout
         self.connect_timeout = connect_timeout
         self._timeout = (connect_timeout, timeout)
         self.blacklist = blacklist
-        self._session = requests.Session()
-        self._session.headers.update({
+        self.host_scheduler = host_scheduler  # 按主机限制并发和请求间隔
+        self.scraper_pool = scraper_pool if scraper_pool is not None else ScraperPool()  # 按域名复用的 cloudscraper 会话
+        self.http_cache = http_cache  # 文章页面磁盘缓存（None 表示不缓存）
+        # 按域名统计各策略成功率，决定尝试顺序
+        self.strategy_stats = strategy_stats if strategy_stats is not None else StrategyStats()
+        self.image_mode = image_mode
+        self.single_flight = single_flight  # 合并同一次运行中对同一篇文章的重复提取（None 表示不合并）
+        # 按域名熔断（None 表示一次网络错误就把域名加入黑名单）
+        self.circuit_breaker = circuit_breaker
+        # 按域名耗时推导每次请求的超时（None 表示所有域名使用固定超时）
+        self.latency_tracker = latency_tracker
+        self._image_executor: Optional[ThreadPoolExecutor] = None  # 延迟模式的后台线程池
+        self._image_executor_lock = threading.Lock()
+        self._headers = {
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.9,zh-CN;q=0.8,zh;q=0.7",
-        })
+        }
+        self._session = requests.Session()
+        self._session.headers.update(self._headers)
         adapter = requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=1)
         self._session.mount("http://", adapter)
         self._session.mount("https://", adapter)
@@ -337,6 +622,21 @@ class ArticleExtractor:
         if self._session:
             self._session.close()
             self._session = None
+        if getattr(self, "scraper_pool", None) is not None:
+            self.scraper_pool.close()
+        if getattr(self, "http_cache", None) is not None:
+            self.http_cache.close()
+        if getattr(self, "strategy_stats", None) is not None:
+            self.strategy_stats.save()
+        if getattr(self, "latency_tracker", None) is not None:
+            self.latency_tracker.save()
+        if getattr(self, "_image_executor", None) is not None:
+            self._image_executor.shutdown(wait=True)
+            self._image_executor = None
+        if getattr(self, "single_flight", None) is not None:
+            if self.single_flight.hits:
+                logger.info(f"🔁 跨 feed 重复文章复用提取结果 {self.single_flight.hits} 次")
+            self.single_flight.clear()
 
     def __enter__(self):
         return self
@@ -354,25 +654,198 @@ class ArticleExtractor:
 
     def extract(self, article_url: str, title: Optional[str] = None,
                 published: Optional[str] = None, author: Optional[str] = None,
-                description: Optional[str] = None, feed_name: Optional[str] = None) -> ArticleContent:
-        """提取文章内容"""
+                description: Optional[str] = None, feed_name: Optional[str] = None,
+                dedupe_key: Optional[str] = None) -> ArticleContent:
+        """提取文章内容（dedupe_key 为合并重复提取使用的 URL，默认使用 article_url）"""
 
         # 检查黑名单
-        if self.blacklist and self.blacklist.is_blacklisted(article_url):
+        if self.blacklist is not None and self.blacklist.is_blacklisted(article_url):
             domain = self.blacklist.get_domain_from_url(article_url)
             logger.debug(f"⏭️  域名在黑名单中: {domain}")
             return self._fallback(article_url, title, published, author, description, "域名在黑名单中", feed_name)
 
+        if self.single_flight is None:
+            return self._extract_url(article_url, title, published, author, description, feed_name)
+
+        # 其他 feed 正在（或已经）提取同一篇文章时复用其结果
+        shared, reused = self.single_flight.do(
+            _article_key(dedupe_key or article_url),
+            lambda: self._extract_url(article_url, title, published, author, description, feed_name)
+        )
+        if not reused:
+            return shared
+        return self._reuse(shared, article_url, title, published, author, description, feed_name)
+
+    def _extract_url(self, article_url: str, title: Optional[str], published: Optional[str],
+                     author: Optional[str], description: Optional[str],
+                     feed_name: Optional[str]) -> ArticleContent:
+        """下载页面并提取"""
+        if not self._circuit_allows(article_url):
+            return self._fallback(article_url, title, published, author, description, "域名已熔断", feed_name)
+        if not self._claim_probe(article_url):
+            return self._fallback(article_url, title, published, author, description, "域名在黑名单中", feed_name)
         logger.debug(f"开始提取: {article_url}")
 
-        # 尝试各提取策略
-        for strategy in self._strategies:
+        # 下载页面（只下载一次，所有策略共享）
+        try:
+            page = self._fetch_page(article_url)
+        except NetworkError as e:
+            feed_display = feed_name or "Unknown"
+            logger.warning(f"⚠️ 页面下载网络错误: {article_url} - {feed_display} - {e}")
+            return self._fallback(article_url, title, published, author, description, f"网络错误: {e}", feed_name)
+
+        if self.blacklist is not None:
+            self.blacklist.record_success(article_url)
+        return self.extract_from_page(page, title, published, author, description, feed_name)
+
+    def _reuse(self, shared: ArticleContent, article_url: str, title: Optional[str],
+               published: Optional[str], author: Optional[str], description: Optional[str],
+               feed_name: Optional[str]) -> ArticleContent:
+        """
+        复用其他 feed 对同一篇文章的提取结果
+
+        正文和图片共享；标题、时间、作者使用本 feed 的条目信息。
+        页面提取失败时用本 feed 自己的描述回退（不再重复下载）。
+
+        Args:
+            shared: 其他 feed 的提取结果
+            article_url: 文章 URL
+
+        Returns:
+            文章内容
+        """
+        logger.debug(f"🔁 复用已提取的文章: {article_url}")
+        if shared.extraction_method in ("description-fallback", "failed"):
+            return self._fallback(article_url, title, published, author, description, "复用的提取结果失败", feed_name)
+        return replace(
+            shared,
+            title=title or "Unknown",
+            url=article_url,
+            published=_parse_timestamp(published),
+            author=author or "Unknown",
+            images=list(shared.images),
+        )
+
+    async def extract_async(self, article_url: str, http: "aiohttp.ClientSession",
+                            title: Optional[str] = None, published: Optional[str] = None,
+                            author: Optional[str] = None, description: Optional[str] = None,
+                            feed_name: Optional[str] = None, executor=None,
+                            dedupe_key: Optional[str] = None) -> ArticleContent:
+        """
+        异步提取文章内容（extract 的异步版本）
+
+        页面在事件循环上下载，DOM 解析和各提取策略在 executor 中执行。
+
+        Args:
+            article_url: 文章 URL
+            http: aiohttp 会话
+            executor: 执行 CPU 密集型解析的线程池（None 使用默认线程池）
+            dedupe_key: 合并重复提取使用的 URL（None 使用 article_url）
+
+        Returns:
+            文章内容
+        """
+        if self.blacklist is not None and self.blacklist.is_blacklisted(article_url):
+            domain = self.blacklist.get_domain_from_url(article_url)
+            logger.debug(f"⏭️  域名在黑名单中: {domain}")
+            return self._fallback(article_url, title, published, author, description, "域名在黑名单中", feed_name)
+
+        async def extract() -> ArticleContent:
+            if not self._circuit_allows(article_url):
+                return self._fallback(article_url, title, published, author, description, "域名已熔断", feed_name)
+            if not self._claim_probe(article_url):
+                return self._fallback(article_url, title, published, author, description, "域名在黑名单中", feed_name)
+            logger.debug(f"开始异步提取: {article_url}")
+
             try:
-                logger.debug(f"尝试 {strategy.name}: {article_url}")
-                content = strategy.extract(article_url, self._session)
+                page = await self._fetch_page_async(article_url, http)
+            except NetworkError as e:
+                feed_display = feed_name or "Unknown"
+                logger.warning(f"⚠️ 页面下载网络错误: {article_url} - {feed_display} - {e}")
+                return self._fallback(article_url, title, published, author, description, f"网络错误: {e}", feed_name)
 
-                if content and len(content) >= 100 and _is_content_valid(content):
-                    images = self._extract_images(article_url)
+            if self.blacklist is not None:
+                self.blacklist.record_success(article_url)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, functools.partial(
+                self.extract_from_page, page, title, published, author, description, feed_name
+            ))
+
+        if self.single_flight is None:
+            return await extract()
+
+        shared, reused = await self.single_flight.do_async(_article_key(dedupe_key or article_url), extract)
+        if not reused:
+            return shared
+        return self._reuse(shared, article_url, title, published, author, description, feed_name)
+
+    def extract_from_feed_content(self, article_url: str, html: Optional[str],
+                                  title: Optional[str] = None, published: Optional[str] = None,
+                                  author: Optional[str] = None,
+                                  min_length: int = FULL_TEXT_MIN_LENGTH,
+                                  force: bool = False) -> Optional[ArticleContent]:
+        """
+        直接使用 feed 内嵌的全文（content:encoded / atom:content），不发起任何请求
+
+        Args:
+            article_url: 文章 URL（用于补全相对图片地址）
+            html: 内嵌内容 HTML
+            min_length: 判定为全文的最少字符数
+            force: 跳过全文判定，只要内容有效就使用
+
+        Returns:
+            文章内容；内嵌内容不像完整正文时返回 None
+        """
+        if not html:
+            return None
+
+        page = FetchedPage(url=article_url, status_code=200, text=html, fetcher="feed")
+        tree = page.document.tree
+        if tree is None:
+            return None
+
+        text = _clean_text(_element_text(tree))
+        if not _is_content_valid(text):
+            return None
+        if not force and not _looks_like_full_text(html, text, min_length):
+            return None
+
+        logger.debug(f"✅ 使用 feed 内嵌全文 ({len(text)} 字符): {article_url}")
+        return ArticleContent(
+            title=title or "Unknown",
+            url=article_url,
+            published=_parse_timestamp(published),
+            author=author or "Unknown",
+            content=text,
+            images=self._extract_feed_images(page) if self.image_mode != IMAGE_MODE_NONE else [],
+            success=True,
+            extraction_method="feed-content"
+        )
+
+    def extract_from_page(self, page: FetchedPage, title: Optional[str] = None,
+                          published: Optional[str] = None, author: Optional[str] = None,
+                          description: Optional[str] = None,
+                          feed_name: Optional[str] = None) -> ArticleContent:
+        """使用已下载的页面依次尝试各提取策略（按该域名上的成功率排序）"""
+        article_url = page.url
+
+        # 尝试各提取策略（只统计真正在可用页面上运行过的策略）
+        for strategy in self.strategy_stats.order(article_url, self._strategies):
+            ran = False
+            try:
+                logger.debug(f"尝试 {strategy.name}: {article_url}")
+                page = strategy.prepare(page, self)
+                if not strategy.applies(page):
+                    logger.debug(f"⏭️  {strategy.name} 不适用: {article_url}")
+                    continue
+                ran = True
+                content = strategy.extract(page)
+
+                success = bool(content and len(content) >= 100 and _is_content_valid(content))
+                self.strategy_stats.record(
+                    article_url, strategy.name, success and not isinstance(content, _FallbackText)
+                )
+                if success:
                     logger.debug(f"✅ {strategy.name} 成功 ({len(content)} 字符)")
                     return ArticleContent(
                         title=title or "Unknown",
@@ -380,9 +853,10 @@ class ArticleExtractor:
                         published=_parse_timestamp(published),
                         author=author or "Unknown",
                         content=content,
-                        images=images,
+                        images=self._page_images(page),
                         success=True,
-                        extraction_method=strategy.name.lower().replace("+", "-")
+                        extraction_method=strategy.name.lower().replace("+", "-"),
+                        images_future=self._defer_images(page)
                     )
             except NetworkError as e:
                 feed_display = feed_name or "Unknown"
@@ -390,6 +864,8 @@ class ArticleExtractor:
                 # 网络错误立即停止
                 return self._fallback(article_url, title, published, author, description, f"网络错误: {e}", feed_name)
             except Exception as e:
+                if ran:
+                    self.strategy_stats.record(article_url, strategy.name, False)
                 logger.debug(f"❌ {strategy.name} 失败: {e}")
 
         # 全部失败，使用描述回退
@@ -397,16 +873,229 @@ class ArticleExtractor:
         logger.error(f"❌ 所有提取方法失败: {article_url} - {feed_display}")
         return self._fallback(article_url, title, published, author, description, "所有提取方法失败", feed_name)
 
+    def _fetch_page(self, url: str, client=None, fetcher: str = "requests",
+                    label: str = "页面下载") -> FetchedPage:
+        """
+        下载文章页面（受主机调度器限制）
+
+        Args:
+            url: 页面 URL
+            client: 下载使用的会话（默认共享的 requests.Session）
+            fetcher: 下载方式标识
+            label: 日志/异常中使用的名称
+
+        Returns:
+            已下载的页面
+        """
+        # 只缓存共享会话的请求（cloudscraper 只在普通请求失败时使用）
+        cache = self.http_cache if client is None else None
+        cached = cache.get(url) if cache is not None else None
+        if cached and cached.fresh:
+            logger.debug(f"使用 HTTP 缓存: {url}")
+            self._release_probe(url)
+            return self._page_from_cache(url, cached, cached.entry.encoding)
+
+        timeout = self._request_timeout(url)
+        started = time.monotonic()
+        page = error = None
+        try:
+            with self._host_slot(url):
+                started = time.monotonic()
+                page = _fetch_page(
+                    url, client or self._session, timeout, label, fetcher=fetcher,
+                    headers=cached.entry.conditional_headers() if cached else None
+                )
+        except NetworkError as e:
+            error = e
+            raise
+        finally:
+            self._record_outcome(url, started, timeout, error, completed=page is not None)
+        return self._update_cache(page, cached)
+
+    def _update_cache(self, page: FetchedPage, cached: Optional[CachedResponse]) -> FetchedPage:
+        """
+        根据响应更新缓存：304 时返回缓存的页面，200 时保存
+
+        Args:
+            page: 下载的页面
+            cached: 重新验证的缓存响应
+
+        Returns:
+            最终使用的页面
+        """
+        if self.http_cache is None:
+            return page
+        if cached and page.status_code == 304:
+            logger.debug(f"HTTP 缓存重新验证通过: {page.url}")
+            self.http_cache.refresh(page.url, page.headers)
+            return self._page_from_cache(page.url, cached, cached.entry.encoding)
+        if page.ok:
+            self.http_cache.put(page.url, page.status_code, page.headers, page.content, page.encoding)
+        return page
+
+    @staticmethod
+    def _page_from_cache(url: str, cached: CachedResponse, encoding: Optional[str]) -> FetchedPage:
+        """把缓存的响应转换为页面"""
+        return FetchedPage(
+            url=url,
+            status_code=cached.entry.status_code,
+            headers=dict(cached.entry.headers),
+            content=cached.content,
+            text=_decode_content(cached.content, encoding),
+            fetcher="cache",
+            encoding=encoding,
+        )
+
+    def _circuit_allows(self, url: str) -> bool:
+        """熔断器是否允许下载（未配置熔断器时总是允许）"""
+        if self.circuit_breaker is None or self.circuit_breaker.allow(url):
+            return True
+        logger.debug(f"⏭️  域名已熔断: {url}")
+        return False
+
+    def _claim_probe(self, url: str) -> bool:
+        """
+        即将发出请求时领取黑名单过期条目的探测名额（未配置黑名单时总是允许）
+
+        其他请求已经在探测时放弃熔断器刚刚放行的名额，本次请求不下载。
+        """
+        if self.blacklist is None or self.blacklist.claim_probe(url):
+            return True
+        logger.debug(f"⏭️  域名在黑名单中（正在探测）: {url}")
+        self._release_probe(url)
+        return False
+
+    def _request_timeout(self, url: str) -> tuple:
+        """本次请求的 (连接超时, 读取超时)：有耗时统计时按域名推导，否则使用固定超时"""
+        if self.latency_tracker is None:
+            return self._timeout
+        return self.latency_tracker.timeout_for(url, default=self._timeout)
+
+    def _release_probe(self, url: str) -> None:
+        """没有发出请求时放弃熔断器的探测名额"""
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.release(url)
+
+    def _record_outcome(self, url: str, started: float, timeout: tuple,
+                        error: Optional[Exception] = None, completed: bool = True) -> None:
+        """
+        把请求结果和耗时记录到熔断器和耗时统计
+
+        请求没有结果（被取消或抛出网络错误以外的异常，completed 为 False 且没有 error）时
+        只放弃探测名额，避免熔断器一直等待探测结果。
+        """
+        if error is None and not completed:
+            self._release_probe(url)
+            return
+        elapsed = time.monotonic() - started
+        if self.latency_tracker is not None:
+            if error is None:
+                self.latency_tracker.record(url, elapsed)
+            elif isinstance(error, RequestTimeout):
+                self.latency_tracker.record_timeout(url, timeout[1])
+        if self.circuit_breaker is None:
+            return
+        if error is None:
+            self.circuit_breaker.record_success(url, elapsed, self._slow_call_duration(timeout))
+        else:
+            self.circuit_breaker.record_failure(url, elapsed, reason=str(error))
+
+    def _slow_call_duration(self, timeout: tuple) -> float:
+        """
+        本次请求的慢请求阈值
+
+        有耗时统计时按本次使用的读取超时放宽（不低于熔断器配置的阈值），
+        否则响应慢但正常的域名会因为耗时超过固定阈值而被熔断。
+        """
+        threshold = self.circuit_breaker.slow_call_duration
+        if self.latency_tracker is None or not threshold:
+            return threshold
+        return max(threshold, timeout[1] * _SLOW_CALL_TIMEOUT_RATIO)
+
+    def _host_slot(self, url: str):
+        """主机调度名额（未配置调度器时不限制）"""
+        if self.host_scheduler:
+            return self.host_scheduler.slot(url)
+        return contextlib.nullcontext()
+
+    def _host_slot_async(self, url: str):
+        """主机调度名额的异步版本"""
+        if self.host_scheduler:
+            return self.host_scheduler.slot_async(url)
+        return contextlib.nullcontext()
+
+    async def _fetch_page_async(self, url: str, http: "aiohttp.ClientSession") -> FetchedPage:
+        """
+        异步下载文章页面（与 _fetch_page 相同：HTTP 错误和其他请求错误返回不可用页面，
+        超时和连接失败抛出 NetworkError）
+        """
+        # 缓存读写和编码检测涉及磁盘和 CPU，放到线程中执行
+        cached = await asyncio.to_thread(self.http_cache.get, url) if self.http_cache is not None else None
+        if cached and cached.fresh:
+            logger.debug(f"使用 HTTP 缓存: {url}")
+            self._release_probe(url)
+            return await asyncio.to_thread(self._page_from_cache, url, cached, cached.entry.encoding)
+
+        request_headers = dict(self._headers)
+        if cached:
+            request_headers.update(cached.entry.conditional_headers())
+
+        connect_timeout, read_timeout = request_timeout = self._request_timeout(url)
+        timeout = aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout)
+        started = time.monotonic()
+        error = None
+        completed = False
+        try:
+            async with self._host_slot_async(url):
+                started = time.monotonic()
+                async with http.get(url, headers=request_headers, timeout=timeout) as response:
+                    content = await response.read()
+                    status = response.status
+                    headers = dict(response.headers)
+                    encoding = response.charset
+                completed = True
+        except asyncio.TimeoutError:
+            error = RequestTimeout("页面下载 请求超时")
+            raise error
+        except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError) as e:
+            error = NetworkError(f"页面下载 连接失败: {e}")
+            raise error
+        except aiohttp.ClientError as e:
+            # 无效 URL、重定向过多等
+            logger.debug(f"页面下载 请求失败: {url} - {e}")
+            status, content, headers, encoding = 0, b"", {}, None
+            completed = True
+        finally:
+            self._record_outcome(url, started, request_timeout, error, completed)
+
+        ok = 200 <= status < 400
+        text = await asyncio.to_thread(_decode_content, content, encoding) if ok else ""
+        page = FetchedPage(
+            url=url,
+            status_code=status,
+            headers=headers,
+            content=content,
+            text=text,
+            encoding=encoding,
+        )
+        if self.http_cache is None:
+            return page
+        return await asyncio.to_thread(self._update_cache, page, cached)
+
     def _fallback(self, article_url: str, title: Optional[str], published: Optional[str],
                   author: Optional[str], description: Optional[str], reason: str,
                   feed_name: Optional[str] = None) -> ArticleContent:
         """描述内容回退"""
-        is_network_error = reason and reason.startswith("网络错误")
+        # 配置了熔断器时由熔断器按失败率判断域名是否失效，一次网络错误不再拉黑整个域名；
+        # 黑名单过期后放行的探测请求失败时仍然交给黑名单重新拉黑
+        is_network_error = bool(reason) and reason.startswith("网络错误") and self.blacklist is not None and (
+            self.circuit_breaker is None or self.blacklist.is_probing(article_url)
+        )
 
         if description and len(description) >= 50 and _is_content_valid(description):
             logger.debug(f"✅ 描述回退 ({len(description)} 字符)")
 
-            if is_network_error and self.blacklist:
+            if is_network_error:
                 self.blacklist.add_to_blacklist(article_url, reason=reason)
                 logger.info(f"🚫 加入黑名单: {article_url}")
 
@@ -420,7 +1109,7 @@ class ArticleExtractor:
                 extraction_method="description-fallback"
             )
 
-        if is_network_error and self.blacklist:
+        if is_network_error:
             self.blacklist.add_to_blacklist(article_url, reason=f"{reason}，且无有效描述")
 
         return ArticleContent(
@@ -437,61 +1126,128 @@ class ArticleExtractor:
     # 图片提取
     # -------------------------------------------------------------------------
 
-    def _extract_images(self, url: str, max_images: int = 10) -> List[str]:
-        """提取文章中的图片 URL"""
+    def _page_images(self, page: FetchedPage) -> List[str]:
+        """按图片提取模式提取页面图片（延迟模式和 none 模式返回空列表）"""
+        if self.image_mode == IMAGE_MODE_FULL:
+            return self._extract_images(page)
+        if self.image_mode == IMAGE_MODE_SUMMARY:
+            return self._extract_summary_images(page)
+        return []
+
+    def _defer_images(self, page: FetchedPage) -> Optional[Future]:
+        """延迟模式下把图片提取提交到后台线程池"""
+        if self.image_mode != IMAGE_MODE_DEFERRED:
+            return None
+        with self._image_executor_lock:
+            if self._image_executor is None:
+                self._image_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="images")
+            return self._image_executor.submit(self._extract_images, page)
+
+    @staticmethod
+    def resolve_deferred_images(articles: List[Dict[str, Any]], key: str = "_images_future") -> None:
+        """
+        等待后台图片提取完成，把结果写回文章的 images 字段
+
+        Args:
+            articles: 文章字典列表
+            key: 保存后台任务的字段名
+        """
+        for article in articles:
+            future = article.pop(key, None)
+            if future is None:
+                continue
+            try:
+                article["images"] = future.result()
+            except Exception as e:
+                logger.warning(f"📷 后台图片提取失败: {article.get('url')} - {e}")
+                article["images"] = []
+
+    def _extract_images(self, page: FetchedPage, max_images: int = 10) -> List[str]:
+        """
+        提取文章中的图片 URL（复用已下载的页面，只遍历一次 img 元素）
+
+        图片按所在容器排序：第一个 article 优先，其次第一个 #readability-content，最后是 IMAGE_SELECTORS 的容器；
+        前面的容器不足 3 张时才使用后面的容器，article 中找够 max_images 张后停止遍历。
+        """
+        if not page.ok:
+            return []
         try:
-            response = self._session.get(url, timeout=self._timeout)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, "lxml")
+            tree = page.document.tree
+            if tree is None:
+                return []
 
-            images = []
+            primary = (
+                next(tree.iter("article"), None),
+                next((div for div in tree.iter("div") if div.get("id") == "readability-content"), None),
+            )
+            candidates = []  # (容器优先级, URL)，按文档顺序
             seen = set()
-
-            # 策略 1: article 标签
-            article = soup.find("article")
-            if article:
-                for img in article.find_all("img"):
-                    src = self._get_image_src(img)
-                    if src and self._is_valid_image(src, img):
-                        absolute = urljoin(url, src)
-                        if absolute not in seen:
-                            seen.add(absolute)
-                            images.append(absolute)
-
-            # 策略 2: readability-content
+            in_article = 0
+            for img in tree.iter("img"):
+                rank = _image_rank(img, primary)
+                if rank is None:
+                    continue
+                absolute = self._image_url(page.url, img)
+                if absolute is None or absolute in seen:
+                    continue
+                seen.add(absolute)
+                candidates.append((rank, absolute))
+                if rank == 0:
+                    in_article += 1
+                    if in_article >= max_images:
+                        break
+
+            candidates.sort(key=lambda c: c[0])  # 稳定排序，同一优先级保持文档顺序
+            images = [url for rank, url in candidates if rank == 0]
             if len(images) < 3:
-                rc = soup.find("div", {"id": "readability-content"})
-                if rc:
-                    for img in rc.find_all("img"):
-                        src = self._get_image_src(img)
-                        if src and self._is_valid_image(src, img):
-                            absolute = urljoin(url, src)
-                            if absolute not in seen:
-                                seen.add(absolute)
-                                images.append(absolute)
-
-            # 策略 3: 选择器
+                images += [url for rank, url in candidates if rank == 1]
             if len(images) < 3:
-                for selector in IMAGE_SELECTORS:
-                    for elem in soup.select(selector):
-                        img = elem if elem.name == "img" else elem.find("img")
-                        if img:
-                            src = self._get_image_src(img)
-                            if src and self._is_valid_image(src, img):
-                                absolute = urljoin(url, src)
-                                if absolute not in seen:
-                                    seen.add(absolute)
-                                    images.append(absolute)
-
+                images += [url for rank, url in candidates if rank >= 2]
             return images[:max_images]
 
         except Exception as e:
             logger.warning(f"📷 图片提取失败: {e}")
             return []
 
+    def _extract_summary_images(self, page: FetchedPage, max_images: int = 10) -> List[str]:
+        """只从 Readability 正文中提取图片 URL（Readability 策略成功时无需额外解析页面）"""
+        summary = page.document.readability_summary if page.ok else None
+        if not summary:
+            return []
+        try:
+            return self._all_images(lxml.html.fromstring(summary), page.url, max_images)
+        except Exception as e:
+            logger.warning(f"📷 图片提取失败: {e}")
+            return []
+
+    def _extract_feed_images(self, page: FetchedPage, max_images: int = 10) -> List[str]:
+        """提取 feed 内嵌内容中的图片 URL"""
+        return self._all_images(page.document.tree, page.url, max_images)
+
+    def _all_images(self, tree, base_url: str, max_images: int = 10) -> List[str]:
+        """按文档顺序提取 DOM 中的全部有效图片 URL"""
+        images = []
+        seen = set()
+        for img in tree.iter("img"):
+            absolute = self._image_url(base_url, img)
+            if absolute and absolute not in seen:
+                seen.add(absolute)
+                images.append(absolute)
+                if len(images) >= max_images:
+                    break
+        return images
+
+    def _image_url(self, base_url: str, img) -> Optional[str]:
+        """获取 img 的绝对 URL，无效图片返回 None（按 img 中写的地址过滤，不受页面域名影响）"""
+        src = self._get_image_src(img)
+        if not src or not self._is_valid_image(src, img):
+            return None
+        absolute = urljoin(base_url, src)
+        return absolute if absolute.startswith("http") else None
+
     def _get_image_src(self, img) -> Optional[str]:
         """从 img 标签获取 URL"""
-        if not img:
+        if img is None:
             return None
 
         # 懒加载
@@ -511,14 +1267,12 @@ class ArticleExtractor:
         return None
 
     def _is_valid_image(self, url: str, img) -> bool:
-        """检查图片是否有效"""
-        if not url or not url.startswith("http"):
+        """检查图片是否有效（url 为 img 中的地址，可以是相对地址）"""
+        if not url:
             return False
 
         # 过滤追踪域名
-        skip_domains = ["googletagmanager", "google-analytics", "facebook.net",
-                        "analytics", "tracking", "pixel", "beacon", "adsystem"]
-        if any(d in url.lower() for d in skip_domains):
+        if _SKIP_IMAGE_DOMAINS.search(url):
             return False
 
         # 过滤小图
@@ -530,9 +1284,12 @@ class ArticleExtractor:
         except (ValueError, TypeError):
             pass
 
-        # 过滤 skip 关键词
-        skip_patterns = ["icon", "logo", "avatar", "user-pic", "profile", "button", "btn"]
-        if any(p in url.lower() for p in skip_patterns):
+        # 过滤 skip 关键词（只匹配路径，域名中含 profile、logo 等词的站点不受影响）
+        try:
+            path = urlsplit(url).path
+        except ValueError:
+            return False
+        if _SKIP_IMAGE_PATTERNS.search(path):
             return False
 
         return True
@@ -0,0 +1,170 @@
+"""异步处理模块
+
+在单个事件循环上并发处理大量 feeds：网络请求全部是协程，
+feed 解析和文章正文提取等 CPU 密集型工作放到线程池中执行，
+结果写出（result_sink、等待后台图片提取）和历史记录保存等阻塞操作也放到线程中执行，不阻塞事件循环。
+
+需要安装可选依赖 aiohttp（pip install "yonglelaoren-feedland-parser[async]"）。
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Callable, Optional
+from .article_extractor import AIOHTTP_AVAILABLE
+from .feed_parser import FeedParser, FeedResult
+from .filter import Filter
+from .opml_parser import FeedInfo
+from .parallel_processor import ParallelFeedProcessor
+
+if AIOHTTP_AVAILABLE:
+    import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncFeedProcessor(ParallelFeedProcessor):
+    """异步 Feed 处理器"""
+
+    def __init__(
+        self,
+        feed_parser: FeedParser,
+        filter: Filter,
+        max_workers: int = 10,
+        max_concurrency: int = 100,
+        checkpoint_interval: float = 0
+    ):
+        """
+        初始化异步处理器
+
+        Args:
+            feed_parser: Feed 解析器
+            filter: 文章过滤器
+            max_workers: 解析线程池的线程数（只用于 CPU 密集型工作）
+            max_concurrency: 同时处理的 feed 数量上限
+            checkpoint_interval: 运行中保存历史记录检查点的最小间隔（秒，0 表示只在全部完成后保存）
+
+        Raises:
+            ImportError: 未安装 aiohttp
+        """
+        if not AIOHTTP_AVAILABLE:
+            raise ImportError("异步模式需要安装 aiohttp: pip install aiohttp")
+        super().__init__(feed_parser, filter, max_workers=max_workers, checkpoint_interval=checkpoint_interval)
+        self.max_concurrency = max_concurrency
+
+    def process_feeds_parallel(
+        self,
+        feed_infos: List[FeedInfo],
+        progress_callback: Callable[[int, int, FeedResult], None] = None,
+        result_sink: Optional[Callable[[FeedResult], None]] = None
+    ) -> List[FeedResult]:
+        """
+        处理多个 feeds（在新的事件循环中运行 process_feeds_async）
+
+        Args:
+            feed_infos: Feed 信息列表
+            progress_callback: 进度回调函数 (current, total, result)
+            result_sink: 结果处理函数，每个 feed 完成时调用；设置后返回的结果不再保留文章内容
+
+        Returns:
+            Feed 结果列表
+        """
+        return asyncio.run(self.process_feeds_async(feed_infos, progress_callback, result_sink))
+
+    async def process_feeds_async(
+        self,
+        feed_infos: List[FeedInfo],
+        progress_callback: Optional[Callable[[int, int, FeedResult], None]] = None,
+        result_sink: Optional[Callable[[FeedResult], None]] = None
+    ) -> List[FeedResult]:
+        """
+        异步并发处理多个 feeds
+
+        任务按窗口创建：同时处理的 feed 不超过 max_concurrency 个，处理完一个再创建下一个，
+        已完成的结果交给 result_sink 后即释放，不会在运行期间积压。
+
+        Args:
+            feed_infos: Feed 信息列表
+            progress_callback: 进度回调函数 (current, total, result)
+            result_sink: 结果处理函数，每个 feed 完成时调用；设置后返回的结果不再保留文章内容
+
+        Returns:
+            Feed 结果列表（与输入顺序一致）
+        """
+        results = []
+        total = len(feed_infos)
+        completed = 0
+        feed_iter = iter(feed_infos)
+
+        logger.info(f"开始异步处理 {total} 个 feeds，并发上限 {self.max_concurrency}，解析线程 {self.max_workers} 个")
+
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            async with aiohttp.ClientSession(connector=connector) as http:
+                pending = set()
+
+                def submit_next() -> None:
+                    feed_info = next(feed_iter, None)
+                    if feed_info is not None:
+                        pending.add(asyncio.create_task(self._process_single_feed_async(feed_info, http, executor)))
+
+                for _ in range(self.max_concurrency):
+                    submit_next()
+
+                # 收集结果，每完成一个创建一个
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        result = task.result()
+                        kept, persisted = await asyncio.to_thread(self._deliver, result, result_sink)
+                        results.append(kept)
+                        await asyncio.to_thread(self._checkpoint, result, persisted)
+                        completed += 1
+
+                        if progress_callback:
+                            progress_callback(completed, total, result)
+
+                        logger.info(f"进度: {completed}/{total} - {result.feed_info.title}")
+                        submit_next()
+
+        # 按原始顺序排序结果
+        feed_url_to_result = {r.feed_info.url: r for r in results}
+        results = [feed_url_to_result[feed_info.url] for feed_info in feed_infos]
+
+        # 保存历史记录
+        await asyncio.to_thread(self._save_history)
+
+        logger.info(f"异步处理完成: {len(results)} 个 feeds")
+        return results
+
+    async def _process_single_feed_async(
+        self,
+        feed_info: FeedInfo,
+        http: "aiohttp.ClientSession",
+        executor: ThreadPoolExecutor
+    ) -> FeedResult:
+        """
+        异步处理单个 feed
+
+        Args:
+            feed_info: Feed 信息
+            http: aiohttp 会话
+            executor: 解析线程池
+
+        Returns:
+            Feed 结果
+        """
+        try:
+            result = await self.feed_parser.parse_feed_async(feed_info, http, executor)
+            self._record_result(feed_info, result)
+            return result
+
+        except Exception as e:
+            logger.error(f"处理单个 feed 时发生错误 {feed_info.url}: {e}")
+            return FeedResult(
+                feed_info=feed_info,
+                articles=[],
+                success=False,
+                error=str(e)
+            )
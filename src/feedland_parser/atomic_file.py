@@ -0,0 +1,58 @@
+"""原子文件写入模块
+
+先写入同目录下的临时文件并同步到磁盘，再用 os.replace 替换目标文件。
+写入过程中进程被终止时，目标文件要么是旧内容，要么是完整的新内容，不会被截断。
+"""
+
+import json
+import os
+import tempfile
+from typing import Any, Union
+
+
+def atomic_write(path: str, data: Union[str, bytes], prefix: str = ".tmp-") -> None:
+    """
+    原子地写入文件
+
+    Args:
+        path: 目标文件路径
+        data: 文件内容（str 按 UTF-8 编码）
+        prefix: 临时文件名前缀
+
+    Raises:
+        OSError: 写入失败（临时文件已删除，目标文件保持不变）
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=prefix, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def atomic_write_json(path: str, obj: Any, prefix: str = ".tmp-", **kwargs) -> None:
+    """
+    原子地写入 JSON 文件
+
+    Args:
+        path: 目标文件路径
+        obj: 要保存的对象
+        prefix: 临时文件名前缀
+        **kwargs: 传给 json.dumps 的参数（默认 ensure_ascii=False）
+
+    Raises:
+        OSError: 写入失败
+        TypeError: 对象无法序列化
+    """
+    kwargs.setdefault("ensure_ascii", False)
+    atomic_write(path, json.dumps(obj, **kwargs), prefix=prefix)
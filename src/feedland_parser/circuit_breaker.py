@@ -0,0 +1,217 @@
+"""按域名熔断模块
+
+每个域名一个熔断器，记录最近 window 次请求的结果（超时 / 连接失败，以及耗时超过 slow_call_duration 的慢请求）：
+
+- closed：正常放行。窗口内请求数达到 min_calls 且失败率（慢请求计为失败）达到 failure_rate 时熔断
+- open：拒绝请求，cooldown 秒后进入半开状态；每次重新熔断冷却时间翻倍（不超过 max_cooldown）
+- half_open：只放行一个探测请求，成功则恢复 closed，失败则重新熔断；
+  探测请求超过 _PROBE_TIMEOUT 秒没有结果（或被 release 放弃）时重新放行探测
+
+一次慢响应或偶发超时不会让整个域名在本次运行中失效，持续失败的域名则不再浪费超时等待。
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Optional
+
+from .domain_blacklist import DomainBlacklist
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# 探测请求超过该时间（秒）没有结果时允许再次探测
+_PROBE_TIMEOUT = 120
+
+
+@dataclass
+class _Circuit:
+    """单个域名的熔断状态"""
+    outcomes: Deque[bool] = field(default_factory=deque)  # 最近的请求结果（True 表示失败或慢请求）
+    failures: int = 0  # outcomes 中的失败数
+    state: str = CLOSED
+    opened_at: float = 0.0  # 熔断（或发出探测请求）的时间
+    cooldown: float = 0.0  # 当前冷却时间
+    trips: int = 0  # 连续熔断次数
+    probing: bool = False  # 半开状态下是否已放行探测请求
+
+
+class CircuitBreaker:
+    """按域名的熔断器（线程安全）"""
+
+    def __init__(self, window: int = 20, min_calls: int = 5, failure_rate: float = 0.5,
+                 slow_call_duration: float = 8.0, cooldown: float = 60.0, max_cooldown: float = 900.0):
+        """
+        初始化熔断器
+
+        Args:
+            window: 统计失败率的最近请求数
+            min_calls: 窗口内至少有多少次请求才计算失败率
+            failure_rate: 熔断的失败率阈值（0-1）
+            slow_call_duration: 耗时超过该秒数的请求计为失败（0 表示不统计耗时）
+            cooldown: 第一次熔断的冷却时间（秒）
+            max_cooldown: 冷却时间上限（秒）
+        """
+        self.window = max(1, int(window))
+        self.min_calls = max(1, min(int(min_calls), self.window))
+        self.failure_rate = min(1.0, max(0.0, float(failure_rate)))
+        self.slow_call_duration = max(0.0, float(slow_call_duration))
+        self.cooldown = max(0.0, float(cooldown))
+        self.max_cooldown = max(self.cooldown, float(max_cooldown))
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_domain(url: str) -> Optional[str]:
+        """熔断使用的域名（与黑名单相同）"""
+        return DomainBlacklist.get_domain_from_url(url)
+
+    def allow(self, url: str) -> bool:
+        """
+        是否允许向该域名发起请求
+
+        熔断冷却结束后，第一个调用方获得探测请求，其他调用方在探测结果出来前继续被拒绝；
+        探测请求超过 _PROBE_TIMEOUT 秒没有结果时放行新的探测请求。
+
+        Args:
+            url: 请求 URL
+
+        Returns:
+            允许返回 True
+        """
+        domain = self.get_domain(url)
+        with self._lock:
+            circuit = self._circuits.get(domain)
+            if circuit is None or circuit.state == CLOSED:
+                return True
+            now = time.monotonic()
+            if circuit.state == HALF_OPEN:
+                if circuit.probing and now - circuit.opened_at < _PROBE_TIMEOUT:
+                    return False
+            elif now - circuit.opened_at < circuit.cooldown:
+                return False
+            # 冷却结束（或上一次探测超时 / 被放弃）：放行一个探测请求
+            circuit.state = HALF_OPEN
+            circuit.probing = True
+            circuit.opened_at = now
+            logger.debug(f"🔎 熔断冷却结束，放行探测请求: {domain}")
+            return True
+
+    def release(self, url: str) -> None:
+        """
+        放弃探测请求（请求没有发出或没有结果，例如命中缓存、被取消），下一次 allow 重新放行探测
+
+        Args:
+            url: 请求 URL
+        """
+        domain = self.get_domain(url)
+        with self._lock:
+            circuit = self._circuits.get(domain)
+            if circuit is not None and circuit.state == HALF_OPEN:
+                circuit.probing = False
+
+    def record_success(self, url: str, elapsed: float = 0.0, slow_call_duration: Optional[float] = None) -> None:
+        """
+        记录一次完成的请求
+
+        Args:
+            url: 请求 URL
+            elapsed: 请求耗时（秒）
+            slow_call_duration: 本次请求的慢请求阈值（秒，None 使用 self.slow_call_duration，0 表示不统计耗时）
+        """
+        if slow_call_duration is None:
+            slow_call_duration = self.slow_call_duration
+        slow = bool(slow_call_duration) and elapsed >= slow_call_duration
+        self._record(url, slow, "慢请求" if slow else "")
+
+    def record_failure(self, url: str, elapsed: float = 0.0, reason: str = "") -> bool:
+        """
+        记录一次失败的请求（超时、连接失败）
+
+        Args:
+            url: 请求 URL
+            elapsed: 请求耗时（秒）
+            reason: 失败原因
+
+        Returns:
+            本次失败导致熔断时返回 True
+        """
+        return self._record(url, True, reason)
+
+    def _record(self, url: str, failed: bool, reason: str) -> bool:
+        domain = self.get_domain(url)
+        if not domain:
+            return False
+        with self._lock:
+            circuit = self._circuits.get(domain)
+            if circuit is None:
+                if not failed:
+                    return False  # 没有失败记录的域名不需要统计
+                circuit = self._circuits[domain] = _Circuit()
+
+            if circuit.state == HALF_OPEN:
+                if failed:
+                    return self._trip(domain, circuit, reason or "探测失败")
+                self._circuits.pop(domain)
+                logger.info(f"✅ 探测成功，恢复请求: {domain}")
+                return False
+            if circuit.state == OPEN:
+                return False  # 熔断前已发出的请求
+
+            circuit.outcomes.append(failed)
+            circuit.failures += failed
+            if len(circuit.outcomes) > self.window:
+                circuit.failures -= circuit.outcomes.popleft()
+            if not circuit.failures:
+                self._circuits.pop(domain)
+                return False
+
+            calls = len(circuit.outcomes)
+            if calls >= self.min_calls and circuit.failures / calls >= self.failure_rate:
+                return self._trip(domain, circuit, f"最近 {calls} 次请求失败率 {circuit.failures / calls:.0%}")
+            return False
+
+    def _trip(self, domain: str, circuit: _Circuit, reason: str) -> bool:
+        """熔断（调用方需持有锁）"""
+        circuit.trips += 1
+        circuit.cooldown = min(self.max_cooldown, self.cooldown * 2 ** (circuit.trips - 1))
+        circuit.state = OPEN
+        circuit.probing = False
+        circuit.opened_at = time.monotonic()
+        circuit.outcomes.clear()
+        circuit.failures = 0
+        logger.warning(f"🔌 熔断 {domain}: {reason}，{circuit.cooldown:.0f} 秒后探测")
+        return True
+
+    def state(self, url: str) -> str:
+        """
+        域名当前的熔断状态
+
+        Args:
+            url: URL 或域名
+
+        Returns:
+            closed / open / half_open
+        """
+        domain = self.get_domain(url) if "://" in url else url
+        with self._lock:
+            circuit = self._circuits.get(domain)
+            return circuit.state if circuit is not None else CLOSED
+
+    def open_domains(self) -> Dict[str, int]:
+        """
+        仍处于熔断（或半开）状态的域名
+
+        Returns:
+            域名 -> 连续熔断次数
+        """
+        with self._lock:
+            return {domain: c.trips for domain, c in self._circuits.items() if c.state != CLOSED}
+
+    def __repr__(self) -> str:
+        return f"CircuitBreaker(open={len(self.open_domains())}, window={self.window}, failure_rate={self.failure_rate})"
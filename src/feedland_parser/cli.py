@@ -6,7 +6,7 @@ import logging
 import os
 import sys
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 from .config import Config, DEFAULT_CONFIG
 from .opml_parser import OPMLParser
@@ -14,6 +14,17 @@ from .article_extractor import ArticleExtractor
 from .filter import Filter
 from .feed_parser import FeedParser
 from .parallel_processor import ParallelFeedProcessor
+from .pipeline_processor import PipelineFeedProcessor
+from .host_scheduler import HostScheduler
+from .scraper_pool import ScraperPool
+from .http_cache import HttpCache
+from .strategy_stats import StrategyStats
+from .history_store import open_history_store
+from .output_writer import JsonlWriter, feed_record
+from .single_flight import SingleFlight
+from .circuit_breaker import CircuitBreaker
+from .latency_tracker import LatencyTracker
+from .url_canonicalizer import DEFAULT_STRIP_PARAMS, UrlCanonicalizer
 from .logger import setup_logger
 from . import __version__
 
@@ -57,6 +68,12 @@ def parse_arguments() -> argparse.Namespace:
         help="显示详细日志"
     )
 
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="跳过上次中断的运行中已完成的 feeds"
+    )
+
     parser.add_argument(
         "--quiet",
         "-q",
@@ -133,7 +150,8 @@ def main() -> int:
 
         # 2. 加载历史记录
         logger.info("加载历史记录...")
-        filter = Filter(config)
+        history_store = open_history_store(config)
+        filter = Filter(config, store=history_store)
         filter.load_history()
 
         # 3. 创建黑名单（包含常驻域名）
@@ -141,8 +159,15 @@ def main() -> int:
         logger.info("初始化域名黑名单...")
         # 常驻黑名单：搜狗微信搜索页（返回的是搜索结果而非正文）
         PERMANENT_BLACKLIST = {"weixin.sogou.com"}
-        blacklist = DomainBlacklist(initial_blacklist=PERMANENT_BLACKLIST)
+        blacklist = DomainBlacklist(
+            initial_blacklist=PERMANENT_BLACKLIST | set(config.blacklist_rules),
+            state_file=config.blacklist_file,
+            base_ttl=config.blacklist_base_ttl,
+            max_ttl=config.blacklist_max_ttl
+        )
         logger.info(f"常驻黑名单已加载: {PERMANENT_BLACKLIST}")
+        if config.blacklist_rules_file:
+            blacklist.load_rules(config.blacklist_rules_file)
 
         # 4. 解析 OPML
         logger.info("解析 OPML...")
@@ -155,51 +180,169 @@ def main() -> int:
 
         logger.info(f"找到 {len(feed_infos)} 个 feeds")
 
-        # 5. 初始化处理器
-        article_extractor = ArticleExtractor(blacklist=blacklist)
-        feed_parser = FeedParser(article_extractor, filter, timeout=10)
-
-        # 6. 并行处理 feeds
-        logger.info(f"开始并行处理 {len(feed_infos)} 个 feeds...")
-        parallel_processor = ParallelFeedProcessor(
-            feed_parser,
+        # 断点续传：跳过上次中断的运行中已完成的 feeds
+        result_file = os.path.expanduser(config.result_file)
+        part_file = result_file + ".part" if config.output_format == "jsonl" else None
+        resume = resume_previous_run(filter, args.resume, part_file)
+        if resume:
+            completed_feeds = filter.completed_feeds()
+            feed_infos = [f for f in feed_infos if f.url not in completed_feeds]
+            logger.info(f"继续上次中断的运行，跳过 {len(completed_feeds)} 个已完成的 feeds，剩余 {len(feed_infos)} 个")
+
+        # 5. 初始化处理器（feed 和文章请求共用主机调度器，避免同一主机被突发请求）
+        host_scheduler = HostScheduler(
+            max_in_flight=config.host_max_in_flight,
+            min_interval=config.host_min_interval
+        )
+        scraper_pool = ScraperPool(cookie_file=config.scraper_cookie_file)
+        http_cache = None
+        if config.http_cache_dir:
+            http_cache = HttpCache(
+                config.http_cache_dir,
+                max_size=int(config.http_cache_max_size_mb * 1024 * 1024),
+                default_ttl=config.http_cache_default_ttl
+            )
+        circuit_breaker = None
+        if config.circuit_breaker:
+            circuit_breaker = CircuitBreaker(
+                window=config.breaker_window,
+                min_calls=config.breaker_min_calls,
+                failure_rate=config.breaker_failure_rate,
+                slow_call_duration=config.breaker_slow_call_duration,
+                cooldown=config.breaker_cooldown
+            )
+        latency_tracker = None
+        if config.adaptive_timeout:
+            latency_tracker = LatencyTracker(
+                state_file=config.latency_stats_file,
+                min_timeout=config.adaptive_timeout_min,
+                max_timeout=config.adaptive_timeout_max
+            )
+        article_extractor = ArticleExtractor(
+            blacklist=blacklist,
+            host_scheduler=host_scheduler,
+            scraper_pool=scraper_pool,
+            http_cache=http_cache,
+            strategy_stats=StrategyStats(state_file=config.strategy_stats_file),
+            image_mode=config.image_mode,
+            single_flight=SingleFlight() if config.dedupe_articles else None,
+            circuit_breaker=circuit_breaker,
+            latency_tracker=latency_tracker
+        )
+        feed_parser = FeedParser(
+            article_extractor,
             filter,
-            max_workers=config.threads
+            timeout=10,
+            host_scheduler=host_scheduler,
+            feed_full_text=config.feed_full_text,
+            full_text_overrides=config.feed_full_text_overrides,
+            full_text_min_length=config.feed_full_text_min_length,
+            url_canonicalizer=UrlCanonicalizer(
+                strip_params=DEFAULT_STRIP_PARAMS + tuple(config.url_strip_params),
+                normalize_mobile=config.url_normalize_mobile
+            ) if config.url_canonicalize else None
         )
 
-        results = []
-        total_articles = []
+        # 6. 并行处理 feeds
+        logger.info(f"开始并行处理 {len(feed_infos)} 个 feeds...")
+        if config.engine == "async":
+            from .async_processor import AsyncFeedProcessor
+            parallel_processor = AsyncFeedProcessor(
+                feed_parser,
+                filter,
+                max_workers=config.threads,
+                max_concurrency=config.async_concurrency,
+                checkpoint_interval=config.checkpoint_interval
+            )
+        elif config.engine == "pipeline":
+            parallel_processor = PipelineFeedProcessor(
+                feed_parser,
+                filter,
+                max_workers=config.threads,
+                article_workers=config.article_threads,
+                queue_size=config.article_queue_size,
+                max_pending=config.max_pending_feeds,
+                checkpoint_interval=config.checkpoint_interval
+            )
+        else:
+            parallel_processor = ParallelFeedProcessor(
+                feed_parser,
+                filter,
+                max_workers=config.threads,
+                max_pending=config.max_pending_feeds,
+                checkpoint_interval=config.checkpoint_interval
+            )
 
         def progress_callback(current: int, total: int, result) -> None:
             """进度回调"""
             logger.info(f"进度: {current}/{total} - {result.feed_info.title}")
-            if result.success:
-                total_articles.extend(result.articles)
-
-        results = parallel_processor.process_feeds_parallel(
-            feed_infos,
-            progress_callback=progress_callback
-        )
-
-        # 7. 生成输出
-        logger.info("生成输出...")
-        output = generate_output(results)
 
-        # 8. 保存结果到 JSON 文件
-        result_file = os.path.expanduser(config.result_file)
-        Path(result_file).parent.mkdir(parents=True, exist_ok=True)
-        with open(result_file, 'w', encoding='utf-8') as f:
-            json.dump(output, f, ensure_ascii=False, indent=2)
-        logger.info(f"✅ 结果已保存到: {result_file}")
+        if config.output_format == "jsonl":
+            # 7. 每个 feed 完成后立即写入 JSON Lines 文件，不在内存中保留文章
+            writer = JsonlWriter(result_file, record=config.jsonl_record, append=resume)
+
+            def write_result(result) -> None:
+                """结果 sink：等待后台图片提取完成后写入"""
+                article_extractor.resolve_deferred_images(result.articles)
+                writer.write_result(result)
+
+            try:
+                results = parallel_processor.process_feeds_parallel(
+                    feed_infos,
+                    progress_callback=progress_callback,
+                    result_sink=write_result
+                )
+            except BaseException:
+                writer.abort()
+                raise
+            finally:
+                # 关闭连接，保存 cloudscraper cookies
+                article_extractor.close()
+                feed_parser.close()
+
+            # 8. 把临时文件原子地重命名为结果文件
+            writer.close()
+            logger.info(f"✅ 结果已保存到: {result_file}（{writer.records} 条记录）")
+        else:
+            results = parallel_processor.process_feeds_parallel(
+                feed_infos,
+                progress_callback=progress_callback
+            )
+
+            # 等待后台图片提取完成（image_mode 为 deferred 时）
+            for result in results:
+                article_extractor.resolve_deferred_images(result.articles)
+
+            # 关闭连接，保存 cloudscraper cookies
+            article_extractor.close()
+            feed_parser.close()
+
+            # 7. 生成输出
+            logger.info("生成输出...")
+            output = generate_output(results)
+
+            # 8. 保存结果到 JSON 文件
+            Path(result_file).parent.mkdir(parents=True, exist_ok=True)
+            with open(result_file, 'w', encoding='utf-8') as f:
+                json.dump(output, f, ensure_ascii=False, indent=2)
+            logger.info(f"✅ 结果已保存到: {result_file}")
+
+        history_store.close()
 
         # 9. 显示摘要
         summary = parallel_processor.get_summary(results)
         logger.info(f"处理完成: {summary['successful_feeds']}/{summary['total_feeds']} 个 feeds 成功")
         logger.info(f"共提取 {summary['total_articles']} 篇文章")
 
-        # 10. 显示黑名单统计
+        # 10. 运行结束时仍处于熔断状态的域名加入黑名单，下次运行不再等待超时
+        if circuit_breaker is not None:
+            for domain, trips in circuit_breaker.open_domains().items():
+                blacklist.add_to_blacklist(domain, reason=f"熔断 {trips} 次")
+
+        # 11. 保存黑名单，显示黑名单统计
+        blacklist.save()
         if len(blacklist) > 0:
-            logger.info(f"本次运行中有 {len(blacklist)} 个域名被加入黑名单")
+            logger.info(f"黑名单中共有 {len(blacklist)} 个域名")
             blacklist_metadata = blacklist.get_blacklist_metadata()
             logger.info(f"黑名单元数据: {len(blacklist_metadata)} 个条目")
 
@@ -213,6 +356,38 @@ def main() -> int:
         return 1
 
 
+def resume_previous_run(filter: Filter, resume_requested: bool, part_file: Optional[str] = None) -> bool:
+    """
+    决定是否继续上次被中断的运行
+
+    上次运行已完成的 feeds 的历史记录已经在检查点中更新，它们的文章只保存在上次留下的
+    part_file 中。因此 part_file 存在时即使没有指定 --resume 也自动继续（追加写入），
+    否则重新开始会截断 part_file，而这些文章也不会再被处理。
+
+    Args:
+        filter: 已加载历史记录的过滤器
+        resume_requested: 是否指定了 --resume
+        part_file: JSON Lines 临时结果文件路径（json 格式时为 None）
+
+    Returns:
+        继续上次的运行返回 True；否则清空运行进度并返回 False
+    """
+    if not filter.completed_feeds():
+        return False
+    if resume_requested:
+        return True
+    if part_file and os.path.isfile(part_file):
+        logger.info(f"上次运行未完成，自动继续并追加到上次留下的部分结果: {part_file}")
+        return True
+
+    logger.info(
+        "上次运行未完成，本次重新处理所有 feeds（使用 --resume 跳过已完成的 feeds）；"
+        "已完成的 feeds 的历史记录已更新，只会处理新文章"
+    )
+    filter.clear_progress()
+    return False
+
+
 def generate_output(results: List) -> Dict[str, Any]:
     """
     生成输出
@@ -223,25 +398,7 @@ def generate_output(results: List) -> Dict[str, Any]:
     Returns:
         输出字典
     """
-    output = []
-
-    for result in results:
-        if result.success and result.articles:
-            # 清理文章中的内部字段
-            clean_articles = []
-            for article in result.articles:
-                clean_article = {k: v for k, v in article.items() if not k.startswith("_")}
-                clean_articles.append(clean_article)
-
-            feed_data = {
-                "feed_url": result.feed_info.url,
-                "feed_title": result.feed_info.title,
-                "feed_type": result.feed_info.feed_type,
-                "articles": clean_articles,
-            }
-            output.append(feed_data)
-
-    return output
+    return [record for record in map(feed_record, results) if record is not None]
 
 
 if __name__ == "__main__":
@@ -3,15 +3,57 @@
 import json
 import os
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import logging
 
+from .atomic_file import atomic_write_json
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_CONFIG = {
     "log_days": 3,
     "log_dir": "~/.feedland/logs",
     "result_file": "~/.feedland/results.json",
+    "engine": "threads",
+    "async_concurrency": 100,
+    "article_threads": 10,
+    "article_queue_size": 100,
+    "max_pending_feeds": None,
+    "host_max_in_flight": 2,
+    "host_min_interval": 0.2,
+    "scraper_cookie_file": None,
+    "feed_full_text": True,
+    "feed_full_text_overrides": {},
+    "feed_full_text_min_length": 800,
+    "http_cache_dir": None,
+    "http_cache_max_size_mb": 200,
+    "http_cache_default_ttl": 0,
+    "strategy_stats_file": None,
+    "image_mode": "full",
+    "output_format": "json",
+    "jsonl_record": "article",
+    "checkpoint_interval": 30,
+    "history_backend": "sqlite",
+    "history_db": None,
+    "dedupe_articles": True,
+    "url_canonicalize": True,
+    "url_strip_params": [],
+    "url_normalize_mobile": False,
+    "blacklist_file": "~/.feedland/blacklist.json",
+    "blacklist_base_ttl": 600,
+    "blacklist_max_ttl": 7 * 24 * 3600,
+    "blacklist_rules": [],
+    "blacklist_rules_file": None,
+    "circuit_breaker": True,
+    "breaker_window": 20,
+    "breaker_min_calls": 5,
+    "breaker_failure_rate": 0.5,
+    "breaker_slow_call_duration": 8,
+    "breaker_cooldown": 60,
+    "adaptive_timeout": True,
+    "adaptive_timeout_min": 2,
+    "adaptive_timeout_max": 30,
+    "latency_stats_file": "~/.feedland/latency.json",
 }
 
 
@@ -46,18 +88,26 @@ class Config:
             raise
 
     def save(self) -> None:
-        """保存配置文件"""
+        """保存配置文件（原子写入）"""
         if not self.config_path:
             raise ValueError("未设置配置文件路径")
 
         try:
-            with open(self.config_path, "w", encoding="utf-8") as f:
-                json.dump(self._config, f, indent=2, ensure_ascii=False)
+            # 原子写入：保存过程中被终止也不会截断配置文件
+            atomic_write_json(self.config_path, self._config, prefix=".config-", indent=2)
             logger.info(f"成功保存配置文件: {self.config_path}")
         except IOError as e:
             logger.error(f"保存配置文件失败: {e}")
             raise
 
+    def remove(self, *keys: str) -> None:
+        """删除配置项（不存在时忽略）"""
+        for key in keys:
+            self._config.pop(key, None)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._config
+
     # ===== 简化的属性访问 =====
     
     @property
@@ -83,6 +133,451 @@ class Config:
     def threads(self, value: int):
         self._config["threads"] = value
 
+    @property
+    def engine(self) -> str:
+        """执行引擎：threads（线程池）、pipeline（feed / 文章两级线程池）或 async（asyncio）"""
+        engine = self._config.get("engine", DEFAULT_CONFIG["engine"])
+        return engine if engine in ("threads", "pipeline", "async") else DEFAULT_CONFIG["engine"]
+
+    @engine.setter
+    def engine(self, value: str):
+        self._config["engine"] = value
+
+    @property
+    def async_concurrency(self) -> int:
+        try:
+            return int(self._config.get("async_concurrency", DEFAULT_CONFIG["async_concurrency"]))
+        except (ValueError, TypeError):
+            return DEFAULT_CONFIG["async_concurrency"]
+
+    @async_concurrency.setter
+    def async_concurrency(self, value: int):
+        self._config["async_concurrency"] = value
+
+    @property
+    def article_threads(self) -> int:
+        """pipeline 引擎的文章提取线程数"""
+        try:
+            return max(1, int(self._config.get("article_threads", DEFAULT_CONFIG["article_threads"])))
+        except (ValueError, TypeError):
+            return DEFAULT_CONFIG["article_threads"]
+
+    @article_threads.setter
+    def article_threads(self, value: int):
+        self._config["article_threads"] = value
+
+    @property
+    def article_queue_size(self) -> int:
+        """pipeline 引擎中提交到文章线程池的文章数上限"""
+        try:
+            return max(1, int(self._config.get("article_queue_size", DEFAULT_CONFIG["article_queue_size"])))
+        except (ValueError, TypeError):
+            return DEFAULT_CONFIG["article_queue_size"]
+
+    @article_queue_size.setter
+    def article_queue_size(self, value: int):
+        self._config["article_queue_size"] = value
+
+    @property
+    def max_pending_feeds(self) -> Optional[int]:
+        """同时提交处理的 feed 数上限（未设置时为线程数的 2 倍）"""
+        try:
+            value = self._config.get("max_pending_feeds", DEFAULT_CONFIG["max_pending_feeds"])
+            return max(1, int(value)) if value else None
+        except (ValueError, TypeError):
+            return DEFAULT_CONFIG["max_pending_feeds"]
+
+    @max_pending_feeds.setter
+    def max_pending_feeds(self, value: Optional[int]):
+        self._config["max_pending_feeds"] = value
+
+    @property
+    def host_max_in_flight(self) -> int:
+        """每个主机的最大并发请求数"""
+        try:
+            return max(1, int(self._config.get("host_max_in_flight", DEFAULT_CONFIG["host_max_in_flight"])))
+        except (ValueError, TypeError):
+            return DEFAULT_CONFIG["host_max_in_flight"]
+
+    @host_max_in_flight.setter
+    def host_max_in_flight(self, value: int):
+        self._config["host_max_in_flight"] = value
+
+    @property
+    def host_min_interval(self) -> float:
+        """同一主机相邻请求的最小间隔（秒）"""
+        try:
+            return max(0.0, float(self._config.get("host_min_interval", DEFAULT_CONFIG["host_min_interval"])))
+        except (ValueError, TypeError):
+            return DEFAULT_CONFIG["host_min_interval"]
+
+    @host_min_interval.setter
+    def host_min_interval(self, value: float):
+        self._config["host_min_interval"] = value
+
+    @property
+    def scraper_cookie_file(self) -> Optional[str]:
+        """cloudscraper cookies 持久化文件（未设置时只在本次运行内复用）"""
+        return self._config.get("scraper_cookie_file", DEFAULT_CONFIG["scraper_cookie_file"])
+
+    @scraper_cookie_file.setter
+    def scraper_cookie_file(self, value: Optional[str]):
+        self._config["scraper_cookie_file"] = value
+
+    @property
+    def feed_full_text(self) -> bool:
+        """feed 自带完整正文时是否直接使用（不下载文章页面）"""
+        return bool(self._config.get("feed_full_text", DEFAULT_CONFIG["feed_full_text"]))
+
+    @feed_full_text.setter
+    def feed_full_text(self, value: bool):
+        self._config["feed_full_text"] = value
+
+    @property
+    def feed_full_text_overrides(self) -> Dict[str, bool]:
+        """按 feed URL 覆盖 feed_full_text：true 总是使用内嵌内容，false 总是下载页面"""
+        overrides = self._config.get("feed_full_text_overrides")
+        if not isinstance(overrides, dict):
+            return {}
+        return {url: bool(value) for url, value in overrides.items()}
+
+    @feed_full_text_overrides.setter
+    def feed_full_text_overrides(self, value: Dict[str, bool]):
+        self._config["feed_full_text_overrides"] = value
+
+    @property
+    def feed_full_text_min_length(self) -> int:
+        """feed 内嵌内容判定为全文的最少字符数"""
+        try:
+            return max(0, int(self._config.get("feed_full_text_min_length", DEFAULT_CONFIG["feed_full_text_min_length"])))
+        except (ValueError, TypeError):
+            return DEFAULT_CONFIG["feed_full_text_min_length"]
+
+    @feed_full_text_min_length.setter
+    def feed_full_text_min_length(self, value: int):
+        self._config["feed_full_text_min_length"] = value
+
+    @property
+    def http_cache_dir(self) -> Optional[str]:
+        """文章页面磁盘缓存目录（未设置时不缓存）"""
+        return self._config.get("http_cache_dir", DEFAULT_CONFIG["http_cache_dir"])
+
+    @http_cache_dir.setter
+    def http_cache_dir(self, value: Optional[str]):
+        self._config["http_cache_dir"] = value
+
+    @property
+    def http_cache_max_size_mb(self) -> float:
+        """文章页面磁盘缓存大小上限（MB）"""
+        try:
+            return max(0.0, float(self._config.get("http_cache_max_size_mb", DEFAULT_CONFIG["http_cache_max_size_mb"])))
+        except (ValueError, TypeError):
+            return DEFAULT_CONFIG["http_cache_max_size_mb"]
+
+    @http_cache_max_size_mb.setter
+    def http_cache_max_size_mb(self, value: float):
+        self._config["http_cache_max_size_mb"] = value
+
+    @property
+    def http_cache_default_ttl(self) -> float:
+        """响应未声明 Cache-Control / Expires 时的缓存有效期（秒，0 表示每次重新验证）"""
+        try:
+            return max(0.0, float(self._config.get("http_cache_default_ttl", DEFAULT_CONFIG["http_cache_default_ttl"])))
+        except (ValueError, TypeError):
+            return DEFAULT_CONFIG["http_cache_default_ttl"]
+
+    @http_cache_default_ttl.setter
+    def http_cache_default_ttl(self, value: float):
+        self._config["http_cache_default_ttl"] = value
+
+    @property
+    def strategy_stats_file(self) -> Optional[str]:
+        """按域名统计的提取策略成功率持久化文件（未设置时只在本次运行内统计）"""
+        return self._config.get("strategy_stats_file", DEFAULT_CONFIG["strategy_stats_file"])
+
+    @strategy_stats_file.setter
+    def strategy_stats_file(self, value: Optional[str]):
+        self._config["strategy_stats_file"] = value
+
+    @property
+    def image_mode(self) -> str:
+        """图片提取模式：full / summary / deferred / none"""
+        mode = self._config.get("image_mode", DEFAULT_CONFIG["image_mode"])
+        if mode not in ("full", "summary", "deferred", "none"):
+            return DEFAULT_CONFIG["image_mode"]
+        return mode
+
+    @image_mode.setter
+    def image_mode(self, value: str):
+        self._config["image_mode"] = value
+
+    @property
+    def output_format(self) -> str:
+        """结果文件格式：json（全部完成后一次写入）/ jsonl（每个 feed 完成后追加写入）"""
+        fmt = self._config.get("output_format", DEFAULT_CONFIG["output_format"])
+        return fmt if fmt in ("json", "jsonl") else DEFAULT_CONFIG["output_format"]
+
+    @output_format.setter
+    def output_format(self, value: str):
+        self._config["output_format"] = value
+
+    @property
+    def jsonl_record(self) -> str:
+        """JSON Lines 每行的内容：article（每篇文章一行）/ feed（每个 feed 一行）"""
+        record = self._config.get("jsonl_record", DEFAULT_CONFIG["jsonl_record"])
+        return record if record in ("article", "feed") else DEFAULT_CONFIG["jsonl_record"]
+
+    @jsonl_record.setter
+    def jsonl_record(self, value: str):
+        self._config["jsonl_record"] = value
+
+    @property
+    def checkpoint_interval(self) -> float:
+        """运行中保存历史记录检查点的最小间隔（秒，0 表示只在全部完成后保存；只在 jsonl 输出时生效）"""
+        value = self._config.get("checkpoint_interval", DEFAULT_CONFIG["checkpoint_interval"])
+        try:
+            return max(0.0, float(value))
+        except (ValueError, TypeError):
+            return float(DEFAULT_CONFIG["checkpoint_interval"])
+
+    @checkpoint_interval.setter
+    def checkpoint_interval(self, value: float):
+        self._config["checkpoint_interval"] = value
+
+    @property
+    def history_backend(self) -> str:
+        """历史记录存储：sqlite（独立数据库，按 feed 增量写入）/ json（保存在配置文件中）"""
+        backend = self._config.get("history_backend", DEFAULT_CONFIG["history_backend"])
+        return backend if backend in ("sqlite", "json") else DEFAULT_CONFIG["history_backend"]
+
+    @history_backend.setter
+    def history_backend(self, value: str):
+        self._config["history_backend"] = value
+
+    @property
+    def history_db(self) -> str:
+        """SQLite 历史记录数据库路径（默认与配置文件放在一起：config.json -> config.history.db）
+
+        历史记录按 feed URL 保存，每个配置文件使用自己的数据库，多个配置订阅同一个 feed 时互不影响。
+        """
+        path = self._config.get("history_db") or DEFAULT_CONFIG["history_db"]
+        if path:
+            return path
+        return os.path.splitext(os.path.abspath(self.config_path))[0] + ".history.db"
+
+    @history_db.setter
+    def history_db(self, value: str):
+        self._config["history_db"] = value
+
+    @property
+    def dedupe_articles(self) -> bool:
+        """多个 feed 转载同一篇文章时只提取一次"""
+        return bool(self._config.get("dedupe_articles", DEFAULT_CONFIG["dedupe_articles"]))
+
+    @dedupe_articles.setter
+    def dedupe_articles(self, value: bool):
+        self._config["dedupe_articles"] = value
+
+    @property
+    def url_canonicalize(self) -> bool:
+        """提取前规范化文章 URL（删除跟踪参数、展开跳转链接）"""
+        return bool(self._config.get("url_canonicalize", DEFAULT_CONFIG["url_canonicalize"]))
+
+    @url_canonicalize.setter
+    def url_canonicalize(self, value: bool):
+        self._config["url_canonicalize"] = value
+
+    @property
+    def url_strip_params(self) -> List[str]:
+        """除默认跟踪参数外额外删除的查询参数（以 * 结尾表示前缀匹配）"""
+        params = self._config.get("url_strip_params") or DEFAULT_CONFIG["url_strip_params"]
+        return [str(p) for p in params] if isinstance(params, list) else []
+
+    @url_strip_params.setter
+    def url_strip_params(self, value: List[str]):
+        self._config["url_strip_params"] = value
+
+    @property
+    def url_normalize_mobile(self) -> bool:
+        """去重时把已知形式的 AMP 文章链接视为普通页面"""
+        return bool(self._config.get("url_normalize_mobile", DEFAULT_CONFIG["url_normalize_mobile"]))
+
+    @url_normalize_mobile.setter
+    def url_normalize_mobile(self, value: bool):
+        self._config["url_normalize_mobile"] = value
+
+    @property
+    def blacklist_file(self) -> Optional[str]:
+        """域名黑名单持久化文件路径（设为空字符串时黑名单只在本次运行内有效）"""
+        return self._config.get("blacklist_file", DEFAULT_CONFIG["blacklist_file"]) or None
+
+    @blacklist_file.setter
+    def blacklist_file(self, value: Optional[str]):
+        self._config["blacklist_file"] = value
+
+    @property
+    def blacklist_base_ttl(self) -> float:
+        """域名第一次被拉黑的有效期（秒），之后每次探测失败翻倍"""
+        value = self._config.get("blacklist_base_ttl", DEFAULT_CONFIG["blacklist_base_ttl"])
+        try:
+            return max(0.0, float(value))
+        except (ValueError, TypeError):
+            return float(DEFAULT_CONFIG["blacklist_base_ttl"])
+
+    @blacklist_base_ttl.setter
+    def blacklist_base_ttl(self, value: float):
+        self._config["blacklist_base_ttl"] = value
+
+    @property
+    def blacklist_max_ttl(self) -> float:
+        """域名黑名单有效期上限（秒）"""
+        value = self._config.get("blacklist_max_ttl", DEFAULT_CONFIG["blacklist_max_ttl"])
+        try:
+            return max(0.0, float(value))
+        except (ValueError, TypeError):
+            return float(DEFAULT_CONFIG["blacklist_max_ttl"])
+
+    @blacklist_max_ttl.setter
+    def blacklist_max_ttl(self, value: float):
+        self._config["blacklist_max_ttl"] = value
+
+    @property
+    def blacklist_rules(self) -> List[str]:
+        """常驻黑名单规则（example.com 精确匹配，*.example.com 匹配该域名及其子域名）"""
+        rules = self._config.get("blacklist_rules") or DEFAULT_CONFIG["blacklist_rules"]
+        return [str(r) for r in rules] if isinstance(rules, list) else []
+
+    @blacklist_rules.setter
+    def blacklist_rules(self, value: List[str]):
+        self._config["blacklist_rules"] = value
+
+    @property
+    def blacklist_rules_file(self) -> Optional[str]:
+        """导入的屏蔽列表文件路径（hosts 文件或每行一条规则）"""
+        return self._config.get("blacklist_rules_file") or None
+
+    @blacklist_rules_file.setter
+    def blacklist_rules_file(self, value: Optional[str]):
+        self._config["blacklist_rules_file"] = value
+
+    @property
+    def circuit_breaker(self) -> bool:
+        """按域名熔断（关闭时一次网络错误就把域名加入黑名单）"""
+        return bool(self._config.get("circuit_breaker", DEFAULT_CONFIG["circuit_breaker"]))
+
+    @circuit_breaker.setter
+    def circuit_breaker(self, value: bool):
+        self._config["circuit_breaker"] = value
+
+    @property
+    def breaker_window(self) -> int:
+        """熔断统计失败率的最近请求数"""
+        value = self._config.get("breaker_window", DEFAULT_CONFIG["breaker_window"])
+        try:
+            return max(1, int(value))
+        except (ValueError, TypeError):
+            return int(DEFAULT_CONFIG["breaker_window"])
+
+    @breaker_window.setter
+    def breaker_window(self, value: int):
+        self._config["breaker_window"] = value
+
+    @property
+    def breaker_min_calls(self) -> int:
+        """窗口内至少有多少次请求才计算失败率"""
+        value = self._config.get("breaker_min_calls", DEFAULT_CONFIG["breaker_min_calls"])
+        try:
+            return max(1, int(value))
+        except (ValueError, TypeError):
+            return int(DEFAULT_CONFIG["breaker_min_calls"])
+
+    @breaker_min_calls.setter
+    def breaker_min_calls(self, value: int):
+        self._config["breaker_min_calls"] = value
+
+    @property
+    def breaker_failure_rate(self) -> float:
+        """熔断的失败率阈值（0-1，慢请求计为失败）"""
+        value = self._config.get("breaker_failure_rate", DEFAULT_CONFIG["breaker_failure_rate"])
+        try:
+            return min(1.0, max(0.0, float(value)))
+        except (ValueError, TypeError):
+            return float(DEFAULT_CONFIG["breaker_failure_rate"])
+
+    @breaker_failure_rate.setter
+    def breaker_failure_rate(self, value: float):
+        self._config["breaker_failure_rate"] = value
+
+    @property
+    def breaker_slow_call_duration(self) -> float:
+        """耗时超过该秒数的请求计为失败（0 表示不统计耗时）"""
+        value = self._config.get("breaker_slow_call_duration", DEFAULT_CONFIG["breaker_slow_call_duration"])
+        try:
+            return max(0.0, float(value))
+        except (ValueError, TypeError):
+            return float(DEFAULT_CONFIG["breaker_slow_call_duration"])
+
+    @breaker_slow_call_duration.setter
+    def breaker_slow_call_duration(self, value: float):
+        self._config["breaker_slow_call_duration"] = value
+
+    @property
+    def breaker_cooldown(self) -> float:
+        """第一次熔断的冷却时间（秒），之后每次探测失败翻倍"""
+        value = self._config.get("breaker_cooldown", DEFAULT_CONFIG["breaker_cooldown"])
+        try:
+            return max(0.0, float(value))
+        except (ValueError, TypeError):
+            return float(DEFAULT_CONFIG["breaker_cooldown"])
+
+    @breaker_cooldown.setter
+    def breaker_cooldown(self, value: float):
+        self._config["breaker_cooldown"] = value
+
+    @property
+    def adaptive_timeout(self) -> bool:
+        """按域名的历史耗时推导文章请求超时（关闭时所有域名使用固定超时）"""
+        return bool(self._config.get("adaptive_timeout", DEFAULT_CONFIG["adaptive_timeout"]))
+
+    @adaptive_timeout.setter
+    def adaptive_timeout(self, value: bool):
+        self._config["adaptive_timeout"] = value
+
+    @property
+    def adaptive_timeout_min(self) -> float:
+        """推导出的读取超时下限（秒）"""
+        value = self._config.get("adaptive_timeout_min", DEFAULT_CONFIG["adaptive_timeout_min"])
+        try:
+            return max(0.1, float(value))
+        except (ValueError, TypeError):
+            return float(DEFAULT_CONFIG["adaptive_timeout_min"])
+
+    @adaptive_timeout_min.setter
+    def adaptive_timeout_min(self, value: float):
+        self._config["adaptive_timeout_min"] = value
+
+    @property
+    def adaptive_timeout_max(self) -> float:
+        """推导出的读取超时上限（秒）"""
+        value = self._config.get("adaptive_timeout_max", DEFAULT_CONFIG["adaptive_timeout_max"])
+        try:
+            return max(self.adaptive_timeout_min, float(value))
+        except (ValueError, TypeError):
+            return float(DEFAULT_CONFIG["adaptive_timeout_max"])
+
+    @adaptive_timeout_max.setter
+    def adaptive_timeout_max(self, value: float):
+        self._config["adaptive_timeout_max"] = value
+
+    @property
+    def latency_stats_file(self) -> Optional[str]:
+        """域名耗时统计文件路径（设为空字符串时只在本次运行内统计）"""
+        return self._config.get("latency_stats_file", DEFAULT_CONFIG["latency_stats_file"]) or None
+
+    @latency_stats_file.setter
+    def latency_stats_file(self, value: Optional[str]):
+        self._config["latency_stats_file"] = value
+
     @property
     def log_days(self) -> int:
         return self._config.get("log_days", DEFAULT_CONFIG["log_days"])
@@ -115,6 +610,26 @@ class Config:
     def his(self, value: Dict[str, str]):
         self._config["his"] = value
 
+    @property
+    def his_validators(self) -> Dict[str, Dict[str, str]]:
+        return self._config.get("his_validators", {})
+
+    @his_validators.setter
+    def his_validators(self, value: Dict[str, Dict[str, str]]):
+        self._config["his_validators"] = value
+
+    @property
+    def his_run(self) -> Dict[str, Any]:
+        """中断的运行中已完成的 feeds（检查点自动维护，正常完成后删除）"""
+        return self._config.get("his_run", {})
+
+    @his_run.setter
+    def his_run(self, value: Dict[str, Any]):
+        if value:
+            self._config["his_run"] = value
+        else:
+            self._config.pop("his_run", None)
+
     def validate(self) -> bool:
         """验证配置是否有效"""
         if not self.url:
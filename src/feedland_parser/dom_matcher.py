@@ -0,0 +1,178 @@
+"""单次遍历的 CSS 选择器匹配模块
+
+CSS 选择器兜底和图片提取各自使用几十个选择器，逐个执行需要遍历整个 DOM 几十次。
+这里把简单选择器（标签、#id、.class、[attr]、[attr='v']、[attr*='v']、[attr^='v']、[attr$='v']
+及其组合）按 id、class、属性名、标签建立索引，遍历 DOM 一次即可得到所有选择器的匹配结果。
+"""
+
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# 简单选择器：可选标签 + 若干 #id / .class / [attr...]
+_SELECTOR_RE = re.compile(r"^(?P<tag>[a-zA-Z][\w-]*|\*)?(?P<rest>(?:#[\w-]+|\.[\w-]+|\[[^\]]+\])*)$")
+_PART_RE = re.compile(r"#(?P<id>[\w-]+)|\.(?P<cls>[\w-]+)|\[(?P<attr>[\w-]+)(?:(?P<op>[*^$]?=)['\"]?(?P<value>[^'\"\]]*)['\"]?)?\]")
+
+# 不计入文本长度的元素
+_SKIP_TEXT_TAGS = frozenset(("script", "style"))
+
+
+class SimpleSelector:
+    """编译后的简单选择器"""
+
+    __slots__ = ("selector", "tag", "id", "classes", "attrs")
+
+    def __init__(self, selector: str):
+        """
+        解析选择器
+
+        Args:
+            selector: CSS 简单选择器（不支持组合符）
+
+        Raises:
+            ValueError: 不支持的选择器
+        """
+        match = _SELECTOR_RE.match(selector.strip())
+        if not match or not (match.group("tag") or match.group("rest")):
+            raise ValueError(f"不支持的选择器: {selector}")
+
+        tag = match.group("tag")
+        self.selector = selector
+        self.tag: Optional[str] = tag.lower() if tag and tag != "*" else None
+        self.id: Optional[str] = None
+        self.classes: Tuple[str, ...] = ()
+        self.attrs: Tuple[Tuple[str, Optional[str], str], ...] = ()
+
+        classes, attrs = [], []
+        for part in _PART_RE.finditer(match.group("rest")):
+            if part.group("id"):
+                self.id = part.group("id")
+            elif part.group("cls"):
+                classes.append(part.group("cls"))
+            else:
+                attrs.append((part.group("attr").lower(), part.group("op"), part.group("value") or ""))
+        self.classes = tuple(classes)
+        self.attrs = tuple(attrs)
+
+    def matches(self, element) -> bool:
+        """判断元素是否匹配"""
+        if self.tag and element.tag != self.tag:
+            return False
+        if self.id and element.get("id") != self.id:
+            return False
+        if self.classes:
+            tokens = (element.get("class") or "").split()
+            if not all(c in tokens for c in self.classes):
+                return False
+        for name, op, value in self.attrs:
+            actual = element.get(name)
+            if actual is None:
+                return False
+            if op == "=" and actual != value:
+                return False
+            if op == "*=" and value not in actual:
+                return False
+            if op == "^=" and not actual.startswith(value):
+                return False
+            if op == "$=" and not actual.endswith(value):
+                return False
+        return True
+
+
+class SelectorSet:
+    """一组按优先级排列的简单选择器，对单个元素一次性求出所有匹配的选择器"""
+
+    def __init__(self, selectors: Sequence[str]):
+        """
+        编译选择器
+
+        Args:
+            selectors: 选择器列表（下标即优先级，越小越优先）
+
+        Raises:
+            ValueError: 包含不支持的选择器
+        """
+        self.selectors = [SimpleSelector(s) for s in selectors]
+        # 每个选择器按最有区分度的条件放入一个索引：id > class > 属性名 > 标签
+        self._by_id: Dict[str, List[int]] = {}
+        self._by_class: Dict[str, List[int]] = {}
+        self._by_attr: Dict[str, List[int]] = {}
+        self._by_tag: Dict[Optional[str], List[int]] = {}
+
+        for index, selector in enumerate(self.selectors):
+            if selector.id:
+                self._by_id.setdefault(selector.id, []).append(index)
+            elif selector.classes:
+                self._by_class.setdefault(selector.classes[0], []).append(index)
+            elif selector.attrs:
+                self._by_attr.setdefault(selector.attrs[0][0], []).append(index)
+            else:
+                self._by_tag.setdefault(selector.tag, []).append(index)
+
+    def __len__(self) -> int:
+        return len(self.selectors)
+
+    def match(self, element) -> List[int]:
+        """
+        求出匹配该元素的所有选择器
+
+        Args:
+            element: lxml 元素
+
+        Returns:
+            匹配的选择器下标（升序）
+        """
+        tag = element.tag
+        if not isinstance(tag, str):
+            return []  # 注释、处理指令
+
+        candidates = self._by_tag.get(tag, []) + self._by_tag.get(None, [])
+        if self._by_id:
+            element_id = element.get("id")
+            if element_id:
+                candidates += self._by_id.get(element_id, [])
+        if self._by_class:
+            for token in (element.get("class") or "").split():
+                candidates += self._by_class.get(token, [])
+        if self._by_attr:
+            for name in element.keys():
+                candidates += self._by_attr.get(name, [])
+
+        if not candidates:
+            return []
+        return sorted({i for i in candidates if self.selectors[i].matches(element)})
+
+
+def longest_matches(tree, selector_set: SelectorSet) -> Dict[int, object]:
+    """
+    遍历 DOM 一次，求出每个选择器匹配的元素中文本最长的一个
+
+    文本长度自底向上累加（不含 script/style），不需要对每个候选元素单独提取文本。
+    长度相同时取文档中靠前的元素。
+
+    Args:
+        tree: lxml 根元素
+        selector_set: 选择器集合
+
+    Returns:
+        选择器下标 -> 文本最长的匹配元素
+    """
+    lengths: Dict[object, int] = {}
+    best: Dict[int, Tuple[int, object]] = {}
+
+    # 逆先序遍历：子元素总在父元素之前处理
+    for element in reversed(list(tree.iter())):
+        tag = element.tag
+        if not isinstance(tag, str) or tag in _SKIP_TEXT_TAGS:
+            length = 0
+        else:
+            length = len(element.text or "")
+            for child in element:
+                length += lengths.pop(child, 0) + len(child.tail or "")
+        lengths[element] = length
+
+        for index in selector_set.match(element):
+            current = best.get(index)
+            if current is None or length >= current[0]:
+                best[index] = (length, element)
+
+    return {index: element for index, (_, element) in best.items()}
@@ -1,27 +1,176 @@
-"""域名黑名单模块"""
+"""域名黑名单模块
 
+网络错误（超时、连接失败）的域名加入黑名单，之后的文章不再下载。
+除常驻域名外，每个条目都有过期时间：第 n 次被拉黑时有效期为 base_ttl * 2^(n-1)（不超过 max_ttl）。
+过期后进入半开状态，只放行一个探测请求：探测成功则移出黑名单，失败则以更长的有效期重新拉黑。
+黑名单可以保存到磁盘，下次运行不必再为同样的故障域名等待超时。
+
+除精确匹配的域名外，还支持后缀规则（`*.example.com` 匹配 example.com 及其所有子域名），
+可以从共享的屏蔽列表（hosts 文件、`||example.com^` 格式）批量导入。后缀规则按域名的每一级后缀做哈希查找，
+查找耗时只与域名的级数有关，与规则数量无关。覆盖整个公共后缀（`*.com`、`*.co.uk`、`*.github.io`）的规则会被忽略。
+
+每篇文章都要查询黑名单，而修改很少，因此采用写时复制：修改在锁内进行，完成后发布一个新的不可变快照，
+查询只读取当前快照，不需要加锁（只有过期条目的探测判断才加锁）。
+"""
+
+import functools
+import json
 import logging
-from typing import Optional, Set, List
+import os
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterable, Mapping, Optional, Set, List, Tuple
 from urllib.parse import urlparse
 from datetime import datetime
 from threading import Lock
 
+from .atomic_file import atomic_write_json
+
+try:
+    import tldextract
+    TLDEXTRACT_AVAILABLE = True
+except ImportError:
+    TLDEXTRACT_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# 探测请求超过该时间（秒）没有结果时允许再次探测
+_PROBE_TIMEOUT = 120
+
+# 未安装 tldextract 时使用的常见多级公共后缀（单级顶级域名总是视为公共后缀）
+_COMMON_PUBLIC_SUFFIXES = frozenset({
+    "com.cn", "net.cn", "org.cn", "gov.cn", "edu.cn", "com.hk", "com.tw", "org.tw",
+    "co.uk", "org.uk", "ac.uk", "co.jp", "ne.jp", "or.jp", "co.kr", "com.au", "net.au", "com.br",
+    "github.io", "gitlab.io", "blogspot.com", "appspot.com", "herokuapp.com",
+    "netlify.app", "vercel.app", "pages.dev", "workers.dev",
+})
+
+# hosts 文件中不作为规则的主机名
+_HOSTS_IGNORED = frozenset({"localhost", "localhost.localdomain", "local", "broadcasthost", "0.0.0.0"})
+
+
+@functools.lru_cache(maxsize=None)
+def _public_suffix_list():
+    """tldextract 自带的公共后缀列表快照（包含 github.io 等私有后缀，不联网更新）"""
+    return tldextract.TLDExtract(suffix_list_urls=(), cache_dir=None, include_psl_private_domains=True)
+
+
+def is_public_suffix(domain: str) -> bool:
+    """
+    域名本身是否为公共后缀（com、co.uk、github.io 等）
+
+    Args:
+        domain: 小写域名
+
+    Returns:
+        是公共后缀返回 True
+    """
+    if "." not in domain:
+        return True
+    if not TLDEXTRACT_AVAILABLE:
+        return domain in _COMMON_PUBLIC_SUFFIXES
+    result = _public_suffix_list()(domain)
+    return not result.domain and bool(result.suffix)
+
+
+def parse_rule(line: str) -> Optional[Tuple[str, bool]]:
+    """
+    解析一条黑名单规则
+
+    支持 `example.com`（精确匹配）、`*.example.com` / `.example.com` / `||example.com^`（后缀匹配）
+    和 hosts 文件格式（`0.0.0.0 example.com`，精确匹配）。`#` 和 `!` 开头的行为注释。
+
+    Args:
+        line: 规则文本
+
+    Returns:
+        (域名, 是否后缀匹配)，空行、注释或无法解析时返回 None
+    """
+    line = line.split("#", 1)[0].strip().lower()
+    if not line or line.startswith("!"):
+        return None
+    if " " in line or "\t" in line:
+        line = line.split()[-1]  # hosts 文件：IP 地址 主机名
+        if line in _HOSTS_IGNORED:
+            return None
+
+    suffix = False
+    if line.startswith("||"):
+        line, suffix = line[2:].rstrip("^"), True
+    elif line.startswith("*."):
+        line, suffix = line[2:], True
+    elif line.startswith("."):
+        line, suffix = line[1:], True
+
+    if line.startswith("www."):
+        line = line[4:]
+    if not line or any(c in line for c in "/*^$|"):
+        return None
+    return line, suffix
+
+
+def _matches_suffix(rules: FrozenSet[str], domain: str) -> bool:
+    """域名或其任一级上级域名是否有后缀规则"""
+    suffix = domain
+    while True:
+        if suffix in rules:
+            return True
+        dot = suffix.find(".")
+        if dot < 0:
+            return False
+        suffix = suffix[dot + 1:]
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    """发布给查询方的黑名单快照（不可变，发布后不再修改）"""
+    permanent: FrozenSet[str]  # 常驻域名（精确匹配）
+    rules: FrozenSet[str]  # 后缀规则
+    expires: Mapping[str, float]  # 有过期时间的域名 -> 过期时间（时间戳）
+
+
+_EMPTY_SNAPSHOT = _Snapshot(frozenset(), frozenset(), MappingProxyType({}))
+
+
+@functools.lru_cache(maxsize=8192)
+def _domain_from_url(url: str) -> Optional[str]:
+    """解析 URL 的域名（结果缓存，同一站点的文章只解析一次）"""
+    parsed = urlparse(url)
+    domain = (parsed.hostname or "").rstrip(".")
+    # 移除 www. 前缀
+    if domain.startswith("www."):
+        domain = domain[4:]
+    return domain or None
+
 
 class DomainBlacklist:
-    """域名黑名单管理类（线程安全）"""
+    """域名黑名单管理类（线程安全，查询不加锁）"""
 
-    def __init__(self, initial_blacklist: Optional[Set[str]] = None):
+    def __init__(self, initial_blacklist: Optional[Set[str]] = None, state_file: Optional[str] = None,
+                 base_ttl: float = 600, max_ttl: float = 7 * 24 * 3600):
         """
         初始化域名黑名单管理器
 
         Args:
-            initial_blacklist: 初始黑名单集合
+            initial_blacklist: 初始黑名单集合（常驻，不会过期）
+            state_file: 黑名单持久化文件路径（None 表示只在本次运行内有效）
+            base_ttl: 第一次拉黑的有效期（秒）
+            max_ttl: 有效期上限（秒）
         """
-        self._blacklist: Set[str] = initial_blacklist or set()
+        self._blacklist: Set[str] = set()
+        self._permanent: Set[str] = set()  # 常驻域名
+        self._suffix_rules: Set[str] = set()  # 后缀规则（匹配该域名及其所有子域名）
         self._blacklist_metadata: dict = {}  # 存储每个黑名单条目的元数据（添加时间、失败次数等）
-        self._lock = Lock()  # 线程锁，确保黑名单操作的线程安全
+        self._expires: Dict[str, float] = {}  # 域名 -> 过期时间（时间戳）
+        self._probing: Dict[str, float] = {}  # 半开状态下正在探测的域名 -> 开始时间
+        self.state_file = os.path.expanduser(state_file) if state_file else None
+        self.base_ttl = max(0.0, float(base_ttl))
+        self.max_ttl = max(self.base_ttl, float(max_ttl))
+        self._lock = Lock()  # 写操作的线程锁（查询读取 _snapshot，不加锁）
+        self._snapshot = _EMPTY_SNAPSHOT
+        self.add_rules(initial_blacklist or ())
+        self._load()
 
     @staticmethod
     def get_domain_from_url(url: str) -> Optional[str]:
@@ -32,25 +181,105 @@ class DomainBlacklist:
             url: URL 字符串
 
         Returns:
-            域名，如果 URL 无效则返回 None
+            小写域名（不含端口和 www. 前缀），如果 URL 无效则返回 None
         """
         try:
-            parsed = urlparse(url)
-            domain = parsed.netloc
-            # 如果没有协议或域名，返回 None
-            if not domain:
-                return None
-            # 移除 www. 前缀
-            if domain.startswith("www."):
-                domain = domain[4:]
-            # 再次检查是否为空
-            if not domain:
-                return None
-            return domain
+            return _domain_from_url(url)
         except Exception as e:
             logger.warning(f"从 URL 提取域名失败: {url}, 错误: {e}")
             return None
 
+    @classmethod
+    def _normalize(cls, url_or_domain: str) -> Optional[str]:
+        """URL 或域名对应的黑名单域名"""
+        if "://" in url_or_domain:
+            return cls.get_domain_from_url(url_or_domain)
+        domain = url_or_domain.strip().lower()
+        return domain[4:] if domain.startswith("www.") else domain or None
+
+    def add_rule(self, rule: str) -> bool:
+        """
+        添加一条常驻规则（精确域名或后缀规则，格式见 parse_rule）
+
+        Args:
+            rule: 规则文本
+
+        Returns:
+            添加了新规则返回 True
+        """
+        return self.add_rules([rule]) == 1
+
+    def add_rules(self, rules: Iterable[str]) -> int:
+        """
+        批量添加常驻规则（只发布一次快照）
+
+        Args:
+            rules: 规则文本
+
+        Returns:
+            新增的规则数
+        """
+        parsed = []
+        for rule in rules:
+            result = parse_rule(rule)
+            if result is None:
+                continue
+            if result[1] and is_public_suffix(result[0]):
+                logger.warning(f"忽略覆盖整个公共后缀的黑名单规则: {rule.strip()}")
+                continue
+            parsed.append(result)
+
+        count = 0
+        with self._lock:
+            for domain, suffix in parsed:
+                if suffix:
+                    if domain not in self._suffix_rules:
+                        self._suffix_rules.add(domain)
+                        count += 1
+                elif domain not in self._permanent:
+                    self._blacklist.add(domain)
+                    self._permanent.add(domain)
+                    self._blacklist_metadata.pop(domain, None)
+                    self._expires.pop(domain, None)
+                    count += 1
+            if count:
+                self._publish(rules=True)
+        return count
+
+    def load_rules(self, path: str) -> int:
+        """
+        从屏蔽列表文件导入规则（每行一条）
+
+        Args:
+            path: 文件路径
+
+        Returns:
+            新增的规则数
+        """
+        path = os.path.expanduser(path)
+        try:
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                count = self.add_rules(f)
+        except OSError as e:
+            logger.warning(f"加载黑名单规则失败: {path} - {e}")
+            return 0
+        logger.info(f"从 {path} 导入 {count} 条黑名单规则")
+        return count
+
+    def _publish(self, rules: bool = False) -> None:
+        """
+        发布新快照（调用方需持有锁）
+
+        Args:
+            rules: 常驻域名或后缀规则是否有变化（没有变化时复用上一个快照中的集合）
+        """
+        previous = self._snapshot
+        self._snapshot = _Snapshot(
+            permanent=frozenset(self._permanent) if rules else previous.permanent,
+            rules=frozenset(self._suffix_rules) if rules else previous.rules,
+            expires=MappingProxyType(dict(self._expires)),
+        )
+
     def is_blacklisted(self, url_or_domain: str) -> bool:
         """
         检查域名是否在黑名单中
@@ -61,17 +290,77 @@ class DomainBlacklist:
         Returns:
             如果域名在黑名单中返回 True，否则返回 False
         """
+        domain = self._normalize(url_or_domain)
+        if not domain:
+            return False
+        snapshot = self._snapshot
+        if domain in snapshot.permanent:
+            return True
+        if snapshot.rules and _matches_suffix(snapshot.rules, domain):
+            return True
+        expires = snapshot.expires.get(domain)
+        if expires is None:
+            return False
+        now = time.time()
+        if now < expires:
+            return True
+        # 已过期：只有已经放行的探测请求还没有结果时才拦截（只查询，不领取探测名额）
         with self._lock:
-            # 如果输入是域名，直接检查
-            if url_or_domain in self._blacklist:
-                return True
+            return domain in self._blacklist and self._is_active(domain, now)
 
-            # 如果输入是 URL，提取域名后检查
-            domain = self.get_domain_from_url(url_or_domain)
-            if domain and domain in self._blacklist:
+    def claim_probe(self, url_or_domain: str) -> bool:
+        """
+        即将发出请求时领取过期条目的探测名额
+
+        查询（is_blacklisted）不修改状态，只有真正发出请求时才调用本方法，
+        否则被熔断器等拦下的请求会占用探测名额，域名在探测超时前一直被拦截。
+
+        Args:
+            url_or_domain: URL 或域名
+
+        Returns:
+            可以发出请求返回 True（不在黑名单中或领取到探测名额），
+            条目仍然生效或其他请求正在探测时返回 False
+        """
+        domain = self._normalize(url_or_domain)
+        if not domain or domain not in self._snapshot.expires:
+            return not self.is_blacklisted(url_or_domain)
+        with self._lock:
+            if domain not in self._blacklist:
                 return True
+            now = time.time()
+            if self._is_active(domain, now):
+                return False
+            self._probing[domain] = now
+        logger.debug(f"🔎 黑名单已过期，放行探测请求: {domain}")
+        return True
 
-            return False
+    def _is_active(self, domain: str, now: float) -> bool:
+        """
+        黑名单条目是否生效（调用方需持有锁）
+
+        过期的条目只放行一个探测请求，探测期间其他请求仍被拦截。
+        """
+        if domain in self._permanent:
+            return True
+        if now < self._expires.get(domain, 0):
+            return True
+        started = self._probing.get(domain)
+        return started is not None and now - started < _PROBE_TIMEOUT
+
+    def _ttl(self, block_count: int) -> float:
+        """第 block_count 次拉黑的有效期"""
+        return min(self.max_ttl, self.base_ttl * 2 ** max(0, block_count - 1))
+
+    def _block(self, domain: str, now: float) -> None:
+        """（重新）拉黑域名并计算过期时间（调用方需持有锁）"""
+        metadata = self._blacklist_metadata[domain]
+        metadata["block_count"] = metadata.get("block_count", 0) + 1
+        expires = now + self._ttl(metadata["block_count"])
+        metadata["expires_at"] = datetime.fromtimestamp(expires).isoformat()
+        self._expires[domain] = expires
+        self._probing.pop(domain, None)
+        self._publish()
 
     def add_to_blacklist(self, url_or_domain: str, reason: Optional[str] = None) -> bool:
         """
@@ -84,13 +373,14 @@ class DomainBlacklist:
         Returns:
             成功添加返回 True，如果已经在黑名单中返回 False
         """
-        domain = self.get_domain_from_url(url_or_domain) if url_or_domain.startswith("http") else url_or_domain
+        domain = self._normalize(url_or_domain)
 
         if not domain:
             logger.warning(f"无法从输入提取域名: {url_or_domain}")
             return False
 
         with self._lock:
+            now = time.time()
             if domain in self._blacklist:
                 logger.debug(f"域名已在黑名单中: {domain}")
                 # 更新元数据
@@ -99,6 +389,11 @@ class DomainBlacklist:
                     self._blacklist_metadata[domain]["last_failed"] = datetime.now().isoformat()
                     if reason:
                         self._blacklist_metadata[domain]["reason"] = reason
+                    if domain not in self._permanent and now >= self._expires.get(domain, 0):
+                        # 已过期（探测失败）：以更长的有效期重新拉黑
+                        self._block(domain, now)
+                        logger.debug(f"🚫 探测失败，重新拉黑: {domain} 至 {self._blacklist_metadata[domain]['expires_at']}")
+                        return True
                 return False
 
             self._blacklist.add(domain)
@@ -108,18 +403,55 @@ class DomainBlacklist:
                 "last_failed": datetime.now().isoformat(),
                 "reason": reason or "Unknown"
             }
+            self._block(domain, now)
             logger.debug(f"✅ 域名已添加到黑名单: {domain} (原因: {reason or 'Unknown'})")
             return True
 
+    def record_success(self, url_or_domain: str) -> None:
+        """
+        记录域名请求成功：半开状态的探测成功时移出黑名单
+
+        Args:
+            url_or_domain: URL 或域名
+        """
+        domain = self._normalize(url_or_domain)
+        if domain not in self._snapshot.expires:
+            return  # 绝大多数请求的域名不在黑名单中，读取快照即可返回，不加锁
+        with self._lock:
+            if domain not in self._blacklist or domain in self._permanent:
+                return
+            if time.time() < self._expires.get(domain, 0):
+                return  # 拉黑前已发出的请求，不代表已恢复
+            self._blacklist.discard(domain)
+            self._blacklist_metadata.pop(domain, None)
+            self._expires.pop(domain, None)
+            self._probing.pop(domain, None)
+            self._publish()
+        logger.info(f"✅ 域名已恢复，移出黑名单: {domain}")
+
+    def is_probing(self, url_or_domain: str) -> bool:
+        """
+        域名是否正在进行半开探测（过期条目已放行探测请求、还没有结果）
+
+        Args:
+            url_or_domain: URL 或域名
+
+        Returns:
+            正在探测返回 True
+        """
+        domain = self._normalize(url_or_domain)
+        with self._lock:
+            return domain in self._probing
+
     def get_blacklist(self) -> Set[str]:
         """
         获取黑名单
 
         Returns:
-            黑名单集合
+            黑名单集合（后缀规则以 `*.example.com` 形式表示）
         """
-        with self._lock:
-            return self._blacklist.copy()
+        snapshot = self._snapshot
+        return set(snapshot.permanent) | set(snapshot.expires) | {f"*.{domain}" for domain in snapshot.rules}
 
     def get_blacklist_metadata(self) -> dict:
         """
@@ -131,15 +463,60 @@ class DomainBlacklist:
         with self._lock:
             return self._blacklist_metadata.copy()
 
+    # -------------------------------------------------------------------------
+    # 持久化
+    # -------------------------------------------------------------------------
 
-    def __len__(self) -> int:
-        """返回黑名单中的域名数量"""
+    def _load(self) -> None:
+        """从磁盘加载黑名单（忽略过期时间超过 max_ttl 的旧条目）"""
+        if not self.state_file or not os.path.isfile(self.state_file):
+            return
+        try:
+            with open(self.state_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.warning(f"加载域名黑名单失败: {e}")
+            return
+
+        now = time.time()
         with self._lock:
-            return len(self._blacklist)
+            for domain, metadata in (data.items() if isinstance(data, dict) else ()):
+                try:
+                    expires = datetime.fromisoformat(metadata["expires_at"]).timestamp()
+                except (KeyError, TypeError, ValueError):
+                    continue
+                if domain in self._permanent or expires + self.max_ttl < now:
+                    continue
+                self._blacklist.add(domain)
+                self._blacklist_metadata[domain] = dict(metadata)
+                self._expires[domain] = expires
+            self._publish()
+        logger.info(f"加载域名黑名单，共 {len(self._expires)} 个域名")
+
+    def save(self) -> None:
+        """把黑名单保存到磁盘（原子写入，常驻域名不保存）"""
+        if not self.state_file:
+            return
+        with self._lock:
+            data = {
+                domain: dict(metadata) for domain, metadata in self._blacklist_metadata.items()
+                if domain not in self._permanent
+            }
+        try:
+            atomic_write_json(self.state_file, data, prefix=".blacklist-", indent=2)
+            logger.debug(f"保存域名黑名单: {self.state_file}")
+        except Exception as e:
+            logger.warning(f"保存域名黑名单失败: {e}")
+
+    def __len__(self) -> int:
+        """返回黑名单中的域名和后缀规则数量"""
+        snapshot = self._snapshot
+        return len(snapshot.permanent) + len(snapshot.expires) + len(snapshot.rules)
 
     def __contains__(self, url_or_domain: str) -> bool:
         """支持 'in' 操作符"""
         return self.is_blacklisted(url_or_domain)
 
     def __repr__(self) -> str:
-        return f"DomainBlacklist(count={len(self._blacklist)})"
\ No newline at end of file
+        snapshot = self._snapshot
+        return f"DomainBlacklist(count={len(snapshot.permanent) + len(snapshot.expires)}, rules={len(snapshot.rules)})"
\ No newline at end of file
@@ -1,18 +1,28 @@
 """Feed 解析模块"""
 
+import asyncio
+import contextlib
+import functools
 import logging
 import feedparser
 import hashlib
-import socket
-from typing import List, Dict, Optional, Tuple
+import requests
+from typing import List, Dict, Optional, Tuple, Iterator
 from dataclasses import dataclass
 from datetime import datetime
-from .article_extractor import ArticleExtractor, ArticleContent
+from .article_extractor import ArticleExtractor, ArticleContent, AIOHTTP_AVAILABLE, FULL_TEXT_MIN_LENGTH
+
+if AIOHTTP_AVAILABLE:
+    import aiohttp
 from .filter import Filter
 from .opml_parser import FeedInfo
+from .url_canonicalizer import UrlCanonicalizer
 
 logger = logging.getLogger(__name__)
 
+# 使用 User-Agent 避免被某些网站拒绝
+FEED_USER_AGENT = "Mozilla/5.0 (compatible; yonglelaoren-feedland-parser/1.0.0)"
+
 
 @dataclass
 class FeedResult:
@@ -22,6 +32,31 @@ class FeedResult:
     articles: List[Dict]
     success: bool
     error: Optional[str] = None
+    etag: Optional[str] = None  # 本次响应的 ETag
+    modified: Optional[str] = None  # 本次响应的 Last-Modified
+    not_modified: bool = False  # 服务器返回 304，feed 未更新
+    article_count: Optional[int] = None  # 文章已交给结果 sink 并从 articles 中移除时的文章数
+    failed_articles: int = 0  # 提取失败的条目数（有失败时历史记录未前进则不保存校验信息，下次重新获取）
+
+    @property
+    def total_articles(self) -> int:
+        """文章数（包括已交给结果 sink 的文章）"""
+        return self.article_count if self.article_count is not None else len(self.articles)
+
+
+@dataclass
+class ArticleJob:
+    """待提取的文章（从 feed 条目中整理出的提取参数）"""
+
+    url: str
+    title: str
+    published: Optional[str]
+    author: Optional[str]
+    description: Optional[str]
+    article_id: Optional[str]
+    id_type: str
+    feed_content: Optional[str] = None  # feed 内嵌的正文 HTML（content:encoded / atom:content）
+    dedupe_key: Optional[str] = None  # 规范化后的 URL，跨 feed 去重使用（None 表示使用 url）
 
 
 class FeedParser:
@@ -33,7 +68,13 @@ class FeedParser:
         filter: Filter,
         timeout: int = 10,
         max_articles: int = 5,
-        max_retries: int = 3
+        max_retries: int = 3,
+        connect_timeout: int = 3,
+        host_scheduler=None,
+        feed_full_text: bool = True,
+        full_text_overrides: Optional[Dict[str, bool]] = None,
+        full_text_min_length: int = FULL_TEXT_MIN_LENGTH,
+        url_canonicalizer: Optional[UrlCanonicalizer] = None
     ):
         """
         初始化 Feed 解析器
@@ -41,15 +82,51 @@ class FeedParser:
         Args:
             article_extractor: 文章提取器
             filter: 文章过滤器
-            timeout: 请求超时时间（秒）
+            timeout: 读取超时时间（秒）
             max_articles: 每个 feed 最多提取的文章数
             max_retries: 最大重试次数
+            connect_timeout: 连接超时时间（秒）
+            host_scheduler: 主机调度器（按主机限制并发和请求间隔）
+            feed_full_text: feed 自带完整正文时直接使用，不下载文章页面
+            full_text_overrides: 按 feed URL 覆盖：True 总是使用内嵌内容，False 总是下载页面
+            full_text_min_length: 内嵌内容判定为全文的最少字符数
+            url_canonicalizer: 文章 URL 规范化器（规范化的 URL 只用作跨 feed 去重的 key，None 表示不规范化）
         """
         self.article_extractor = article_extractor
         self.filter = filter
         self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self._timeout = (connect_timeout, timeout)
         self.max_articles = max_articles
         self.max_retries = max_retries
+        self.host_scheduler = host_scheduler
+        self.feed_full_text = feed_full_text
+        self.full_text_overrides = full_text_overrides or {}
+        self.full_text_min_length = full_text_min_length
+        self.url_canonicalizer = url_canonicalizer
+
+        # 共享连接池：同一主机的 feed 复用 keep-alive 连接，超时按请求设置
+        self._headers = {
+            "User-Agent": FEED_USER_AGENT,
+            "Accept": "application/rss+xml, application/atom+xml, application/xml;q=0.9, text/xml;q=0.8, */*;q=0.5",
+        }
+        self._session = requests.Session()
+        self._session.headers.update(self._headers)
+        adapter = requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=20)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def close(self):
+        if self._session:
+            self._session.close()
+            self._session = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
 
     def parse_feed(self, feed_info: FeedInfo) -> FeedResult:
         """
@@ -62,8 +139,15 @@ class FeedParser:
             Feed 解析结果
         """
         try:
+            # 上次运行保存的 HTTP 缓存校验信息，用于条件请求
+            validators = self.filter.get_validators(feed_info.url) if self.filter else {}
+
             # 使用重试机制获取 feed
-            feed_data = self._fetch_feed_with_retry(feed_info.url)
+            feed_data = self._fetch_feed_with_retry(
+                feed_info.url,
+                etag=validators.get("etag"),
+                modified=validators.get("modified")
+            )
 
             if not feed_data:
                 return FeedResult(
@@ -73,13 +157,77 @@ class FeedParser:
                     error="无法获取 feed 数据"
                 )
 
+            # 304：feed 自上次运行后未更新，无需解析文章
+            if feed_data.get("status") == 304:
+                return self._not_modified_result(feed_info, validators)
+
             # 解析文章
-            articles = self._parse_articles(feed_info, feed_data)
+            articles, failed = self._parse_articles(feed_info, feed_data)
+
+            return FeedResult(
+                feed_info=feed_info,
+                articles=articles,
+                success=True,
+                etag=feed_data.get("etag"),
+                modified=feed_data.get("modified"),
+                failed_articles=failed
+            )
+
+        except Exception as e:
+            logger.error(f"解析 feed 失败 {feed_info.url}: {e}")
+            return FeedResult(
+                feed_info=feed_info,
+                articles=[],
+                success=False,
+                error=str(e)
+            )
+
+    async def parse_feed_async(self, feed_info: FeedInfo, http: "aiohttp.ClientSession",
+                               executor=None) -> FeedResult:
+        """
+        异步解析单个 feed（parse_feed 的异步版本）
+
+        网络请求在事件循环上并发执行，feed 解析和文章正文提取放到 executor 中执行。
+
+        Args:
+            feed_info: Feed 信息
+            http: aiohttp 会话
+            executor: 执行 CPU 密集型解析的线程池（None 使用默认线程池）
+
+        Returns:
+            Feed 解析结果
+        """
+        try:
+            validators = self.filter.get_validators(feed_info.url) if self.filter else {}
+
+            feed_data = await self._fetch_feed_async(
+                feed_info.url,
+                http,
+                etag=validators.get("etag"),
+                modified=validators.get("modified"),
+                executor=executor
+            )
+
+            if not feed_data:
+                return FeedResult(
+                    feed_info=feed_info,
+                    articles=[],
+                    success=False,
+                    error="无法获取 feed 数据"
+                )
+
+            if feed_data.get("status") == 304:
+                return self._not_modified_result(feed_info, validators)
+
+            articles, failed = await self._parse_articles_async(feed_info, feed_data, http, executor)
 
             return FeedResult(
                 feed_info=feed_info,
                 articles=articles,
-                success=True
+                success=True,
+                etag=feed_data.get("etag"),
+                modified=feed_data.get("modified"),
+                failed_articles=failed
             )
 
         except Exception as e:
@@ -91,40 +239,258 @@ class FeedParser:
                 error=str(e)
             )
 
-    def _fetch_feed_with_retry(self, feed_url: str) -> Optional[feedparser.FeedParserDict]:
+    def fetch_article_jobs(self, feed_info: FeedInfo) -> Tuple[FeedResult, List[ArticleJob]]:
+        """
+        获取 feed 并生成待提取的文章，不提取正文（流水线的第一阶段）
+
+        Args:
+            feed_info: Feed 信息
+
+        Returns:
+            (文章列表为空的 Feed 结果, 按顺序排列的待提取文章)；获取失败或 feed 未更新时文章为空
+        """
+        try:
+            validators = self.filter.get_validators(feed_info.url) if self.filter else {}
+
+            feed_data = self._fetch_feed_with_retry(
+                feed_info.url,
+                etag=validators.get("etag"),
+                modified=validators.get("modified")
+            )
+
+            if not feed_data:
+                return FeedResult(
+                    feed_info=feed_info,
+                    articles=[],
+                    success=False,
+                    error="无法获取 feed 数据"
+                ), []
+
+            if feed_data.get("status") == 304:
+                return self._not_modified_result(feed_info, validators), []
+
+            jobs = list(self._iter_article_jobs(feed_info, feed_data))
+            return FeedResult(
+                feed_info=feed_info,
+                articles=[],
+                success=True,
+                etag=feed_data.get("etag"),
+                modified=feed_data.get("modified")
+            ), jobs
+
+        except Exception as e:
+            logger.error(f"解析 feed 失败 {feed_info.url}: {e}")
+            return FeedResult(
+                feed_info=feed_info,
+                articles=[],
+                success=False,
+                error=str(e)
+            ), []
+
+    def extract_article(self, feed_info: FeedInfo, job: ArticleJob) -> Optional[Dict]:
+        """
+        提取单篇文章（流水线的第二阶段）
+
+        Args:
+            feed_info: Feed 信息
+            job: 待提取的文章
+
+        Returns:
+            文章字典，提取失败时返回 None
+        """
+        try:
+            # feed 自带全文时直接使用，否则下载页面提取
+            article_content = self._feed_native_article(feed_info, job)
+            if article_content is None:
+                article_content = self.article_extractor.extract(
+                    job.url,
+                    title=job.title,
+                    published=job.published,
+                    author=job.author,
+                    description=job.description,
+                    feed_name=feed_info.title,
+                    dedupe_key=job.dedupe_key
+                )
+            return self._build_article(job, article_content)
+
+        except Exception as e:
+            logger.warning(f"解析文章时发生错误: {job.url} - {job.title}: {e}")
+            return None
+
+    def finish_result(self, result: FeedResult, articles: List[Dict], total_processed: int) -> FeedResult:
+        """
+        把各阶段提取的文章汇总到 Feed 结果（按时间排序）
+
+        Args:
+            result: fetch_article_jobs 返回的 Feed 结果
+            articles: 提取成功的文章
+            total_processed: 已处理的条目总数
+
+        Returns:
+            填入文章后的 Feed 结果
+        """
+        result.articles = self._finish_articles(result.feed_info, articles, total_processed)
+        result.failed_articles = total_processed - len(articles)
+        return result
+
+    def _not_modified_result(self, feed_info: FeedInfo, validators: Dict[str, str]) -> FeedResult:
+        """feed 未更新 (304) 时的结果"""
+        logger.info(f"Feed 未更新 (304)，跳过: {feed_info.url}")
+        return FeedResult(
+            feed_info=feed_info,
+            articles=[],
+            success=True,
+            etag=validators.get("etag"),
+            modified=validators.get("modified"),
+            not_modified=True
+        )
+
+    def _host_slot(self, url: str):
+        """主机调度名额（未配置调度器时不限制）"""
+        if self.host_scheduler:
+            return self.host_scheduler.slot(url)
+        return contextlib.nullcontext()
+
+    def _host_slot_async(self, url: str):
+        """主机调度名额的异步版本"""
+        if self.host_scheduler:
+            return self.host_scheduler.slot_async(url)
+        return contextlib.nullcontext()
+
+    def _conditional_headers(self, etag: Optional[str], modified: Optional[str]) -> Dict[str, str]:
+        """条件请求头"""
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if modified:
+            headers["If-Modified-Since"] = modified
+        return headers
+
+    def _parse_feed_content(self, feed_url: str, final_url: str, status: int,
+                            content: bytes, headers: Dict[str, str]) -> feedparser.FeedParserDict:
+        """
+        解析已下载的 feed 内容
+
+        Args:
+            feed_url: feed URL
+            final_url: 重定向后的 URL
+            status: HTTP 状态码
+            content: 响应字节
+            headers: 响应头（用于编码检测和缓存校验信息）
+
+        Returns:
+            feed 数据
+        """
+        # feedparser 按小写键读取响应头
+        headers = {key.lower(): value for key, value in headers.items()}
+
+        # 下载的字节交给 feedparser 解析，响应头用于编码检测
+        feed = feedparser.parse(content, response_headers=headers)
+        feed["status"] = status
+        feed["href"] = final_url
+        feed["etag"] = headers.get("etag")
+        feed["modified"] = headers.get("last-modified")
+
+        # 只对非编码问题发出警告，编码问题通常不影响功能
+        if feed.bozo:
+            exc_type = type(feed.bozo_exception).__name__
+            if exc_type == "CharacterEncodingOverride":
+                logger.debug(f"Feed 编码检测 {feed_url}: {feed.bozo_exception}")
+            else:
+                logger.warning(f"Feed 解析警告 {feed_url}: {feed.bozo_exception}")
+
+        return feed
+
+    def _fetch_feed_with_retry(
+        self,
+        feed_url: str,
+        etag: Optional[str] = None,
+        modified: Optional[str] = None
+    ) -> Optional[feedparser.FeedParserDict]:
         """
         带重试机制的 feed 获取
 
         Args:
             feed_url: feed URL
+            etag: 上次响应的 ETag（发送 If-None-Match）
+            modified: 上次响应的 Last-Modified（发送 If-Modified-Since）
 
         Returns:
-            feed 数据，失败返回 None
+            feed 数据，失败返回 None；未更新时返回 status 为 304 的数据
         """
+        headers = self._conditional_headers(etag, modified)
+
         for attempt in range(self.max_retries):
             try:
-                # 设置 socket 超时（feedparser 默认没有超时机制）
-                old_timeout = socket.getdefaulttimeout()
-                socket.setdefaulttimeout(self.timeout)
-
-                # 使用 User-Agent 避免被某些网站拒绝
-                user_agent = "Mozilla/5.0 (compatible; yonglelaoren-feedland-parser/1.0.0)"
-                feed = feedparser.parse(feed_url, agent=user_agent)
-
-                # 恢复原来的超时设置
-                socket.setdefaulttimeout(old_timeout)
-
-                # 只对非编码问题发出警告，编码问题通常不影响功能
-                if feed.bozo:
-                    exc_type = type(feed.bozo_exception).__name__
-                    if exc_type == "CharacterEncodingOverride":
-                        logger.debug(f"Feed 编码检测 {feed_url}: {feed.bozo_exception}")
-                    else:
-                        logger.warning(f"Feed 解析警告 {feed_url}: {feed.bozo_exception}")
+                with self._host_slot(feed_url):
+                    response = self._session.get(feed_url, headers=headers, timeout=self._timeout)
+
+                # 304：feed 未更新
+                if response.status_code == 304:
+                    return feedparser.FeedParserDict(status=304, href=feed_url, entries=[], bozo=False)
 
-                return feed
+                response.raise_for_status()
 
-            except socket.timeout as e:
+                return self._parse_feed_content(
+                    feed_url, response.url, response.status_code,
+                    response.content, dict(response.headers)
+                )
+
+            except requests.exceptions.Timeout as e:
+                logger.warning(f"获取 feed 超时 (尝试 {attempt + 1}/{self.max_retries}) {feed_url}: {e}")
+                return None
+
+            except Exception as e:
+                logger.warning(f"获取 feed 失败 (尝试 {attempt + 1}/{self.max_retries}) {feed_url}: {e}")
+                if attempt < self.max_retries - 1:
+                    continue
+                else:
+                    return None
+
+        return None
+
+    async def _fetch_feed_async(
+        self,
+        feed_url: str,
+        http: "aiohttp.ClientSession",
+        etag: Optional[str] = None,
+        modified: Optional[str] = None,
+        executor=None
+    ) -> Optional[feedparser.FeedParserDict]:
+        """
+        带重试机制的异步 feed 获取（_fetch_feed_with_retry 的异步版本）
+
+        Args:
+            feed_url: feed URL
+            http: aiohttp 会话
+            etag: 上次响应的 ETag
+            modified: 上次响应的 Last-Modified
+            executor: 执行 feedparser 解析的线程池
+
+        Returns:
+            feed 数据，失败返回 None；未更新时返回 status 为 304 的数据
+        """
+        headers = dict(self._headers)
+        headers.update(self._conditional_headers(etag, modified))
+        timeout = aiohttp.ClientTimeout(sock_connect=self.connect_timeout, sock_read=self.timeout)
+        loop = asyncio.get_running_loop()
+
+        for attempt in range(self.max_retries):
+            try:
+                async with self._host_slot_async(feed_url), \
+                        http.get(feed_url, headers=headers, timeout=timeout) as response:
+                    if response.status == 304:
+                        return feedparser.FeedParserDict(status=304, href=feed_url, entries=[], bozo=False)
+
+                    response.raise_for_status()
+                    content = await response.read()
+                    parse = functools.partial(
+                        self._parse_feed_content, feed_url, str(response.url),
+                        response.status, content, dict(response.headers)
+                    )
+                return await loop.run_in_executor(executor, parse)
+
+            except asyncio.TimeoutError as e:
                 logger.warning(f"获取 feed 超时 (尝试 {attempt + 1}/{self.max_retries}) {feed_url}: {e}")
                 return None
 
@@ -141,7 +507,7 @@ class FeedParser:
         self,
         feed_info: FeedInfo,
         feed_data: feedparser.FeedParserDict
-    ) -> List[Dict]:
+    ) -> Tuple[List[Dict], int]:
         """
         解析文章
 
@@ -150,17 +516,12 @@ class FeedParser:
             feed_data: feed 数据
 
         Returns:
-            文章列表
+            (文章列表, 提取失败的条目数)
         """
         articles = []
         total_processed = 0  # 已处理的条目总数
 
-        # 获取该 feed 的最后处理 ID
-        last_id = None
-        if self.filter:
-            last_id = self.filter.get_last_id(feed_info.url)
-
-        for entry in feed_data.entries:
+        for job in self._iter_article_jobs(feed_info, feed_data):
             # 检查是否已经处理了足够的文章
             if len(articles) >= self.max_articles:
                 logger.debug(f"已达到最大文章数限制 ({self.max_articles})，停止处理")
@@ -168,9 +529,96 @@ class FeedParser:
 
             total_processed += 1
 
+            article = self.extract_article(feed_info, job)
+            if article:
+                articles.append(article)
+
+        return self._finish_articles(feed_info, articles, total_processed), total_processed - len(articles)
+
+    async def _parse_articles_async(
+        self,
+        feed_info: FeedInfo,
+        feed_data: feedparser.FeedParserDict,
+        http: "aiohttp.ClientSession",
+        executor=None
+    ) -> Tuple[List[Dict], int]:
+        """
+        异步解析文章（_parse_articles 的异步版本）
+
+        Args:
+            feed_info: Feed 信息
+            feed_data: feed 数据
+            http: aiohttp 会话
+            executor: 执行正文提取的线程池
+
+        Returns:
+            (文章列表, 提取失败的条目数)
+        """
+        articles = []
+        total_processed = 0
+
+        for job in self._iter_article_jobs(feed_info, feed_data):
+            if len(articles) >= self.max_articles:
+                logger.debug(f"已达到最大文章数限制 ({self.max_articles})，停止处理")
+                break
+
+            total_processed += 1
+
+            try:
+                loop = asyncio.get_running_loop()
+                article_content = await loop.run_in_executor(
+                    executor, self._feed_native_article, feed_info, job
+                )
+                if article_content is None:
+                    article_content = await self.article_extractor.extract_async(
+                        job.url,
+                        http,
+                        title=job.title,
+                        published=job.published,
+                        author=job.author,
+                        description=job.description,
+                        feed_name=feed_info.title,
+                        executor=executor,
+                        dedupe_key=job.dedupe_key
+                    )
+
+                article = self._build_article(job, article_content)
+                if article:
+                    articles.append(article)
+
+            except Exception as e:
+                logger.warning(f"解析文章时发生错误: {job.url} - {job.title}: {e}")
+                continue
+
+        return self._finish_articles(feed_info, articles, total_processed), total_processed - len(articles)
+
+    def _iter_article_jobs(
+        self,
+        feed_info: FeedInfo,
+        feed_data: feedparser.FeedParserDict
+    ) -> Iterator[ArticleJob]:
+        """
+        按顺序生成待提取的文章，遇到不晚于历史记录的文章时停止
+
+        Args:
+            feed_info: Feed 信息
+            feed_data: feed 数据
+
+        Yields:
+            待提取的文章
+        """
+        # 获取该 feed 的最后处理 ID
+        last_id = None
+        if self.filter:
+            last_id = self.filter.get_last_id(feed_info.url)
+
+        for entry in feed_data.entries:
+            article_url = entry.get("link")
+            if self.url_canonicalizer is not None and entry.get("feedburner_origlink"):
+                # FeedBurner 的 link 是跳转链接，原始链接单独记录在 feedburner:origLink 中
+                article_url = entry.get("feedburner_origlink")
             try:
                 # 获取文章 URL
-                article_url = entry.get("link")
                 if not article_url:
                     logger.debug(f"文章缺少 URL，跳过: {entry.get('title', 'Unknown')}")
                     continue
@@ -185,6 +633,10 @@ class FeedParser:
                         logger.debug(f"无法从搜狗搜索页提取真实 URL，使用搜狗链接: {entry.get('title', 'Unknown')}")
                         # 不跳过，继续使用搜狗搜索页URL，文章内容仍然有价值
 
+                dedupe_key = None
+                if self.url_canonicalizer is not None:
+                    dedupe_key = self.url_canonicalizer.canonicalize(article_url)
+
                 # 获取文章 ID 和发布时间
                 article_id, published, id_type = self.get_article_id(entry)
 
@@ -193,58 +645,95 @@ class FeedParser:
                     try:
                         if not self.filter.is_newer_than_last_id(feed_info.url, article_id):
                             logger.debug(f"文章时间 {article_id} 不晚于历史记录 {last_id}，停止处理")
-                            break
+                            return
                     except Exception as e:
                         logger.debug(f"比较时间戳失败: {e}")
 
-                # 获取文章标题
-                title = entry.get("title", "Unknown")
+                job = ArticleJob(
+                    url=article_url,
+                    title=entry.get("title", "Unknown"),
+                    published=published,
+                    author=entry.get("author") or entry.get("author_detail", {}).get("name"),
+                    description=self._get_description(entry),
+                    article_id=article_id,
+                    id_type=id_type,
+                    feed_content=self._get_full_content(entry),
+                    dedupe_key=dedupe_key,
+                )
 
-                # 获取作者
-                author = entry.get("author") or entry.get("author_detail", {}).get("name")
+            except Exception as e:
+                logger.warning(f"解析文章时发生错误: {article_url} - {entry.get('title', 'Unknown')}")
+                continue
 
-                # 获取描述内容
-                description = self._get_description(entry)
+            yield job
 
-                # 提取文章内容
-                article_content = self.article_extractor.extract(
-                    article_url,
-                    title=title,
-                    published=published,
-                    author=author,
-                    description=description,
-                    feed_name=feed_info.title
-                )
+    def _feed_native_article(self, feed_info: FeedInfo, job: ArticleJob) -> Optional[ArticleContent]:
+        """
+        feed 自带全文时直接生成文章，不发起请求
 
-                if not article_content.success or not article_content.content:
-                    logger.warning(f"文章内容提取失败: {article_url}")
-                    continue
+        Args:
+            feed_info: Feed 信息
+            job: 待提取的文章
 
-                # 清理内容：如果使用描述回退，移除 HTML 标签
-                content = article_content.content
-                if article_content.extraction_method == "description-fallback":
-                    from .article_extractor import _strip_html_tags
-                    content = _strip_html_tags(content)
-                    logger.debug(f"已清理描述中的 HTML 标签")
-
-                # 创建文章字典
-                article = {
-                    "title": article_content.title,
-                    "url": article_content.url,
-                    "published": article_content.published,
-                    "author": article_content.author,
-                    "content": content,
-                    "images": article_content.images or [],
-                    "_id": article_id,  # 内部使用，用于去重
-                    "_id_type": id_type,  # ID 类型（published/guid/link/hash）
-                }
+        Returns:
+            文章内容；不使用内嵌内容时返回 None
+        """
+        if not job.feed_content:
+            return None
 
-                articles.append(article)
+        override = self.full_text_overrides.get(feed_info.url)
+        if override is False or (override is None and not self.feed_full_text):
+            return None
 
-            except Exception as e:
-                logger.warning(f"解析文章时发生错误: {article_url} - {entry.get('title', 'Unknown')}")
-                continue
+        return self.article_extractor.extract_from_feed_content(
+            job.url,
+            job.feed_content,
+            title=job.title,
+            published=job.published,
+            author=job.author,
+            min_length=self.full_text_min_length,
+            force=override is True
+        )
+
+    def _build_article(self, job: ArticleJob, article_content: ArticleContent) -> Optional[Dict]:
+        """
+        根据提取结果创建文章字典
 
+        Args:
+            job: 待提取的文章
+            article_content: 提取结果
+
+        Returns:
+            文章字典，提取失败返回 None
+        """
+        if not article_content.success or not article_content.content:
+            logger.warning(f"文章内容提取失败: {job.url}")
+            return None
+
+        # 清理内容：如果使用描述回退，移除 HTML 标签
+        content = article_content.content
+        if article_content.extraction_method == "description-fallback":
+            from .article_extractor import _strip_html_tags
+            content = _strip_html_tags(content)
+            logger.debug(f"已清理描述中的 HTML 标签")
+
+        article = {
+            "title": article_content.title,
+            "url": article_content.url,
+            "published": article_content.published,
+            "author": article_content.author,
+            "content": content,
+            "images": article_content.images or [],
+            "_id": job.article_id,  # 内部使用，用于去重
+            "_id_type": job.id_type,  # ID 类型（published/guid/link/hash）
+        }
+        if article_content.images_future is not None:
+            # 图片在后台提取，输出前由 ArticleExtractor.resolve_deferred_images 写回
+            article["_images_future"] = article_content.images_future
+        return article
+
+    def _finish_articles(self, feed_info: FeedInfo, articles: List[Dict], total_processed: int) -> List[Dict]:
+        """按时间排序并记录日志"""
         # 按时间排序（只对已获取的文章排序）
         articles.sort(key=lambda x: x["published"] or "", reverse=True)
 
@@ -297,6 +786,26 @@ class FeedParser:
 
         return None
 
+    def _get_full_content(self, entry: feedparser.FeedParserDict) -> Optional[str]:
+        """
+        获取条目内嵌的正文（content:encoded / atom:content），有多个时取最长的
+
+        Args:
+            entry: feed 条目
+
+        Returns:
+            正文 HTML，如果没有则返回 None
+        """
+        contents = entry.get("content")
+        if not isinstance(contents, list):
+            return None
+
+        values = [
+            c.get("value") for c in contents
+            if isinstance(c, dict) and isinstance(c.get("value"), str)
+        ]
+        return max(values, key=len) if values else None
+
     def _get_description(self, entry: feedparser.FeedParserDict) -> Optional[str]:
         """
         从条目中获取描述内容
@@ -2,9 +2,10 @@
 
 import logging
 import threading
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 from datetime import datetime
 from .config import Config
+from .history_store import HistoryState, HistoryStore, JsonHistoryStore
 
 logger = logging.getLogger(__name__)
 
@@ -12,40 +13,99 @@ logger = logging.getLogger(__name__)
 class Filter:
     """文章过滤器 - 同时负责时间戳跟踪和去重"""
 
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, store: Optional[HistoryStore] = None):
         """
         初始化过滤器
 
         Args:
             config: 配置对象
+            store: 历史记录存储（默认保存在配置文件中）
         """
         self.config = config
+        self.store = store if store is not None else JsonHistoryStore(config)
         self._history: Dict[str, str] = {}  # feed_url -> timestamp
+        self._validators: Dict[str, Dict[str, str]] = {}  # feed_url -> {"etag", "modified"}
+        self._completed: Set[str] = set()  # 本次（或被中断的上次）运行中已完成的 feed_url
+        self._dirty: Set[str] = set()  # 记录有变化、尚未保存的 feed_url
+        self._unsaved_completed: Set[str] = set()  # 已完成、尚未保存到运行进度的 feed_url
+        self._progress_cleared = False  # 运行进度已清空、尚未保存
         self._lock = threading.Lock()
 
     # ===== FeedTracker 功能 =====
 
     def load_history(self) -> Dict[str, str]:
-        """从配置文件加载历史记录"""
+        """从历史记录存储加载历史记录"""
         try:
-            self._history = self.config.his.copy()
-            logger.info(f"加载历史记录，共 {len(self._history)} 个 feeds")
-            return self._history
+            state = self.store.load()
         except Exception as e:
             logger.error(f"加载历史记录失败: {e}")
-            self._history = {}
-            return {}
+            state = HistoryState()
+
+        with self._lock:
+            self._history = state.history
+            self._validators = state.validators
+            self._completed = state.completed
+            self._dirty.clear()
+            self._unsaved_completed.clear()
+            self._progress_cleared = False
+
+        logger.info(f"加载历史记录，共 {len(self._history)} 个 feeds")
+        if self._completed:
+            logger.info(f"上次运行未完成，已完成 {len(self._completed)} 个 feeds")
+        return self._history
+
+    def save_history(self, completed_only: bool = False) -> None:
+        """
+        保存有变化的历史记录和运行进度
+
+        Args:
+            completed_only: 作为运行中的检查点保存：只保存已完成 feed 的新记录，
+                其他 feed 的记录保留到下次保存（结果尚未写出，续传时需要重新处理）
+        """
+        with self._lock:
+            urls = self._dirty & self._completed if completed_only else set(self._dirty)
+            history = {url: self._history.get(url) for url in urls}
+            validators = {url: self._validators.get(url) for url in urls}
+            completed = set(self._unsaved_completed)
+            clear_run = self._progress_cleared
 
-    def save_history(self) -> None:
-        """保存历史记录到配置文件"""
         try:
-            self.config.his = self._history
-            self.config.save()
-            logger.info(f"保存历史记录，共 {len(self._history)} 个 feeds")
+            self.store.write(history, validators, completed, clear_run=clear_run)
         except Exception as e:
             logger.error(f"保存历史记录失败: {e}")
             raise
 
+        with self._lock:
+            self._dirty -= urls
+            self._unsaved_completed -= completed
+            if clear_run:
+                self._progress_cleared = False
+        logger.info(f"保存历史记录，{len(urls)} 个 feeds 有更新，共 {len(self._history)} 个 feeds")
+
+    def _mark_dirty(self, feed_url: str) -> None:
+        """记录 feed 有变化（调用方需持有锁）"""
+        self._dirty.add(feed_url)
+
+    # ===== 运行进度（检查点 / 断点续传） =====
+
+    def mark_completed(self, feed_url: str) -> None:
+        """记录本次运行中已完成的 feed"""
+        with self._lock:
+            self._completed.add(feed_url)
+            self._unsaved_completed.add(feed_url)
+
+    def completed_feeds(self) -> Set[str]:
+        """获取运行中（包括被中断的上次运行）已完成的 feeds"""
+        with self._lock:
+            return set(self._completed)
+
+    def clear_progress(self) -> None:
+        """清空运行进度（开始新的运行或运行正常完成时调用）"""
+        with self._lock:
+            self._completed.clear()
+            self._unsaved_completed.clear()
+            self._progress_cleared = True
+
     def get_last_timestamp(self, feed_url: str) -> Optional[str]:
         """获取指定 feed 的最后提取时间（兼容旧代码）"""
         return self._history.get(feed_url)
@@ -58,14 +118,38 @@ class Filter:
         """更新指定 feed 的最后提取时间（兼容旧代码）"""
         with self._lock:
             self._history[feed_url] = timestamp
+            self._mark_dirty(feed_url)
             logger.debug(f"更新 feed 时间戳: {feed_url} -> {timestamp}")
 
     def update_id(self, feed_url: str, article_id: str) -> None:
         """更新指定 feed 的最后处理 ID"""
         with self._lock:
             self._history[feed_url] = article_id
+            self._mark_dirty(feed_url)
             logger.debug(f"更新 feed ID: {feed_url} -> {article_id[:80]}...")
 
+    def get_validators(self, feed_url: str) -> Dict[str, str]:
+        """获取指定 feed 的 HTTP 缓存校验信息（ETag / Last-Modified）"""
+        return self._validators.get(feed_url, {})
+
+    def update_validators(self, feed_url: str, etag: Optional[str] = None,
+                          modified: Optional[str] = None) -> None:
+        """更新指定 feed 的 HTTP 缓存校验信息"""
+        validators = {}
+        if etag:
+            validators["etag"] = etag
+        if modified:
+            validators["modified"] = modified
+
+        with self._lock:
+            if validators != self._validators.get(feed_url, {}):
+                self._mark_dirty(feed_url)
+            if validators:
+                self._validators[feed_url] = validators
+            else:
+                self._validators.pop(feed_url, None)
+            logger.debug(f"更新 feed 校验信息: {feed_url} -> {validators}")
+
     def is_newer_than_last(self, feed_url: str, article_timestamp: str) -> bool:
         """检查文章时间戳是否比记录的时间戳更新（兼容旧代码）"""
         last_timestamp = self.get_last_timestamp(feed_url)
@@ -105,11 +189,15 @@ class Filter:
             if feed_url in self._history:
                 del self._history[feed_url]
                 logger.debug(f"移除 feed 记录: {feed_url}")
+            self._validators.pop(feed_url, None)
+            self._mark_dirty(feed_url)
 
     def clear_history(self) -> None:
         """清空所有历史记录"""
         with self._lock:
+            self._dirty.update(self._history, self._validators)
             self._history.clear()
+            self._validators.clear()
             logger.info("清空所有历史记录")
 
     # ===== Deduplicator 功能 =====
@@ -0,0 +1,277 @@
+"""历史记录存储模块
+
+保存每个 feed 的最后处理 ID、条件请求校验信息（ETag / Last-Modified）和运行进度。
+
+- SqliteHistoryStore：SQLite 数据库（WAL 模式），按 feed 增量写入，写入量只与变化的 feed 数有关，
+  写入时不阻塞其他进程读取
+- JsonHistoryStore：保存在 config.json 的 his / his_validators / his_run 中（兼容旧版本），
+  每次保存重写整个配置文件
+
+使用 SQLite 存储时，config.json 中的旧历史记录会在首次打开时自动迁移到数据库。
+默认每个配置文件使用自己的数据库（见 Config.history_db），数据库中已有其他记录时拒绝迁移，
+不会静默地忽略配置文件中的历史记录。
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional, Set
+
+from .config import Config
+
+logger = logging.getLogger(__name__)
+
+# config.json 中保存历史记录的字段
+_CONFIG_KEYS = ("his", "his_validators", "his_run")
+
+
+class HistoryMigrationError(Exception):
+    """配置文件中的历史记录无法迁移到已有记录的数据库"""
+    pass
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    feed_url TEXT PRIMARY KEY,
+    last_id TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS validators (
+    feed_url TEXT PRIMARY KEY,
+    etag TEXT,
+    modified TEXT
+);
+CREATE TABLE IF NOT EXISTS run_progress (
+    feed_url TEXT PRIMARY KEY
+);
+"""
+
+
+@dataclass
+class HistoryState:
+    """加载的历史记录"""
+    history: Dict[str, str] = field(default_factory=dict)  # feed_url -> 最后处理 ID
+    validators: Dict[str, Dict[str, str]] = field(default_factory=dict)  # feed_url -> {"etag", "modified"}
+    completed: Set[str] = field(default_factory=set)  # 被中断的运行中已完成的 feeds
+
+
+class HistoryStore:
+    """历史记录存储基类"""
+
+    def load(self) -> HistoryState:
+        """
+        加载全部历史记录
+
+        Returns:
+            历史记录
+        """
+        raise NotImplementedError
+
+    def write(
+        self,
+        history: Dict[str, Optional[str]],
+        validators: Dict[str, Optional[Dict[str, str]]],
+        completed: Iterable[str] = (),
+        clear_run: bool = False
+    ) -> None:
+        """
+        写入变化的记录
+
+        Args:
+            history: feed_url -> 最后处理 ID（None 表示删除）
+            validators: feed_url -> 校验信息（None 表示删除）
+            completed: 新完成的 feeds（追加到运行进度）
+            clear_run: 写入前清空运行进度
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """关闭存储"""
+
+
+class JsonHistoryStore(HistoryStore):
+    """保存在 config.json 中的历史记录"""
+
+    def __init__(self, config: Config):
+        """
+        初始化存储
+
+        Args:
+            config: 配置对象
+        """
+        self.config = config
+
+    def load(self) -> HistoryState:
+        state = HistoryState()
+        try:
+            state.history = dict(self.config.his)
+        except Exception as e:
+            logger.error(f"加载历史记录失败: {e}")
+
+        try:
+            state.validators = dict(self.config.his_validators or {})
+        except Exception as e:
+            logger.warning(f"加载 feed 缓存校验信息失败: {e}")
+
+        try:
+            state.completed = set(self.config.his_run.get("completed", []))
+        except Exception as e:
+            logger.warning(f"加载运行进度失败: {e}")
+        return state
+
+    def write(self, history, validators, completed=(), clear_run=False) -> None:
+        saved_history = dict(self.config.his or {})
+        saved_validators = dict(self.config.his_validators or {})
+        _apply(saved_history, history)
+        _apply(saved_validators, validators)
+
+        run = set() if clear_run else set(self.config.his_run.get("completed", []))
+        run.update(completed)
+
+        self.config.his = saved_history
+        self.config.his_validators = saved_validators
+        self.config.his_run = {"completed": sorted(run)} if run else {}
+        self.config.save()
+
+    def __repr__(self) -> str:
+        return f"JsonHistoryStore(path={self.config.config_path})"
+
+
+class SqliteHistoryStore(HistoryStore):
+    """SQLite 历史记录存储（线程安全）"""
+
+    def __init__(self, path: str):
+        """
+        打开（或创建）数据库
+
+        Args:
+            path: 数据库文件路径
+        """
+        self.path = os.path.expanduser(path)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def load(self) -> HistoryState:
+        state = HistoryState()
+        with self._lock:
+            state.history = dict(self._conn.execute("SELECT feed_url, last_id FROM history"))
+            for url, etag, modified in self._conn.execute("SELECT feed_url, etag, modified FROM validators"):
+                state.validators[url] = {k: v for k, v in (("etag", etag), ("modified", modified)) if v}
+            state.completed = {url for (url,) in self._conn.execute("SELECT feed_url FROM run_progress")}
+        return state
+
+    def write(self, history, validators, completed=(), clear_run=False) -> None:
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM history WHERE feed_url = ?",
+                [(url,) for url, value in history.items() if value is None]
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO history (feed_url, last_id, updated_at) VALUES (?, ?, ?)",
+                [(url, value, now) for url, value in history.items() if value is not None]
+            )
+            self._conn.executemany(
+                "DELETE FROM validators WHERE feed_url = ?",
+                [(url,) for url, value in validators.items() if not value]
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO validators (feed_url, etag, modified) VALUES (?, ?, ?)",
+                [(url, value.get("etag"), value.get("modified")) for url, value in validators.items() if value]
+            )
+            if clear_run:
+                self._conn.execute("DELETE FROM run_progress")
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO run_progress (feed_url) VALUES (?)",
+                [(url,) for url in completed]
+            )
+
+    def is_empty(self) -> bool:
+        """数据库中是否没有任何记录"""
+        with self._lock:
+            return not any(
+                self._conn.execute(f"SELECT 1 FROM {table} LIMIT 1").fetchone()
+                for table in ("history", "validators", "run_progress")
+            )
+
+    def migrate_from(self, config: Config) -> bool:
+        """
+        把 config.json 中的历史记录迁移到数据库，并从配置文件中删除
+
+        数据库已有记录时（例如多个配置文件指定了同一个 history_db）不迁移，配置文件保持不变，
+        并抛出 HistoryMigrationError：跳过迁移会让配置文件中的历史记录失效，所有文章被重新处理。
+
+        Args:
+            config: 配置对象
+
+        Returns:
+            是否进行了迁移
+
+        Raises:
+            HistoryMigrationError: 数据库已有记录
+        """
+        if not any(key in config for key in _CONFIG_KEYS):
+            return False
+        if not self.is_empty():
+            raise HistoryMigrationError(
+                f"历史数据库 {self.path} 已有记录，无法迁移 {config.config_path} 中的历史记录。"
+                f"请为该配置指定单独的 history_db，或设置 history_backend 为 json"
+            )
+
+        state = JsonHistoryStore(config).load()
+        self.write(state.history, state.validators, state.completed)
+        config.remove(*_CONFIG_KEYS)
+        config.save()
+        logger.info(f"已把 {len(state.history)} 个 feeds 的历史记录从 config.json 迁移到 {self.path}")
+        return True
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __repr__(self) -> str:
+        return f"SqliteHistoryStore(path={self.path})"
+
+
+def _apply(target: Dict, changes: Dict) -> None:
+    """把变化写入字典（值为 None 或空时删除）"""
+    for key, value in changes.items():
+        if value:
+            target[key] = value
+        else:
+            target.pop(key, None)
+
+
+def open_history_store(config: Config) -> HistoryStore:
+    """
+    根据配置打开历史记录存储
+
+    Args:
+        config: 配置对象
+
+    Returns:
+        history_backend 为 json 时返回 JsonHistoryStore，否则返回 SqliteHistoryStore（自动迁移旧记录）
+
+    Raises:
+        HistoryMigrationError: 配置文件中有旧历史记录，但数据库已有其他记录
+    """
+    if config.history_backend == "json":
+        return JsonHistoryStore(config)
+
+    store = SqliteHistoryStore(config.history_db)
+    try:
+        store.migrate_from(config)
+    except HistoryMigrationError:
+        store.close()
+        raise
+    return store
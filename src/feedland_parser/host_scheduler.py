@@ -0,0 +1,159 @@
+"""主机调度模块 - 按主机限制并发请求数和请求间隔"""
+
+import asyncio
+import logging
+import threading
+import time
+from contextlib import contextmanager, asynccontextmanager
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# 异步模式下等待名额释放时的轮询间隔（秒）
+_ASYNC_POLL_INTERVAL = 0.05
+
+
+class HostScheduler:
+    """主机调度器（线程安全，同时支持线程和 asyncio）
+
+    同一主机同时进行的请求数不超过 max_in_flight，
+    相邻两次请求的开始时间至少间隔 min_interval 秒。
+    """
+
+    def __init__(self, max_in_flight: int = 2, min_interval: float = 0.0):
+        """
+        初始化主机调度器
+
+        Args:
+            max_in_flight: 每个主机的最大并发请求数
+            min_interval: 同一主机相邻请求的最小间隔（秒）
+        """
+        self.max_in_flight = max(1, int(max_in_flight))
+        self.min_interval = max(0.0, float(min_interval))
+        self._lock = threading.Lock()
+        self._released = threading.Condition(self._lock)
+        self._in_flight: Dict[str, int] = {}  # host -> 进行中的请求数
+        self._next_start: Dict[str, float] = {}  # host -> 下一次允许开始的时间
+
+    @staticmethod
+    def get_host(url: str) -> str:
+        """
+        从 URL 提取主机名
+
+        Args:
+            url: URL 字符串
+
+        Returns:
+            小写主机名，无法解析时返回空字符串
+        """
+        try:
+            return (urlparse(url).hostname or "").lower()
+        except Exception:
+            return ""
+
+    def _try_acquire(self, host: str) -> Optional[float]:
+        """
+        尝试占用一个名额（调用方需持有锁）
+
+        Returns:
+            0 表示占用成功；正数表示需要等待的秒数；None 表示需要等待其他请求结束
+        """
+        if self._in_flight.get(host, 0) >= self.max_in_flight:
+            return None
+
+        now = time.monotonic()
+        wait = self._next_start.get(host, 0.0) - now
+        if wait > 0:
+            return wait
+
+        self._in_flight[host] = self._in_flight.get(host, 0) + 1
+        self._next_start[host] = now + self.min_interval
+        return 0.0
+
+    def acquire(self, url: str) -> str:
+        """
+        阻塞直到可以向该主机发起请求
+
+        Args:
+            url: 请求 URL
+
+        Returns:
+            占用名额的主机名（传给 release）
+        """
+        host = self.get_host(url)
+        if not host:
+            return host
+
+        with self._released:
+            while True:
+                wait = self._try_acquire(host)
+                if wait == 0:
+                    return host
+                self._released.wait(wait)
+
+    async def acquire_async(self, url: str) -> str:
+        """
+        acquire 的异步版本（等待时不阻塞事件循环）
+
+        Args:
+            url: 请求 URL
+
+        Returns:
+            占用名额的主机名（传给 release）
+        """
+        host = self.get_host(url)
+        if not host:
+            return host
+
+        while True:
+            with self._lock:
+                wait = self._try_acquire(host)
+            if wait == 0:
+                return host
+            await asyncio.sleep(wait if wait is not None else _ASYNC_POLL_INTERVAL)
+
+    def release(self, host: str) -> None:
+        """
+        释放主机名额
+
+        Args:
+            host: acquire 返回的主机名
+        """
+        if not host:
+            return
+
+        with self._released:
+            count = self._in_flight.get(host, 0) - 1
+            if count > 0:
+                self._in_flight[host] = count
+            else:
+                self._in_flight.pop(host, None)
+            self._released.notify_all()
+
+    @contextmanager
+    def slot(self, url: str):
+        """占用主机名额的上下文管理器"""
+        host = self.acquire(url)
+        try:
+            yield
+        finally:
+            self.release(host)
+
+    @asynccontextmanager
+    async def slot_async(self, url: str):
+        """占用主机名额的异步上下文管理器"""
+        host = await self.acquire_async(url)
+        try:
+            yield
+        finally:
+            self.release(host)
+
+    def in_flight(self, url_or_host: str) -> int:
+        """获取主机当前进行中的请求数"""
+        host = self.get_host(url_or_host) if "://" in url_or_host else url_or_host.lower()
+        with self._lock:
+            return self._in_flight.get(host, 0)
+
+    def __repr__(self) -> str:
+        return f"HostScheduler(max_in_flight={self.max_in_flight}, min_interval={self.min_interval})"
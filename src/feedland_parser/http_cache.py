@@ -0,0 +1,369 @@
+"""HTTP 响应磁盘缓存模块
+
+缓存文章页面的响应，重复运行时直接复用或用校验信息（ETag / Last-Modified）重新验证。
+
+目录结构：
+    <cache_dir>/index.json          URL -> 元数据（校验信息、下载时间、过期时间、大小）
+    <cache_dir>/bodies/ab/abcd...   响应内容，按 SHA-256 存储，相同内容只保存一份
+
+遵循 Cache-Control（no-store / no-cache / max-age）和 Expires，
+缓存总大小超过上限时按最近最少使用（LRU）淘汰。
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field, asdict
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+from .atomic_file import atomic_write, atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+# 累计写入多少次后自动保存索引（中途崩溃时最多丢失这么多条索引）
+_AUTOSAVE_EVERY = 20
+
+_MAX_AGE_RE = re.compile(r"max-age\s*=\s*(\d+)")
+
+
+@dataclass
+class CacheEntry:
+    """缓存条目（索引中保存的元数据）"""
+    url: str
+    key: str  # 响应内容的 SHA-256
+    size: int
+    status_code: int = 200
+    headers: Dict[str, str] = field(default_factory=dict)
+    encoding: Optional[str] = None
+    etag: Optional[str] = None
+    modified: Optional[str] = None
+    fetched_at: float = 0.0
+    expires_at: float = 0.0
+    last_used: float = 0.0
+
+    @property
+    def fresh(self) -> bool:
+        """是否仍在有效期内（有效期内无需请求）"""
+        return time.time() < self.expires_at
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """重新验证时使用的条件请求头"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.modified:
+            headers["If-Modified-Since"] = self.modified
+        return headers
+
+
+@dataclass
+class CachedResponse:
+    """从缓存读取的响应"""
+    entry: CacheEntry
+    content: bytes
+
+    @property
+    def fresh(self) -> bool:
+        return self.entry.fresh
+
+
+def _header(headers: Dict[str, str], name: str) -> Optional[str]:
+    """大小写无关地读取响应头"""
+    name = name.lower()
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+def freshness_lifetime(headers: Dict[str, str], default_ttl: float = 0.0) -> Optional[float]:
+    """
+    根据响应头计算缓存有效期
+
+    Args:
+        headers: 响应头
+        default_ttl: 响应头未声明有效期时使用的秒数
+
+    Returns:
+        有效期秒数（0 表示每次都要重新验证）；不允许缓存时返回 None
+    """
+    cache_control = (_header(headers, "Cache-Control") or "").lower()
+    if "no-store" in cache_control:
+        return None
+    if "no-cache" in cache_control:
+        return 0.0
+
+    match = _MAX_AGE_RE.search(cache_control)
+    if match:
+        return float(match.group(1))
+
+    expires = _header(headers, "Expires")
+    if expires:
+        try:
+            return max(0.0, parsedate_to_datetime(expires).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return 0.0  # 无法解析的 Expires 视为已过期
+
+    return max(0.0, default_ttl)
+
+
+class HttpCache:
+    """HTTP 响应磁盘缓存（线程安全）"""
+
+    def __init__(self, cache_dir: str, max_size: int = 200 * 1024 * 1024, default_ttl: float = 0.0):
+        """
+        初始化缓存
+
+        Args:
+            cache_dir: 缓存目录
+            max_size: 缓存内容总大小上限（字节）
+            default_ttl: 响应头未声明有效期时的默认有效期（秒，0 表示只用于重新验证）
+        """
+        self.cache_dir = os.path.expanduser(cache_dir)
+        self.max_size = max(0, int(max_size))
+        self.default_ttl = max(0.0, float(default_ttl))
+        self._index_file = os.path.join(self.cache_dir, "index.json")
+        self._body_dir = os.path.join(self.cache_dir, "bodies")
+        self._entries: Dict[str, CacheEntry] = {}  # url -> 条目
+        self._refs: Dict[str, int] = {}  # 内容 key -> 引用它的条目数
+        self._sizes: Dict[str, int] = {}  # 内容 key -> 大小
+        self._total_size = 0
+        self._pending = 0  # 未保存到索引的写入次数
+        self._lock = threading.Lock()
+        self._load_index()
+
+    # -------------------------------------------------------------------------
+    # 读写
+    # -------------------------------------------------------------------------
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """
+        读取缓存的响应
+
+        Args:
+            url: 请求 URL
+
+        Returns:
+            缓存的响应（可能已过期，需要调用方重新验证），不存在时返回 None
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                return None
+            entry.last_used = time.time()
+
+        try:
+            with open(self._body_path(entry.key), "rb") as f:
+                content = f.read()
+        except OSError:
+            # 内容文件丢失，删除索引条目
+            with self._lock:
+                if self._entries.get(url) is entry:
+                    self._remove_entry(url)
+            return None
+
+        return CachedResponse(entry=entry, content=content)
+
+    def put(self, url: str, status_code: int, headers: Dict[str, str], content: bytes,
+            encoding: Optional[str] = None) -> bool:
+        """
+        保存响应
+
+        只缓存 200 响应；不允许缓存、或既没有有效期也没有校验信息（无法复用）时不保存。
+
+        Args:
+            url: 请求 URL
+            status_code: 状态码
+            headers: 响应头
+            content: 响应内容
+            encoding: 响应文本编码
+
+        Returns:
+            是否已保存
+        """
+        if status_code != 200 or not content:
+            return False
+
+        lifetime = freshness_lifetime(headers, self.default_ttl)
+        if lifetime is None:
+            return False
+
+        etag = _header(headers, "ETag")
+        modified = _header(headers, "Last-Modified")
+        if lifetime <= 0 and not etag and not modified:
+            return False
+
+        if len(content) > self.max_size:
+            return False
+
+        key = hashlib.sha256(content).hexdigest()
+        try:
+            self._write_body(key, content)
+        except OSError as e:
+            logger.warning(f"写入 HTTP 缓存失败: {url} - {e}")
+            return False
+
+        now = time.time()
+        entry = CacheEntry(
+            url=url,
+            key=key,
+            size=len(content),
+            status_code=status_code,
+            headers=dict(headers),
+            encoding=encoding,
+            etag=etag,
+            modified=modified,
+            fetched_at=now,
+            expires_at=now + lifetime,
+            last_used=now,
+        )
+
+        with self._lock:
+            # 先引用新内容再释放旧条目：内容未变时两者是同一个文件，顺序颠倒会把它删掉
+            old = self._entries.get(url)
+            self._add_entry(entry)
+            if old is not None:
+                self._release(old)
+            self._evict()
+            self._pending += 1
+            autosave = self._pending >= _AUTOSAVE_EVERY
+
+        if autosave:
+            self.save()
+        return True
+
+    def refresh(self, url: str, headers: Dict[str, str]) -> None:
+        """
+        重新验证成功（304）后更新有效期和校验信息
+
+        Args:
+            url: 请求 URL
+            headers: 304 响应的响应头
+        """
+        lifetime = freshness_lifetime(headers, self.default_ttl)
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                return
+            if lifetime is None:
+                self._remove_entry(url)
+                return
+
+            now = time.time()
+            entry.fetched_at = now
+            entry.expires_at = now + lifetime
+            entry.last_used = now
+            entry.etag = _header(headers, "ETag") or entry.etag
+            entry.modified = _header(headers, "Last-Modified") or entry.modified
+            self._pending += 1
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def total_size(self) -> int:
+        """缓存内容总大小（字节，相同内容只计一次）"""
+        with self._lock:
+            return self._total_size
+
+    # -------------------------------------------------------------------------
+    # 索引维护（调用方需持有锁）
+    # -------------------------------------------------------------------------
+
+    def _add_entry(self, entry: CacheEntry) -> None:
+        self._entries[entry.url] = entry
+        refs = self._refs.get(entry.key, 0)
+        if refs == 0:
+            self._sizes[entry.key] = entry.size
+            self._total_size += entry.size
+        self._refs[entry.key] = refs + 1
+
+    def _remove_entry(self, url: str) -> None:
+        self._release(self._entries.pop(url))
+
+    def _release(self, entry: CacheEntry) -> None:
+        """释放条目对内容的引用，没有条目引用时删除内容文件"""
+        refs = self._refs.get(entry.key, 1) - 1
+        if refs > 0:
+            self._refs[entry.key] = refs
+            return
+
+        # 没有条目引用该内容，删除内容文件
+        self._refs.pop(entry.key, None)
+        self._total_size -= self._sizes.pop(entry.key, 0)
+        try:
+            os.unlink(self._body_path(entry.key))
+        except OSError:
+            pass
+
+    def _evict(self) -> None:
+        """按最近最少使用淘汰，直到总大小不超过上限"""
+        if self._total_size <= self.max_size:
+            return
+
+        evicted = 0
+        for entry in sorted(self._entries.values(), key=lambda e: e.last_used):
+            if self._total_size <= self.max_size:
+                break
+            self._remove_entry(entry.url)
+            evicted += 1
+        logger.debug(f"HTTP 缓存淘汰 {evicted} 个条目，当前大小 {self._total_size} 字节")
+
+    # -------------------------------------------------------------------------
+    # 磁盘读写
+    # -------------------------------------------------------------------------
+
+    def _body_path(self, key: str) -> str:
+        return os.path.join(self._body_dir, key[:2], key)
+
+    def _write_body(self, key: str, content: bytes) -> None:
+        """写入内容文件（已存在时跳过）"""
+        path = self._body_path(key)
+        if os.path.exists(path):
+            return
+        atomic_write(path, content, prefix=".body-")
+
+    def _load_index(self) -> None:
+        """从磁盘加载索引"""
+        if not os.path.isfile(self._index_file):
+            return
+        try:
+            with open(self._index_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            for item in data.values():
+                self._add_entry(CacheEntry(**item))
+            logger.info(f"加载 HTTP 缓存索引，共 {len(self._entries)} 个条目")
+        except Exception as e:
+            logger.warning(f"加载 HTTP 缓存索引失败: {e}")
+            self._entries, self._refs, self._sizes, self._total_size = {}, {}, {}, 0
+
+        with self._lock:
+            self._evict()
+
+    def save(self) -> None:
+        """把索引保存到磁盘（原子写入）"""
+        with self._lock:
+            data = {url: asdict(entry) for url, entry in self._entries.items()}
+            self._pending = 0
+
+        try:
+            atomic_write_json(self._index_file, data, prefix=".index-")
+            logger.debug(f"保存 HTTP 缓存索引: {len(data)} 个条目")
+        except Exception as e:
+            logger.warning(f"保存 HTTP 缓存索引失败: {e}")
+
+    def close(self) -> None:
+        """保存索引"""
+        with self._lock:
+            pending = self._pending
+        if pending:
+            self.save()
+
+    def __repr__(self) -> str:
+        return f"HttpCache(dir={self.cache_dir}, entries={len(self)}, size={self.total_size}/{self.max_size})"
@@ -0,0 +1,207 @@
+"""按域名的自适应超时模块
+
+记录每个域名的页面下载耗时，用 EWMA（平滑均值和平均偏差，与 TCP 重传超时的算法相同）
+和最近样本的 95 分位数估计该域名的正常耗时，为每次请求计算超时：
+
+    超时 = clamp(max(p95 * 1.5, 均值 + 4 * 偏差), min_timeout, max_timeout)
+
+响应快的域名不再在卡住时白等 10 秒，响应慢但正常的域名也不会被固定的超时切断。
+超时的请求按本次使用的超时记一个样本，下一次的超时随之增大（不超过上限）。
+统计可以保存到磁盘，长时间没有访问的域名在加载时丢弃。
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+from .atomic_file import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+# EWMA 系数（RFC 6298）
+_ALPHA = 1 / 8
+_BETA = 1 / 4
+# 95 分位数的放大系数
+_P95_FACTOR = 1.5
+# 超过该时间（秒）没有访问的域名在加载时丢弃
+_STALE_AFTER = 30 * 24 * 3600
+
+
+@dataclass
+class _DomainLatency:
+    """单个域名的耗时统计"""
+    mean: float  # 平滑耗时（秒）
+    deviation: float  # 平滑平均偏差（秒）
+    samples: Deque[float] = field(default_factory=deque)  # 最近的耗时样本
+    count: int = 0  # 样本总数
+    updated_at: float = 0.0  # 最后记录时间（时间戳）
+    timeout: float = 0.0  # 当前推导出的读取超时
+
+
+class LatencyTracker:
+    """按域名统计下载耗时并推导超时（线程安全）"""
+
+    def __init__(self, state_file: Optional[str] = None, min_timeout: float = 2.0, max_timeout: float = 30.0,
+                 min_samples: int = 3, window: int = 50):
+        """
+        初始化耗时统计
+
+        Args:
+            state_file: 统计持久化文件路径（None 表示只在本次运行内统计）
+            min_timeout: 推导出的读取超时下限（秒）
+            max_timeout: 推导出的读取超时上限（秒）
+            min_samples: 样本数达到该值后才使用推导出的超时
+            window: 计算分位数使用的最近样本数
+        """
+        self.state_file = os.path.expanduser(state_file) if state_file else None
+        self.min_timeout = max(0.1, float(min_timeout))
+        self.max_timeout = max(self.min_timeout, float(max_timeout))
+        self.min_samples = max(1, int(min_samples))
+        self.window = max(1, int(window))
+        self._stats: Dict[str, _DomainLatency] = {}
+        self._dirty = False  # 是否有未保存的记录
+        self._lock = threading.Lock()
+        self._load()
+
+    @staticmethod
+    def get_domain(url: str) -> str:
+        """从 URL 提取域名（移除 www. 前缀）"""
+        host = (urlparse(url).hostname or "").lower()
+        return host[4:] if host.startswith("www.") else host
+
+    def record(self, url: str, elapsed: float) -> None:
+        """
+        记录一次完成的请求
+
+        Args:
+            url: 请求 URL
+            elapsed: 请求耗时（秒）
+        """
+        domain = self.get_domain(url)
+        if not domain:
+            return
+        with self._lock:
+            stats = self._stats.get(domain)
+            if stats is None:
+                # 第一个样本：偏差取耗时的一半（RFC 6298）
+                stats = self._stats[domain] = _DomainLatency(
+                    mean=elapsed, deviation=elapsed / 2, samples=deque(maxlen=self.window)
+                )
+            else:
+                stats.deviation += _BETA * (abs(stats.mean - elapsed) - stats.deviation)
+                stats.mean += _ALPHA * (elapsed - stats.mean)
+            stats.samples.append(elapsed)
+            stats.count += 1
+            stats.updated_at = time.time()
+            stats.timeout = self._derive(stats)
+            self._dirty = True
+
+    def record_timeout(self, url: str, timeout: float) -> None:
+        """
+        记录一次超时的请求（按本次使用的超时记样本，使下一次的超时增大）
+
+        Args:
+            url: 请求 URL
+            timeout: 本次使用的读取超时（秒）
+        """
+        self.record(url, timeout)
+
+    def _derive(self, stats: _DomainLatency) -> float:
+        """根据统计推导读取超时"""
+        ordered = sorted(stats.samples)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        estimate = max(p95 * _P95_FACTOR, stats.mean + 4 * stats.deviation)
+        return min(self.max_timeout, max(self.min_timeout, estimate))
+
+    def timeout_for(self, url: str, default: Tuple[float, float]) -> Tuple[float, float]:
+        """
+        本次请求使用的超时
+
+        Args:
+            url: 请求 URL
+            default: 样本不足时使用的 (连接超时, 读取超时)
+
+        Returns:
+            (连接超时, 读取超时)，连接超时不超过读取超时
+        """
+        with self._lock:
+            stats = self._stats.get(self.get_domain(url))
+            if stats is None or len(stats.samples) < self.min_samples:
+                return default
+            read = stats.timeout
+        return min(default[0], read), read
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._stats)
+
+    # -------------------------------------------------------------------------
+    # 持久化
+    # -------------------------------------------------------------------------
+
+    def _load(self) -> None:
+        """从磁盘加载统计（丢弃长时间没有访问的域名）"""
+        if not self.state_file or not os.path.isfile(self.state_file):
+            return
+        try:
+            with open(self.state_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.warning(f"加载域名耗时统计失败: {e}")
+            return
+
+        if not isinstance(data, dict):
+            return
+        now = time.time()
+        for domain, entry in data.items():
+            try:
+                if now - float(entry["updated_at"]) > _STALE_AFTER:
+                    continue
+                stats = _DomainLatency(
+                    mean=float(entry["mean"]),
+                    deviation=float(entry["deviation"]),
+                    samples=deque((float(s) for s in entry["samples"]), maxlen=self.window),
+                    count=int(entry.get("count", 0)),
+                    updated_at=float(entry["updated_at"]),
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+            if stats.samples:
+                stats.timeout = self._derive(stats)
+                self._stats[domain] = stats
+        logger.info(f"加载域名耗时统计，共 {len(self._stats)} 个域名")
+
+    def save(self) -> None:
+        """把统计保存到磁盘（原子写入，没有新记录时跳过）"""
+        if not self.state_file:
+            return
+
+        with self._lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            data = {
+                domain: {
+                    "mean": round(s.mean, 4),
+                    "deviation": round(s.deviation, 4),
+                    "samples": [round(x, 3) for x in s.samples],
+                    "count": s.count,
+                    "updated_at": round(s.updated_at, 1),
+                }
+                for domain, s in self._stats.items()
+            }
+
+        try:
+            atomic_write_json(self.state_file, data, prefix=".latency-")
+            logger.debug(f"保存域名耗时统计: {self.state_file}")
+        except Exception as e:
+            logger.warning(f"保存域名耗时统计失败: {e}")
+
+    def __repr__(self) -> str:
+        return f"LatencyTracker(domains={len(self)}, state_file={self.state_file})"
@@ -0,0 +1,135 @@
+"""输出模块
+
+把 Feed 结果整理为输出记录，并支持以 JSON Lines 格式边处理边写入：
+每个 feed 完成后立即追加到临时文件（<结果文件>.part），全部完成后原子地重命名为结果文件。
+中途崩溃时已完成的结果仍保留在 .part 文件中，可以直接使用。
+"""
+
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, List, Optional
+
+from .feed_parser import FeedResult
+
+logger = logging.getLogger(__name__)
+
+# 每条记录包含的内容
+RECORD_ARTICLE = "article"  # 每篇文章一行（附带 feed 信息）
+RECORD_FEED = "feed"  # 每个 feed 一行（与 JSON 输出中的元素相同）
+
+
+def clean_articles(articles: List[Dict]) -> List[Dict]:
+    """移除文章中的内部字段（以 _ 开头）"""
+    return [{k: v for k, v in article.items() if not k.startswith("_")} for article in articles]
+
+
+def feed_record(result: FeedResult) -> Optional[Dict[str, Any]]:
+    """
+    把 Feed 结果整理为输出记录
+
+    Args:
+        result: Feed 结果
+
+    Returns:
+        输出记录，失败或没有文章时返回 None
+    """
+    if not result.success or not result.articles:
+        return None
+    return {
+        "feed_url": result.feed_info.url,
+        "feed_title": result.feed_info.title,
+        "feed_type": result.feed_info.feed_type,
+        "articles": clean_articles(result.articles),
+    }
+
+
+class JsonlWriter:
+    """JSON Lines 结果写入器（线程安全）"""
+
+    def __init__(self, path: str, record: str = RECORD_ARTICLE, append: bool = False):
+        """
+        初始化写入器并创建临时文件
+
+        Args:
+            path: 结果文件路径
+            record: 每行记录的内容（article 或 feed）
+            append: 继续写入上次中断时留下的临时文件（断点续传）
+        """
+        if record not in (RECORD_ARTICLE, RECORD_FEED):
+            raise ValueError(f"不支持的记录类型: {record}")
+        self.path = os.path.expanduser(path)
+        self.part_path = self.path + ".part"
+        self.record = record
+        self.records = 0  # 已写入的行数
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        if append and os.path.isfile(self.part_path):
+            self._trim_partial_line()
+            self._file = open(self.part_path, "a", encoding="utf-8")
+            logger.info(f"继续写入上次未完成的结果: {self.part_path}")
+        else:
+            self._file = open(self.part_path, "w", encoding="utf-8")
+
+    def _trim_partial_line(self) -> None:
+        """删除临时文件末尾写到一半的行（上次运行在写入过程中被终止）"""
+        with open(self.part_path, "rb+") as f:
+            data = f.read()
+            end = data.rfind(b"\n") + 1
+            if end < len(data):
+                f.truncate(end)
+                logger.warning(f"删除未写完的记录: {len(data) - end} 字节")
+
+    def write_result(self, result: FeedResult) -> None:
+        """
+        写入一个 feed 的结果并刷新到磁盘
+
+        Args:
+            result: Feed 结果
+        """
+        record = feed_record(result)
+        if record is None:
+            return
+
+        if self.record == RECORD_FEED:
+            lines = [record]
+        else:
+            feed_fields = {k: v for k, v in record.items() if k != "articles"}
+            lines = [{**feed_fields, **article} for article in record["articles"]]
+
+        data = "".join(json.dumps(line, ensure_ascii=False) + "\n" for line in lines)
+        with self._lock:
+            self._file.write(data)
+            self._file.flush()
+            self.records += len(lines)
+
+    def close(self) -> None:
+        """完成写入：同步到磁盘后把临时文件原子地重命名为结果文件"""
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            os.replace(self.part_path, self.path)
+        logger.debug(f"结果写入完成: {self.path}（{self.records} 行）")
+
+    def abort(self) -> None:
+        """放弃完成：关闭临时文件但保留已写入的部分结果"""
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+        logger.warning(f"结果未完成，部分结果保留在: {self.part_path}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
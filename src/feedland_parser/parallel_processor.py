@@ -1,8 +1,10 @@
 """并行处理模块"""
 
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Dict, Callable, Any
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import replace
+from typing import List, Dict, Callable, Any, Optional, Tuple
 from .feed_parser import FeedParser, FeedResult
 from .filter import Filter
 from .opml_parser import FeedInfo
@@ -18,7 +20,9 @@ class ParallelFeedProcessor:
         self,
         feed_parser: FeedParser,
         filter: Filter,
-        max_workers: int = 10
+        max_workers: int = 10,
+        max_pending: Optional[int] = None,
+        checkpoint_interval: float = 0
     ):
         """
         初始化并行处理器
@@ -27,23 +31,33 @@ class ParallelFeedProcessor:
             feed_parser: Feed 解析器
             filter: 文章过滤器
             max_workers: 最大工作线程数
+            max_pending: 同时提交（含正在处理）的 feed 数上限，默认为线程数的 2 倍
+            checkpoint_interval: 运行中保存历史记录检查点的最小间隔（秒，0 表示只在全部完成后保存）。
+                只有设置了 result_sink 时才保存检查点，没有 sink 时结果在全部完成前没有写出
         """
         self.feed_parser = feed_parser
         self.filter = filter
         self.max_workers = max_workers
+        self.max_pending = max(1, max_pending) if max_pending else max(1, max_workers * 2)
+        self.checkpoint_interval = max(0.0, checkpoint_interval or 0)
+        self._last_checkpoint = time.monotonic()
         self._lock = Lock()  # 用于线程安全地更新 filter
 
     def process_feeds_parallel(
         self,
         feed_infos: List[FeedInfo],
-        progress_callback: Callable[[int, int, FeedResult], None] = None
+        progress_callback: Callable[[int, int, FeedResult], None] = None,
+        result_sink: Optional[Callable[[FeedResult], None]] = None
     ) -> List[FeedResult]:
         """
         并行处理多个 feeds
 
+        任务按窗口提交：同时提交的 feed 不超过 max_pending 个，处理完一个再提交下一个。
+
         Args:
             feed_infos: Feed 信息列表
             progress_callback: 进度回调函数 (current, total, result)
+            result_sink: 结果处理函数，每个 feed 完成时调用；设置后返回的结果不再保留文章内容
 
         Returns:
             Feed 结果列表
@@ -51,23 +65,30 @@ class ParallelFeedProcessor:
         results = []
         total = len(feed_infos)
         completed = 0
+        feed_iter = iter(feed_infos)
 
-        logger.info(f"开始并行处理 {total} 个 feeds，使用 {self.max_workers} 个线程")
+        logger.info(f"开始并行处理 {total} 个 feeds，使用 {self.max_workers} 个线程，最多同时提交 {self.max_pending} 个")
 
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # 提交所有任务
-            future_to_feed = {
-                executor.submit(self._process_single_feed, feed_info): feed_info
-                for feed_info in feed_infos
-            }
-
-            # 收集结果
-            for future in as_completed(future_to_feed):
-                feed_info = future_to_feed[future]
-                try:
-                    result = future.result()
-                    results.append(result)
-
+            future_to_feed = {}
+
+            def submit_next() -> None:
+                feed_info = next(feed_iter, None)
+                if feed_info is not None:
+                    future_to_feed[executor.submit(self._process_single_feed, feed_info)] = feed_info
+
+            for _ in range(self.max_pending):
+                submit_next()
+
+            # 收集结果，每完成一个提交一个
+            while future_to_feed:
+                done, _ = wait(future_to_feed, return_when=FIRST_COMPLETED)
+                for future in done:
+                    feed_info = future_to_feed.pop(future)
+                    result = self._future_result(feed_info, future)
+                    kept, persisted = self._deliver(result, result_sink)
+                    results.append(kept)
+                    self._checkpoint(result, persisted)
                     completed += 1
 
                     # 调用进度回调
@@ -75,17 +96,7 @@ class ParallelFeedProcessor:
                         progress_callback(completed, total, result)
 
                     logger.info(f"进度: {completed}/{total} - {feed_info.title}")
-
-                except Exception as e:
-                    logger.error(f"处理 feed 时发生错误 {feed_info.url}: {e}")
-                    # 创建失败结果
-                    results.append(FeedResult(
-                        feed_info=feed_info,
-                        articles=[],
-                        success=False,
-                        error=str(e)
-                    ))
-                    completed += 1
+                    submit_next()
 
         # 按原始顺序排序结果
         feed_url_to_result = {r.feed_info.url: r for r in results}
@@ -97,6 +108,77 @@ class ParallelFeedProcessor:
         logger.info(f"并行处理完成: {len(results)} 个 feeds")
         return results
 
+    def _future_result(self, feed_info: FeedInfo, future) -> FeedResult:
+        """
+        取出已完成任务的结果
+
+        Args:
+            feed_info: Feed 信息
+            future: 已完成的任务
+
+        Returns:
+            Feed 结果，任务抛出异常时返回失败结果
+        """
+        try:
+            return future.result()
+        except Exception as e:
+            logger.error(f"处理 feed 时发生错误 {feed_info.url}: {e}")
+            # 创建失败结果
+            return FeedResult(
+                feed_info=feed_info,
+                articles=[],
+                success=False,
+                error=str(e)
+            )
+
+    def _deliver(
+        self, result: FeedResult, result_sink: Optional[Callable[[FeedResult], None]]
+    ) -> Tuple[FeedResult, bool]:
+        """
+        把结果交给 result_sink，返回需要保留的结果
+
+        Args:
+            result: Feed 结果
+            result_sink: 结果处理函数（None 时保留完整结果）
+
+        Returns:
+            (需要保留的结果, 结果是否已由 sink 写出)。设置了 result_sink 时保留不含文章内容的结果，否则保留原结果
+        """
+        if result_sink is None:
+            return result, False
+        persisted = True
+        try:
+            result_sink(result)
+        except Exception as e:
+            logger.error(f"结果处理失败 {result.feed_info.url}: {e}")
+            persisted = False
+        return replace(result, articles=[], article_count=result.total_articles), persisted
+
+    def _checkpoint(self, result: FeedResult, persisted: bool) -> None:
+        """
+        记录 feed 已完成，距上次检查点超过 checkpoint_interval 时保存历史记录
+
+        只有结果已由 result_sink 写出的 feed 才记录为已完成，检查点只保存这些 feed 的历史记录；
+        没有 sink 时（结果保留在内存中直到全部完成）不保存检查点，中断后历史记录保持不变。
+
+        Args:
+            result: Feed 结果（失败的 feed 不记录，续传时会重试）
+            persisted: 结果是否已由 result_sink 写出
+        """
+        if not persisted:
+            return
+        if result.success:
+            self.filter.mark_completed(result.feed_info.url)
+
+        if self.checkpoint_interval <= 0:
+            return
+        now = time.monotonic()
+        if now - self._last_checkpoint < self.checkpoint_interval:
+            return
+        self._last_checkpoint = now
+        self._save_history(finished=False)
+        logger.debug("已保存历史记录检查点")
+
     def _process_single_feed(self, feed_info: FeedInfo) -> FeedResult:
         """
         处理单个 feed
@@ -110,23 +192,7 @@ class ParallelFeedProcessor:
         try:
             # 解析 feed
             result = self.feed_parser.parse_feed(feed_info)
-
-            if result.success and result.articles:
-                # 更新 filter（使用最新文章的 ID）
-                with self._lock:
-                    # 找到第一篇文章的 ID（最新的文章）
-                    latest_id = None
-                    id_type = None
-                    for article in result.articles:
-                        if article.get("_id"):
-                            latest_id = article["_id"]
-                            id_type = article.get("_id_type", "unknown")
-                            break
-
-                    if latest_id:
-                        self.filter.update_id(feed_info.url, latest_id)
-                        logger.debug(f"更新 feed ID: {feed_info.url} -> {latest_id[:50]}... (类型: {id_type})")
-
+            self._record_result(feed_info, result)
             return result
 
         except Exception as e:
@@ -138,11 +204,49 @@ class ParallelFeedProcessor:
                 error=str(e)
             )
 
-    def _save_history(self) -> None:
-        """保存历史记录（线程安全）"""
+    def _record_result(self, feed_info: FeedInfo, result: FeedResult) -> None:
+        """
+        根据 feed 结果更新历史记录
+
+        Args:
+            feed_info: Feed 信息
+            result: Feed 结果
+        """
+        advanced = False
+        if result.success and result.articles:
+            # 更新 filter（使用最新文章的 ID）
+            with self._lock:
+                # 找到第一篇文章的 ID（最新的文章）
+                latest_id = None
+                id_type = None
+                for article in result.articles:
+                    if article.get("_id"):
+                        latest_id = article["_id"]
+                        id_type = article.get("_id_type", "unknown")
+                        break
+
+                if latest_id:
+                    advanced = True
+                    self.filter.update_id(feed_info.url, latest_id)
+                    logger.debug(f"更新 feed ID: {feed_info.url} -> {latest_id[:50]}... (类型: {id_type})")
+
+        # 保存条件请求校验信息，下次运行未更新的 feed 直接返回 304。
+        # 有条目提取失败且历史记录没有前进时不保存：否则下次返回 304，这些条目再也不会重试
+        if result.success and not result.not_modified and (advanced or not result.failed_articles):
+            self.filter.update_validators(feed_info.url, result.etag, result.modified)
+
+    def _save_history(self, finished: bool = True) -> None:
+        """
+        保存历史记录（线程安全）
+
+        Args:
+            finished: 是否全部处理完成（完成时清空运行进度，下次运行不再续传）
+        """
         with self._lock:
+            if finished:
+                self.filter.clear_progress()
             try:
-                self.filter.save_history()
+                self.filter.save_history(completed_only=not finished)
             except Exception as e:
                 logger.error(f"保存历史记录失败: {e}")
 
@@ -198,12 +302,11 @@ class ParallelFeedProcessor:
         """
         successful = self.get_successful_results(results)
         failed = self.get_failed_results(results)
-        all_articles = self.get_all_articles(results)
 
         return {
             "total_feeds": len(results),
             "successful_feeds": len(successful),
             "failed_feeds": len(failed),
-            "total_articles": len(all_articles),
+            "total_articles": sum(r.total_articles for r in successful),
             "failed_feeds_list": [r.feed_info.url for r in failed],
         }
\ No newline at end of file
@@ -0,0 +1,207 @@
+"""流水线处理模块
+
+把处理过程分成两级：feed 线程池负责获取和解析 feed，生成待提取的文章；
+文章线程池负责下载和提取正文。两个线程池的大小独立配置，
+一个 feed 中的多篇慢文章不会再长时间占用 feed 线程，其他 feed 也不必排队等待。
+
+所有调度都在调用线程中完成（不在线程池回调里提交任务），不存在线程池互相等待导致的死锁。
+"""
+
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, List, Optional
+from .feed_parser import ArticleJob, FeedParser, FeedResult
+from .filter import Filter
+from .opml_parser import FeedInfo
+from .parallel_processor import ParallelFeedProcessor
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(eq=False)
+class _FeedAssembly:
+    """单个 feed 的文章提取进度"""
+    result: FeedResult
+    jobs: List[ArticleJob]
+    next_index: int = 0  # 下一篇待提交的文章
+    in_flight: int = 0  # 正在提取的文章数
+    extracted: Dict[int, Optional[Dict]] = field(default_factory=dict)  # 文章下标 -> 文章（失败为 None）
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for article in self.extracted.values() if article)
+
+    def wanted(self, max_articles: int) -> int:
+        """还需要提交的文章数（保证成功数不超过 max_articles，与串行处理结果一致）"""
+        remaining = len(self.jobs) - self.next_index
+        return max(0, min(remaining, max_articles - self.succeeded - self.in_flight))
+
+    def done(self, max_articles: int) -> bool:
+        return self.in_flight == 0 and self.wanted(max_articles) == 0
+
+
+class PipelineFeedProcessor(ParallelFeedProcessor):
+    """两级流水线 Feed 处理器"""
+
+    def __init__(
+        self,
+        feed_parser: FeedParser,
+        filter: Filter,
+        max_workers: int = 10,
+        article_workers: int = 10,
+        queue_size: int = 100,
+        max_pending: Optional[int] = None,
+        checkpoint_interval: float = 0
+    ):
+        """
+        初始化流水线处理器
+
+        Args:
+            feed_parser: Feed 解析器
+            filter: 文章过滤器
+            max_workers: feed 获取线程数
+            article_workers: 文章提取线程数
+            queue_size: 提交到文章线程池（含正在执行）的文章数上限
+            max_pending: 同时处理（获取中或等待文章提取）的 feed 数上限，默认为 feed 线程数的 2 倍
+            checkpoint_interval: 运行中保存历史记录检查点的最小间隔（秒，0 表示只在全部完成后保存）
+        """
+        super().__init__(
+            feed_parser, filter, max_workers=max_workers,
+            max_pending=max_pending, checkpoint_interval=checkpoint_interval
+        )
+        self.article_workers = max(1, article_workers)
+        self.queue_size = max(self.article_workers, queue_size)
+
+    def process_feeds_parallel(
+        self,
+        feed_infos: List[FeedInfo],
+        progress_callback: Callable[[int, int, FeedResult], None] = None,
+        result_sink: Optional[Callable[[FeedResult], None]] = None
+    ) -> List[FeedResult]:
+        """
+        用两级流水线处理多个 feeds
+
+        文章阶段积压时不再获取新的 feed：获取中和等待文章提取的 feed 合计不超过 max_pending 个。
+
+        Args:
+            feed_infos: Feed 信息列表
+            progress_callback: 进度回调函数 (current, total, result)
+            result_sink: 结果处理函数，每个 feed 完成时调用；设置后返回的结果不再保留文章内容
+
+        Returns:
+            Feed 结果列表（与输入顺序一致）
+        """
+        total = len(feed_infos)
+        completed = 0
+        active = 0  # 获取中和等待文章提取的 feed 数
+        results: Dict[str, FeedResult] = {}
+        max_articles = self.feed_parser.max_articles
+        feed_iter = iter(feed_infos)
+
+        logger.info(
+            f"开始流水线处理 {total} 个 feeds，feed 线程 {self.max_workers} 个，"
+            f"文章线程 {self.article_workers} 个，文章队列上限 {self.queue_size}"
+        )
+
+        def finish(feed_info: FeedInfo, result: FeedResult) -> None:
+            nonlocal completed, active
+            self._record_result(feed_info, result)
+            results[feed_info.url], persisted = self._deliver(result, result_sink)
+            self._checkpoint(result, persisted)
+            completed += 1
+            active -= 1
+            if progress_callback:
+                progress_callback(completed, total, result)
+            logger.info(f"进度: {completed}/{total} - {feed_info.title}")
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="feed") as feed_pool, \
+                ThreadPoolExecutor(max_workers=self.article_workers, thread_name_prefix="article") as article_pool:
+
+            pending: Dict[Future, object] = {}  # future -> FeedInfo（feed 阶段）或 (assembly, 下标)（文章阶段）
+            waiting: Deque[_FeedAssembly] = deque()  # 等待文章队列空位的 feed
+            queued = 0  # 已提交到文章线程池的文章数
+
+            def schedule() -> None:
+                """在文章队列上限内，按 feed 先后顺序提交文章"""
+                nonlocal queued
+                while waiting and queued < self.queue_size:
+                    assembly = waiting[0]
+                    if assembly.wanted(max_articles) == 0:
+                        waiting.popleft()
+                        continue
+                    index = assembly.next_index
+                    assembly.next_index += 1
+                    assembly.in_flight += 1
+                    queued += 1
+                    future = article_pool.submit(
+                        self.feed_parser.extract_article, assembly.result.feed_info, assembly.jobs[index]
+                    )
+                    pending[future] = (assembly, index)
+
+            def complete(assembly: _FeedAssembly) -> None:
+                """文章全部提取完成后按原顺序汇总结果"""
+                articles = [assembly.extracted[i] for i in sorted(assembly.extracted) if assembly.extracted[i]]
+                result = self.feed_parser.finish_result(assembly.result, articles, len(assembly.extracted))
+                finish(result.feed_info, result)
+
+            def submit_feeds() -> None:
+                """在 max_pending 范围内提交新的 feed"""
+                nonlocal active
+                while active < self.max_pending:
+                    feed_info = next(feed_iter, None)
+                    if feed_info is None:
+                        return
+                    pending[feed_pool.submit(self.feed_parser.fetch_article_jobs, feed_info)] = feed_info
+                    active += 1
+
+            submit_feeds()
+
+            while pending:
+                done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+                for future in done:
+                    owner = pending.pop(future)
+
+                    if isinstance(owner, FeedInfo):
+                        # feed 阶段完成
+                        try:
+                            result, jobs = future.result()
+                        except Exception as e:
+                            logger.error(f"处理 feed 时发生错误 {owner.url}: {e}")
+                            result, jobs = FeedResult(feed_info=owner, articles=[], success=False, error=str(e)), []
+
+                        assembly = _FeedAssembly(result=result, jobs=jobs)
+                        if assembly.done(max_articles):
+                            complete(assembly)
+                        else:
+                            waiting.append(assembly)
+                        continue
+
+                    # 文章阶段完成
+                    assembly, index = owner
+                    queued -= 1
+                    assembly.in_flight -= 1
+                    try:
+                        assembly.extracted[index] = future.result()
+                    except Exception as e:
+                        logger.warning(f"提取文章时发生错误: {assembly.jobs[index].url} - {e}")
+                        assembly.extracted[index] = None
+
+                    if assembly.done(max_articles):
+                        complete(assembly)
+                    elif assembly.wanted(max_articles) and assembly not in waiting:
+                        # 该 feed 还有文章失败后需要补位
+                        waiting.appendleft(assembly)
+
+                schedule()
+                submit_feeds()
+
+        # 按原始顺序排列结果
+        ordered = [results[feed_info.url] for feed_info in feed_infos]
+
+        # 保存历史记录
+        self._save_history()
+
+        logger.info(f"流水线处理完成: {len(ordered)} 个 feeds")
+        return ordered
@@ -0,0 +1,154 @@
+"""cloudscraper 会话池模块
+
+按线程和域名复用 cloudscraper 实例（会话不是线程安全的，每个线程使用自己的实例），
+保留连接池和 Cloudflare 验证通过后的 cookies，同一域名的新实例继承其他线程已取得的 cookies；
+可选地把 cookies 保存到磁盘，下次运行时继续使用。
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from .atomic_file import atomic_write_json
+
+try:
+    import cloudscraper
+    CLOUDSCRAPER_AVAILABLE = True
+except ImportError:
+    CLOUDSCRAPER_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class ScraperPool:
+    """cloudscraper 会话池（线程安全）"""
+
+    def __init__(self, cookie_file: Optional[str] = None):
+        """
+        初始化会话池
+
+        Args:
+            cookie_file: cookies 持久化文件路径（None 表示只在本次运行内复用）
+        """
+        self.cookie_file = os.path.expanduser(cookie_file) if cookie_file else None
+        self._scrapers: Dict[Tuple[int, str], object] = {}  # (线程, 域名) -> scraper
+        self._stored: Dict[str, List[dict]] = {}  # domain -> 已保存的 cookies
+        self._lock = threading.Lock()
+        self._load_cookies()
+
+    @staticmethod
+    def _get_domain(url: str) -> str:
+        """从 URL 提取域名（移除 www. 前缀）"""
+        host = (urlparse(url).hostname or "").lower()
+        return host[4:] if host.startswith("www.") else host
+
+    def get(self, url: str):
+        """
+        获取当前线程中该 URL 所属域名的 scraper，不存在时创建
+
+        Args:
+            url: 请求 URL
+
+        Returns:
+            cloudscraper 实例
+
+        Raises:
+            ImportError: 未安装 cloudscraper
+        """
+        if not CLOUDSCRAPER_AVAILABLE:
+            raise ImportError("未安装 cloudscraper")
+
+        domain = self._get_domain(url)
+        key = (threading.get_ident(), domain)
+        with self._lock:
+            scraper = self._scrapers.get(key)
+            if scraper is None:
+                scraper = cloudscraper.create_scraper()
+                self._restore_cookies(scraper, domain)
+                # 继承其他线程对同一域名已取得的 cookies（如 Cloudflare 验证通过后的 cf_clearance）
+                for (_, other_domain), other in self._scrapers.items():
+                    if other_domain == domain:
+                        scraper.cookies.update(other.cookies)
+                self._scrapers[key] = scraper
+                logger.debug(f"创建 cloudscraper 会话: {domain}")
+            return scraper
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._scrapers)
+
+    # -------------------------------------------------------------------------
+    # cookies 持久化
+    # -------------------------------------------------------------------------
+
+    def _load_cookies(self) -> None:
+        """从磁盘加载 cookies"""
+        if not self.cookie_file or not os.path.isfile(self.cookie_file):
+            return
+        try:
+            with open(self.cookie_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self._stored = data
+            logger.info(f"加载 cloudscraper cookies，共 {len(self._stored)} 个域名")
+        except Exception as e:
+            logger.warning(f"加载 cloudscraper cookies 失败: {e}")
+            self._stored = {}
+
+    def _restore_cookies(self, scraper, domain: str) -> None:
+        """把已保存且未过期的 cookies 设置到 scraper"""
+        now = time.time()
+        for cookie in self._stored.get(domain, []):
+            expires = cookie.get("expires")
+            if expires and expires < now:
+                continue
+            scraper.cookies.set(
+                cookie["name"], cookie["value"],
+                domain=cookie.get("domain", ""), path=cookie.get("path", "/"),
+                expires=expires, secure=cookie.get("secure", False)
+            )
+
+    def save(self) -> None:
+        """把所有 scraper 的 cookies 保存到磁盘（原子写入）"""
+        if not self.cookie_file:
+            return
+
+        with self._lock:
+            # 同一域名的多个线程的 cookies 合并保存（同名 cookie 以后创建的会话为准）
+            merged: Dict[str, Dict[tuple, dict]] = {}
+            for (_, domain), scraper in self._scrapers.items():
+                cookies = merged.setdefault(domain, {})
+                for c in list(scraper.cookies):
+                    cookies[(c.name, c.domain, c.path)] = {
+                        "name": c.name, "value": c.value, "domain": c.domain,
+                        "path": c.path, "expires": c.expires, "secure": c.secure,
+                    }
+            for domain, cookies in merged.items():
+                self._stored[domain] = list(cookies.values())
+            data = dict(self._stored)
+
+        try:
+            atomic_write_json(self.cookie_file, data, prefix=".cookies-")
+            logger.debug(f"保存 cloudscraper cookies: {self.cookie_file}")
+        except Exception as e:
+            logger.warning(f"保存 cloudscraper cookies 失败: {e}")
+
+    def close(self) -> None:
+        """保存 cookies 并关闭所有 scraper"""
+        if self._scrapers:
+            self.save()
+        with self._lock:
+            scrapers = list(self._scrapers.values())
+            self._scrapers.clear()
+        for scraper in scrapers:
+            try:
+                scraper.close()
+            except Exception:
+                pass
+
+    def __repr__(self) -> str:
+        return f"ScraperPool(count={len(self)}, cookie_file={self.cookie_file})"
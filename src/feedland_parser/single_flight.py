@@ -0,0 +1,138 @@
+"""单次执行（single-flight）模块
+
+同一次运行中多个 feed 转载同一篇文章时（聚合源、Planet、公众号镜像等），
+按文章 URL 合并提取：第一个请求执行提取，同时到达的其他请求等待它的结果，
+之后到达的请求直接复用已完成的结果。线程和 asyncio 协程都可以等待同一个结果。
+"""
+
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Dict, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """按 key 合并重复执行的注册表（线程安全）"""
+
+    def __init__(self, max_results: int = 2048):
+        """
+        初始化注册表
+
+        Args:
+            max_results: 保留的已完成结果数上限（超过时淘汰最早完成的结果，0 表示只合并同时进行的请求）
+        """
+        self.max_results = max(0, max_results)
+        self._in_flight: Dict[str, Future] = {}
+        self._results: "OrderedDict[str, Future]" = OrderedDict()  # 已完成的结果（按完成顺序）
+        self.hits = 0  # 复用结果（等待或直接使用）的次数
+        self._lock = threading.Lock()
+
+    def claim(self, key: str) -> Tuple[Future, bool]:
+        """
+        登记一次执行
+
+        Args:
+            key: 合并的 key
+
+        Returns:
+            (future, 是否由调用方执行)。返回 True 时调用方必须执行并调用 finish 或 fail，
+            否则等待 future 的结果即可
+        """
+        with self._lock:
+            future = self._results.get(key) or self._in_flight.get(key)
+            if future is not None:
+                self.hits += 1
+                return future, False
+            future = Future()
+            self._in_flight[key] = future
+            return future, True
+
+    def finish(self, key: str, result) -> None:
+        """
+        执行完成，把结果交给等待者
+
+        Args:
+            key: 合并的 key
+            result: 执行结果
+        """
+        with self._lock:
+            future = self._in_flight.pop(key)
+            if self.max_results:
+                self._results[key] = future
+                while len(self._results) > self.max_results:
+                    self._results.popitem(last=False)
+        future.set_result(result)
+
+    def fail(self, key: str, error: BaseException) -> None:
+        """
+        执行失败，等待者收到同样的异常（失败结果不保留，之后的请求会重新执行）
+
+        Args:
+            key: 合并的 key
+            error: 异常
+        """
+        with self._lock:
+            future = self._in_flight.pop(key)
+        future.set_exception(error)
+
+    def do(self, key: str, fn: Callable[[], T]) -> Tuple[T, bool]:
+        """
+        执行 fn，相同 key 同时只执行一次
+
+        Args:
+            key: 合并的 key
+            fn: 执行函数
+
+        Returns:
+            (结果, 是否复用了其他请求的结果)
+        """
+        future, leader = self.claim(key)
+        if not leader:
+            return future.result(), True
+        try:
+            result = fn()
+        except BaseException as e:
+            self.fail(key, e)
+            raise
+        self.finish(key, result)
+        return result, False
+
+    async def do_async(self, key: str, fn: Callable[[], "asyncio.Future"]) -> Tuple[T, bool]:
+        """
+        do 的异步版本（等待时不阻塞事件循环）
+
+        Args:
+            key: 合并的 key
+            fn: 返回协程的函数
+
+        Returns:
+            (结果, 是否复用了其他请求的结果)
+        """
+        future, leader = self.claim(key)
+        if not leader:
+            return await asyncio.wrap_future(future), True
+        try:
+            result = await fn()
+        except BaseException as e:
+            self.fail(key, e)
+            raise
+        self.finish(key, result)
+        return result, False
+
+    def clear(self) -> None:
+        """清空已完成的结果"""
+        with self._lock:
+            self._results.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._results)
+
+    def __repr__(self) -> str:
+        return f"SingleFlight(results={len(self)}, hits={self.hits})"
@@ -0,0 +1,182 @@
+"""提取策略统计模块
+
+按域名记录每个提取策略的尝试和成功次数，让在该域名上成功率最高的策略先尝试，
+长期失败的策略直接跳过。统计可以保存到磁盘，每次加载时按衰减系数衰减。
+
+衰减只会缩小尝试次数、不会改变成功率，排在后面的策略一旦被前面的策略"截胡"就再也没有机会运行。
+因此每个域名每 explore_every 次提取按默认优先级尝试一次（探测），
+网站改版后原来失败的策略成功时，统计随之更新，被跳过的策略也能重新得到尝试机会。
+"""
+
+import json
+import logging
+import os
+import threading
+from typing import Dict, List, Optional, Sequence, TypeVar
+from urllib.parse import urlparse
+
+from .atomic_file import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 衰减后尝试次数低于该值的统计直接删除
+_PRUNE_BELOW = 0.5
+
+
+class StrategyStats:
+    """按域名统计提取策略成功率（线程安全）"""
+
+    def __init__(self, state_file: Optional[str] = None, decay: float = 0.8,
+                 min_attempts: int = 5, skip_below: float = 0.05, explore_every: int = 10):
+        """
+        初始化策略统计
+
+        Args:
+            state_file: 统计持久化文件路径（None 表示只在本次运行内统计）
+            decay: 每次加载时统计乘以的衰减系数（0~1）
+            min_attempts: 尝试次数达到该值后才可能跳过策略
+            skip_below: 成功率低于该值的策略跳过
+            explore_every: 每个域名每隔多少次提取按默认优先级尝试一次（0 表示不探测）
+        """
+        self.state_file = os.path.expanduser(state_file) if state_file else None
+        self.decay = min(1.0, max(0.0, float(decay)))
+        self.min_attempts = min_attempts
+        self.skip_below = skip_below
+        self.explore_every = max(0, int(explore_every))
+        self._calls: Dict[str, int] = {}  # domain -> 本次运行中排序的次数（用于周期性探测）
+        self._stats: Dict[str, Dict[str, List[float]]] = {}  # domain -> 策略名 -> [成功次数, 尝试次数]
+        self._dirty = False  # 是否有未保存的记录
+        self._lock = threading.Lock()
+        self._load()
+
+    @staticmethod
+    def get_domain(url: str) -> str:
+        """从 URL 提取域名（移除 www. 前缀）"""
+        host = (urlparse(url).hostname or "").lower()
+        return host[4:] if host.startswith("www.") else host
+
+    def record(self, url: str, strategy_name: str, success: bool) -> None:
+        """
+        记录一次策略尝试
+
+        Args:
+            url: 文章 URL
+            strategy_name: 策略名称
+            success: 是否成功
+        """
+        domain = self.get_domain(url)
+        if not domain:
+            return
+        with self._lock:
+            counts = self._stats.setdefault(domain, {}).setdefault(strategy_name, [0.0, 0.0])
+            counts[0] += 1 if success else 0
+            counts[1] += 1
+            self._dirty = True
+
+    def success_rate(self, url: str, strategy_name: str) -> float:
+        """
+        获取策略在该域名上的成功率（带平滑，没有统计时为 0.5）
+
+        Args:
+            url: 文章 URL
+            strategy_name: 策略名称
+
+        Returns:
+            成功率
+        """
+        with self._lock:
+            wins, attempts = self._stats.get(self.get_domain(url), {}).get(strategy_name, (0.0, 0.0))
+        return (wins + 1) / (attempts + 2)
+
+    def order(self, url: str, strategies: Sequence[T]) -> List[T]:
+        """
+        按该域名上的成功率排序策略，并跳过长期失败的策略
+
+        成功率相同时保持原有优先级；至少保留一个策略。
+        每 explore_every 次返回默认优先级的全部策略（探测）。
+
+        Args:
+            url: 文章 URL
+            strategies: 默认优先级的策略列表（需要有 name 属性）
+
+        Returns:
+            本次尝试的策略列表
+        """
+        domain = self.get_domain(url)
+        with self._lock:
+            domain_stats = self._stats.get(domain)
+            if not domain_stats:
+                return list(strategies)
+            calls = self._calls[domain] = self._calls.get(domain, 0) + 1
+            if self.explore_every and calls % self.explore_every == 0:
+                logger.debug(f"按默认顺序探测提取策略: {domain}")
+                return list(strategies)
+            stats = {name: tuple(counts) for name, counts in domain_stats.items()}
+
+        def rate(strategy) -> float:
+            wins, attempts = stats.get(strategy.name, (0.0, 0.0))
+            return (wins + 1) / (attempts + 2)
+
+        def skipped(strategy) -> bool:
+            wins, attempts = stats.get(strategy.name, (0.0, 0.0))
+            return attempts >= self.min_attempts and wins / attempts < self.skip_below
+
+        ordered = sorted(strategies, key=rate, reverse=True)
+        kept = [s for s in ordered if not skipped(s)]
+        return kept or ordered[:1]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._stats)
+
+    # -------------------------------------------------------------------------
+    # 持久化
+    # -------------------------------------------------------------------------
+
+    def _load(self) -> None:
+        """从磁盘加载统计并衰减"""
+        if not self.state_file or not os.path.isfile(self.state_file):
+            return
+        try:
+            with open(self.state_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.warning(f"加载提取策略统计失败: {e}")
+            return
+
+        if not isinstance(data, dict):
+            return
+        for domain, strategies in data.items():
+            decayed = {
+                name: [wins * self.decay, attempts * self.decay]
+                for name, (wins, attempts) in strategies.items()
+                if attempts * self.decay >= _PRUNE_BELOW
+            }
+            if decayed:
+                self._stats[domain] = decayed
+        logger.info(f"加载提取策略统计，共 {len(self._stats)} 个域名")
+
+    def save(self) -> None:
+        """把统计保存到磁盘（原子写入，没有新记录时跳过）"""
+        if not self.state_file:
+            return
+
+        with self._lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            data = {
+                domain: {name: [round(w, 3), round(a, 3)] for name, (w, a) in strategies.items()}
+                for domain, strategies in self._stats.items()
+            }
+
+        try:
+            atomic_write_json(self.state_file, data, prefix=".strategy-stats-")
+            logger.debug(f"保存提取策略统计: {self.state_file}")
+        except Exception as e:
+            logger.warning(f"保存提取策略统计失败: {e}")
+
+    def __repr__(self) -> str:
+        return f"StrategyStats(domains={len(self)}, state_file={self.state_file})"
@@ -0,0 +1,170 @@
+"""文章 URL 规范化模块
+
+feed 中的文章链接常带有跟踪参数（utm_*）、被跳转服务包装，或者指向 AMP 页面，
+同一篇文章因此出现多个不同的 URL，跨 feed 去重无法命中。
+规范化后的 URL 只用作去重的 key，下载和输出仍使用原始链接：
+
+- 协议和主机名小写，去掉默认端口和片段（#...，保留 #! 形式的路由片段）
+- 删除跟踪参数（可配置，支持 utm_* 形式的前缀匹配）
+- 展开已知跳转服务（Google、Facebook、知乎等把目标地址放在查询参数中的链接）
+- 可选：已知形式的 AMP 页面改为普通页面（AMP 缓存、/amp/ 路径前缀、amp / outputType=amp 参数）；
+  m. / mobile. 主机和以 /amp 结尾的路径不一定是同一篇文章，不做改写
+"""
+
+import logging
+import re
+from typing import Dict, Iterable, Optional, Tuple
+from urllib.parse import parse_qsl, unquote_plus, urlsplit, urlunsplit
+
+logger = logging.getLogger(__name__)
+
+# 默认删除的跟踪参数（以 * 结尾表示前缀匹配）
+DEFAULT_STRIP_PARAMS = (
+    "utm_*", "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid",
+    "mc_cid", "mc_eid", "_hsenc", "_hsmi", "mkt_tok", "ref_src",
+)
+
+# 跳转服务：主机 -> 保存目标地址的查询参数
+_REDIRECTORS: Dict[str, Tuple[str, ...]] = {
+    "www.google.com": ("url", "q"),
+    "google.com": ("url", "q"),
+    "l.facebook.com": ("u",),
+    "lm.facebook.com": ("u",),
+    "link.zhihu.com": ("target",),
+    "t.umblr.com": ("z",),
+    "out.reddit.com": ("url",),
+    "weibo.cn": ("u",),
+    "link.juejin.cn": ("target",),
+}
+
+# 展开跳转的最大层数
+_MAX_UNWRAP = 3
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+_AMP_CACHE_RE = re.compile(r"^/[cv]/(?:s/)?(?P<rest>.+)$")
+
+
+class UrlCanonicalizer:
+    """文章 URL 规范化器"""
+
+    def __init__(self, strip_params: Iterable[str] = DEFAULT_STRIP_PARAMS,
+                 unwrap_redirects: bool = True, normalize_mobile: bool = False):
+        """
+        初始化规范化器
+
+        Args:
+            strip_params: 删除的查询参数（不区分大小写，以 * 结尾表示前缀匹配）
+            unwrap_redirects: 是否展开已知跳转服务
+            normalize_mobile: 是否把已知形式的 AMP 页面改为普通页面
+        """
+        params = [p.lower() for p in strip_params]
+        self._strip_exact = frozenset(p for p in params if not p.endswith("*"))
+        self._strip_prefixes = tuple(p[:-1] for p in params if p.endswith("*"))
+        self.unwrap_redirects = unwrap_redirects
+        self.normalize_mobile = normalize_mobile
+
+    def canonicalize(self, url: str) -> str:
+        """
+        规范化文章 URL
+
+        Args:
+            url: 原始 URL
+
+        Returns:
+            规范化后的 URL（无法解析或不是 http(s) 时原样返回）
+        """
+        try:
+            canonical = self._canonicalize(url.strip())
+        except ValueError as e:
+            logger.debug(f"URL 规范化失败: {url} - {e}")
+            return url
+        if canonical != url:
+            logger.debug(f"URL 规范化: {url} -> {canonical}")
+        return canonical
+
+    def _canonicalize(self, url: str) -> str:
+        parts = urlsplit(url)
+        for _ in range(_MAX_UNWRAP):
+            target = self._redirect_target(parts) if self.unwrap_redirects else None
+            if target is None:
+                break
+            parts = urlsplit(target)
+
+        scheme = parts.scheme.lower()
+        if scheme not in _DEFAULT_PORTS:
+            return url
+
+        host = (parts.hostname or "").lower()
+        path = parts.path or "/"
+        if self.normalize_mobile:
+            host, path = self._non_amp(host, path)
+
+        # urlsplit 去掉了 IPv6 地址的方括号
+        netloc = f"[{host}]" if ":" in host else host
+        if parts.port and parts.port != _DEFAULT_PORTS[scheme]:
+            netloc = f"{netloc}:{parts.port}"
+        if parts.username:
+            netloc = f"{parts.username}{':' + parts.password if parts.password else ''}@{netloc}"
+
+        query = self._strip_query(parts.query)
+        # #! 片段是单页应用的路由，属于文章地址的一部分
+        fragment = parts.fragment if parts.fragment.startswith("!") else ""
+        return urlunsplit((scheme, netloc, path, query, fragment))
+
+    def _redirect_target(self, parts) -> Optional[str]:
+        """已知跳转服务的目标地址"""
+        names = _REDIRECTORS.get((parts.hostname or "").lower())
+        if not names:
+            return None
+        params = dict(parse_qsl(parts.query))
+        for name in names:
+            target = params.get(name, "")
+            if target.startswith(("http://", "https://")):
+                return target
+        return None
+
+    @staticmethod
+    def _non_amp(host: str, path: str) -> Tuple[str, str]:
+        """已知形式的 AMP 页面对应的普通页面主机和路径"""
+        # AMP 缓存：www-example-com.cdn.ampproject.org/c/s/www.example.com/path
+        if host.endswith(".cdn.ampproject.org"):
+            match = _AMP_CACHE_RE.match(path)
+            if match:
+                rest = match.group("rest")
+                host, _, path = rest.partition("/")
+                host, path = host.lower(), "/" + path
+
+        # /amp/story -> /story
+        if path.startswith("/amp/"):
+            path = path[4:]
+        return host, path
+
+    def _strip_query(self, query: str) -> str:
+        """删除跟踪参数（以及 AMP 参数），保留其余参数的顺序和原始编码"""
+        if not query:
+            return ""
+        kept = []
+        for pair in query.split("&"):
+            name, _, value = pair.partition("=")
+            name = unquote_plus(name).lower()
+            if pair and not self._is_tracking(name) and not self._is_amp_param(name, value):
+                kept.append(pair)
+        return "&".join(kept)
+
+    def _is_tracking(self, name: str) -> bool:
+        return name in self._strip_exact or name.startswith(self._strip_prefixes)
+
+    def _is_amp_param(self, name: str, value: str) -> bool:
+        """?amp、?amp=1、?outputType=amp 等 AMP 版本参数"""
+        if not self.normalize_mobile:
+            return False
+        return name == "amp" or (name == "outputtype" and value.lower() == "amp")
+
+    def __call__(self, url: str) -> str:
+        return self.canonicalize(url)
+
+    def __repr__(self) -> str:
+        return (
+            f"UrlCanonicalizer(strip={len(self._strip_exact) + len(self._strip_prefixes)}, "
+            f"unwrap_redirects={self.unwrap_redirects}, normalize_mobile={self.normalize_mobile})"
+        )
@@ -0,0 +1,328 @@
+"""ArticleExtractor 单元测试（不访问网络）"""
+
+import pytest
+import requests
+from lxml import etree
+from unittest.mock import MagicMock
+
+from feedland_parser.article_extractor import (
+    ArticleExtractor,
+    FetchedPage,
+    NetworkError,
+    _element_text,
+    _fetch_page,
+    _looks_like_full_text,
+)
+
+
+ARTICLE_HTML = """
+<html>
+<head><title>测试文章</title></head>
+<body>
+  <nav>导航 首页 关于</nav>
+  <article>
+    <h1>测试文章标题</h1>
+    <p>{paragraph}</p>
+    <p>{paragraph}</p>
+    <img src="https://example.com/images/photo.jpg" width="800" height="600">
+    <img src="https://example.com/logo.png">
+  </article>
+</body>
+</html>
+""".format(paragraph="这是一段用于测试正文提取的内容，长度足够让各个提取策略判定为有效正文。" * 5)
+
+
+def _mock_response(html: str, status_code: int = 200, url: str = "https://example.com/a"):
+    """构造一个模拟的 requests.Response"""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = html.encode("utf-8")
+    response.encoding = "utf-8"
+    response.url = url
+    response.headers["Content-Type"] = "text/html; charset=utf-8"
+    return response
+
+
+class TestFetchPage:
+    """页面下载测试"""
+
+    def test_fetch_page_success(self):
+        """测试下载成功"""
+        session = MagicMock()
+        session.get.return_value = _mock_response(ARTICLE_HTML)
+
+        page = _fetch_page("https://example.com/a", session, (3, 10))
+
+        assert page.ok
+        assert page.status_code == 200
+        assert "测试文章标题" in page.text
+        assert page.content == ARTICLE_HTML.encode("utf-8")
+        assert page.headers["Content-Type"].startswith("text/html")
+
+    def test_fetch_page_http_error(self):
+        """测试 HTTP 错误返回不可用页面而不是抛异常"""
+        session = MagicMock()
+        session.get.return_value = _mock_response("Forbidden", status_code=403)
+
+        page = _fetch_page("https://example.com/a", session, (3, 10))
+
+        assert not page.ok
+        assert page.status_code == 403
+
+    def test_fetch_page_timeout(self):
+        """测试超时抛出 NetworkError"""
+        session = MagicMock()
+        session.get.side_effect = requests.exceptions.Timeout()
+
+        with pytest.raises(NetworkError):
+            _fetch_page("https://example.com/a", session, (3, 10))
+
+    @pytest.mark.parametrize("url", ["/relative/path", "htp:/bad url", "http://"])
+    def test_fetch_page_invalid_url(self, url):
+        """测试无效 URL 返回不可用页面而不是抛异常"""
+        page = _fetch_page(url, requests.Session(), (3, 10))
+
+        assert not page.ok
+        assert page.status_code == 0
+
+
+class TestSingleFetch:
+    """页面只下载一次测试"""
+
+    def test_extract_downloads_page_once(self):
+        """测试一次提取只发起一次 GET（含图片提取）"""
+        extractor = ArticleExtractor()
+        extractor._session = MagicMock()
+        extractor._session.get.return_value = _mock_response(ARTICLE_HTML)
+
+        result = extractor.extract("https://example.com/a", title="测试")
+
+        assert result.success
+        assert result.extraction_method == "readability"
+        assert extractor._session.get.call_count == 1
+        assert "https://example.com/images/photo.jpg" in result.images
+        assert all("logo" not in img for img in result.images)
+
+    def test_strategies_share_page(self):
+        """测试 Readability 失败后其余策略复用同一页面"""
+        extractor = ArticleExtractor()
+        extractor._session = MagicMock()
+        extractor._session.get.return_value = _mock_response(ARTICLE_HTML)
+        extractor._strategies[0].extract = MagicMock(return_value=None)
+
+        result = extractor.extract("https://example.com/a", title="测试")
+
+        assert result.success
+        assert result.extraction_method != "readability"
+        assert extractor._session.get.call_count == 1
+
+    def test_network_error_falls_back_to_description(self):
+        """测试下载网络错误时使用描述回退"""
+        extractor = ArticleExtractor()
+        extractor._session = MagicMock()
+        extractor._session.get.side_effect = requests.exceptions.ConnectionError("boom")
+
+        description = "这是一段足够长的描述内容，用于在网络错误时作为回退内容返回给调用方。" * 2
+        result = extractor.extract("https://example.com/a", description=description)
+
+        assert result.extraction_method == "description-fallback"
+        assert extractor._session.get.call_count == 1
+
+    @pytest.mark.parametrize("url", ["/relative/path", "htp:/bad url"])
+    def test_invalid_url_falls_back_to_description(self, url):
+        """测试无效链接使用描述回退，不抛异常"""
+        extractor = ArticleExtractor()
+        description = "这是一段足够长的描述内容，用于在链接无效时作为回退内容返回给调用方。" * 2
+
+        result = extractor.extract(url, description=description)
+
+        assert result.extraction_method == "description-fallback"
+        assert result.content == description
+
+    def test_fetched_page_ok(self):
+        """测试 FetchedPage.ok 判断"""
+        assert FetchedPage(url="u", status_code=200, text="x").ok
+        assert not FetchedPage(url="u", status_code=200, text="").ok
+        assert not FetchedPage(url="u", status_code=404, text="x").ok
+
+
+class TestParsedDocument:
+    """共享 DOM 测试"""
+
+    def test_document_parsed_once(self):
+        """测试同一页面的 DOM 只解析一次"""
+        page = FetchedPage(url="https://example.com/a", status_code=200, text=ARTICLE_HTML)
+
+        assert page.document is page.document
+        assert page.document.tree is page.document.tree
+
+    def test_readability_does_not_mutate_shared_tree(self):
+        """测试 Readability 不修改共享 DOM"""
+        page = FetchedPage(url="https://example.com/a", status_code=200, text=ARTICLE_HTML)
+        tree = page.document.tree
+        before = etree.tostring(tree)
+
+        assert "测试正文提取" in page.document.readability_text
+        assert etree.tostring(tree) == before
+        assert tree.find(".//nav") is not None
+
+    def test_xml_declaration_falls_back_to_bytes(self):
+        """测试带 XML 编码声明的页面可以解析"""
+        html = '<?xml version="1.0" encoding="utf-8"?><html><body><p>内容</p></body></html>'
+        page = FetchedPage(url="u", status_code=200, text=html, content=html.encode("utf-8"))
+
+        assert page.document.tree is not None
+        assert "内容" in page.document.tree.text_content()
+
+    def test_element_text_skips_script_and_style(self):
+        """测试纯文本提取跳过 script/style 和注释"""
+        html = "<html><body><div> a <!-- c --><script>x()</script><style>p{}</style><p> b </p></div></body></html>"
+        page = FetchedPage(url="u", status_code=200, text=html)
+
+        assert _element_text(page.document.tree.find(".//div")) == "a\nb"
+
+
+class TestFeedContent:
+    """feed 内嵌全文测试"""
+
+    PARAGRAPH = "这是一段 feed 内嵌的完整正文内容，长度足够判定为全文。" * 40
+
+    def test_full_text_extracted(self):
+        """测试完整正文直接生成文章"""
+        html = f'<p>{self.PARAGRAPH}</p><img src="/img/a.jpg" width="800" height="600">'
+        content = ArticleExtractor().extract_from_feed_content("https://example.com/post", html, title="标题")
+
+        assert content.success
+        assert content.extraction_method == "feed-content"
+        assert content.title == "标题"
+        assert self.PARAGRAPH[:20] in content.content
+
+    def test_truncated_content_rejected(self):
+        """测试带截断标记的内容不作为全文"""
+        html = f'<p>{self.PARAGRAPH}</p><p><a href="https://example.com/post">Continue reading</a></p>'
+        extractor = ArticleExtractor()
+
+        assert extractor.extract_from_feed_content("https://example.com/post", html) is None
+        assert extractor.extract_from_feed_content("https://example.com/post", html, force=True).success
+
+    def test_markup_heavy_content_rejected(self):
+        """测试标记占比过高的内容不作为全文"""
+        html = "".join(f'<div class="wrapper"><span style="color:red">{c}</span></div>' for c in self.PARAGRAPH)
+
+        assert not _looks_like_full_text(html, self.PARAGRAPH)
+        assert _looks_like_full_text(f"<p>{self.PARAGRAPH}</p>", self.PARAGRAPH)
+        assert not _looks_like_full_text("<p>短</p>", "短")
+
+
+class TestImageCollector:
+    """单次遍历图片提取测试"""
+
+    def _images(self, body: str, max_images: int = 10, url: str = "https://example.com/post/1"):
+        page = FetchedPage(url=url, status_code=200, text=f"<html><body>{body}</body></html>")
+        return ArticleExtractor()._extract_images(page, max_images=max_images)
+
+    def test_article_images_first(self):
+        """测试 article 中的图片优先，足够 3 张时不使用其他容器"""
+        body = (
+            '<figure><img src="https://example.com/fig.jpg"></figure>'
+            '<article>' + "".join(f'<img src="https://example.com/a{i}.jpg">' for i in range(3)) + '</article>'
+        )
+        assert self._images(body) == [f"https://example.com/a{i}.jpg" for i in range(3)]
+
+    def test_lower_priority_containers_fill_in(self):
+        """测试 article 图片不足时按容器优先级补充"""
+        body = (
+            '<figure><img src="https://example.com/fig.jpg"></figure>'
+            '<div class="entry-content"><img src="https://example.com/entry.jpg"></div>'
+            '<article><img src="https://example.com/a.jpg"></article>'
+            '<img src="https://example.com/outside.jpg">'
+        )
+        assert self._images(body) == [
+            "https://example.com/a.jpg", "https://example.com/entry.jpg", "https://example.com/fig.jpg",
+        ]
+
+    def test_relative_src_and_filters(self):
+        """测试相对地址补全，过滤追踪、图标和小图"""
+        body = (
+            '<article><img src="/img/photo.jpg">'
+            '<img src="https://www.google-analytics.com/collect.gif">'
+            '<img src="https://example.com/LOGO.png">'
+            '<img src="https://example.com/small.jpg" width="20" height="20">'
+            '<img data-src="lazy.jpg" src="data:image/gif;base64,R0lGOD"></article>'
+        )
+        assert self._images(body) == ["https://example.com/img/photo.jpg", "https://example.com/post/lazy.jpg"]
+
+    def test_only_first_article_ranks_first(self):
+        """测试只有第一个 article 最优先，其他 article 中的图片排在 #readability-content 之后"""
+        body = (
+            '<figure><img src="https://example.com/fig.jpg"></figure>'
+            '<article><img src="https://example.com/a1.jpg"></article>'
+            '<div id="readability-content"><img src="https://example.com/r.jpg"></div>'
+            '<article><img src="https://example.com/a2.jpg"></article>'
+        )
+        assert self._images(body) == [
+            "https://example.com/a1.jpg", "https://example.com/r.jpg",
+            "https://example.com/a2.jpg", "https://example.com/fig.jpg",
+        ]
+
+    def test_relative_src_not_filtered_by_page_host(self):
+        """测试相对地址只按路径过滤，页面域名中的 profile、analytics 等词不影响"""
+        body = '<article><img src="/img/photo.jpg"><img src="/img/avatar.png"></article>'
+
+        assert self._images(body, url="https://profile.com/post/1") == ["https://profile.com/img/photo.jpg"]
+        assert self._images(body, url="https://analytics.blog/post/1") == ["https://analytics.blog/img/photo.jpg"]
+
+    def test_skip_patterns_match_path_only(self):
+        """测试图标等关键词只匹配图片路径，不匹配图片域名"""
+        body = (
+            '<article><img src="https://logo-cdn.example.net/photo.jpg">'
+            '<img src="https://cdn.example.net/profile/me.jpg"></article>'
+        )
+        assert self._images(body) == ["https://logo-cdn.example.net/photo.jpg"]
+
+    def test_max_images(self):
+        """测试最多返回 max_images 张"""
+        body = '<article>' + "".join(f'<img src="https://example.com/{i}.jpg">' for i in range(20)) + '</article>'
+        assert len(self._images(body, max_images=5)) == 5
+
+
+class TestImageModes:
+    """图片提取模式测试"""
+
+    def _extract(self, image_mode: str):
+        extractor = ArticleExtractor(image_mode=image_mode)
+        page = FetchedPage(url="https://example.com/a", status_code=200, text=ARTICLE_HTML)
+        return extractor, extractor.extract_from_page(page, title="测试")
+
+    def test_full(self):
+        """测试默认模式提取整个页面的图片"""
+        _, result = self._extract("full")
+        assert result.images == ["https://example.com/images/photo.jpg"]
+        assert result.images_future is None
+
+    def test_none(self):
+        """测试 none 模式不提取图片"""
+        _, result = self._extract("none")
+        assert result.success
+        assert result.images == []
+
+    def test_summary(self):
+        """测试 summary 模式从 Readability 正文中提取图片"""
+        _, result = self._extract("summary")
+        assert result.images == ["https://example.com/images/photo.jpg"]
+
+    def test_deferred(self):
+        """测试 deferred 模式先返回正文，图片在后台提取后写回"""
+        extractor, result = self._extract("deferred")
+        assert result.images == []
+
+        articles = [{"url": result.url, "images": [], "_images_future": result.images_future}]
+        extractor.resolve_deferred_images(articles)
+        extractor.close()
+
+        assert articles == [{"url": result.url, "images": ["https://example.com/images/photo.jpg"]}]
+
+    def test_invalid_mode(self):
+        """测试不支持的模式"""
+        with pytest.raises(ValueError):
+            ArticleExtractor(image_mode="lazy")
@@ -0,0 +1,190 @@
+"""AsyncFeedProcessor 测试（使用本地 aiohttp 测试服务器）"""
+
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from feedland_parser.article_extractor import ArticleExtractor
+from feedland_parser.async_processor import AsyncFeedProcessor
+from feedland_parser.config import Config
+from feedland_parser.feed_parser import FeedParser, FeedResult
+from feedland_parser.filter import Filter
+from feedland_parser.opml_parser import FeedInfo
+
+
+PARAGRAPH = "这是一段用于测试异步正文提取的内容，长度足够让提取策略判定为有效正文。" * 5
+
+ARTICLE_HTML = f"""
+<html><head><title>文章</title></head>
+<body><article><h1>异步文章</h1><p>{PARAGRAPH}</p><p>{PARAGRAPH}</p></article></body></html>
+"""
+
+
+def _rss(base_url: str, name: str) -> str:
+    return f"""<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0"><channel><title>{name}</title>
+<item><title>{name} post</title><link>{base_url}/article/{name}</link>
+<pubDate>Mon, 10 Feb 2025 10:00:00 GMT</pubDate></item>
+</channel></rss>"""
+
+
+def _build_app(requests_seen: list) -> web.Application:
+    async def feed(request):
+        requests_seen.append(request.path)
+        name = request.match_info["name"]
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        base = f"{request.scheme}://{request.host}"
+        return web.Response(body=_rss(base, name).encode("utf-8"),
+                            content_type="application/rss+xml", headers={"ETag": '"v1"'})
+
+    async def article(request):
+        requests_seen.append(request.path)
+        return web.Response(text=ARTICLE_HTML, content_type="text/html", charset="utf-8")
+
+    async def loop(request):
+        raise web.HTTPFound("/loop")
+
+    app = web.Application()
+    app.router.add_get("/feed/{name}", feed)
+    app.router.add_get("/article/{name}", article)
+    app.router.add_get("/loop", loop)
+    return app
+
+
+class TestAsyncFeedProcessor:
+    """异步处理器测试"""
+
+    @pytest.fixture
+    def filter_obj(self):
+        """创建空历史记录的 Filter"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump({"url": "https://test.com/opml", "his": {}}, f)
+            temp_file = f.name
+
+        config = Config(temp_file)
+        config.load()
+        filter_obj = Filter(config)
+        filter_obj.load_history()
+
+        yield filter_obj
+
+        os.unlink(temp_file)
+
+    def _run(self, filter_obj, names, runs: int = 1, result_sink=None):
+        """启动测试服务器并异步处理 feeds（可连续运行多次）"""
+        requests_seen = []
+
+        async def main():
+            server = TestServer(_build_app(requests_seen))
+            await server.start_server()
+            try:
+                base = str(server.make_url("")).rstrip("/")
+                feed_infos = [FeedInfo(url=f"{base}/feed/{n}", title=n, feed_type="RSS") for n in names]
+                all_results = []
+                for _ in range(runs):
+                    with ArticleExtractor() as extractor:
+                        parser = FeedParser(extractor, filter_obj)
+                        processor = AsyncFeedProcessor(parser, filter_obj, max_workers=2, max_concurrency=10)
+                        all_results.append(await processor.process_feeds_async(feed_infos, result_sink=result_sink))
+                return feed_infos, all_results
+            finally:
+                await server.close()
+
+        feed_infos, all_results = asyncio.run(main())
+        return feed_infos, all_results, requests_seen
+
+    def test_process_feeds_async(self, filter_obj):
+        """测试异步处理多个 feeds 并保持输入顺序"""
+        feed_infos, (results,), _ = self._run(filter_obj, ["a", "b", "c"])
+
+        assert [r.feed_info.url for r in results] == [f.url for f in feed_infos]
+        assert all(r.success for r in results)
+        for result in results:
+            assert len(result.articles) == 1
+            assert "异步正文提取" in result.articles[0]["content"]
+
+    def test_history_and_validators_recorded(self, filter_obj):
+        """测试异步模式同样更新历史记录和校验信息"""
+        feed_infos, _, _ = self._run(filter_obj, ["a"])
+
+        assert filter_obj.get_last_id(feed_infos[0].url) == "2025-02-10T10:00:00"
+        assert filter_obj.get_validators(feed_infos[0].url) == {"etag": '"v1"'}
+
+    def test_not_modified_feed_skipped(self, filter_obj):
+        """测试第二次运行 304 的 feed 不请求文章"""
+        _, (first, second), requests_seen = self._run(filter_obj, ["a"], runs=2)
+
+        assert not first[0].not_modified
+        assert second[0].not_modified
+        assert requests_seen == ["/feed/a", "/article/a", "/feed/a"]
+
+    def test_result_sink_runs_off_event_loop(self, filter_obj):
+        """测试 result_sink 在线程中执行，不阻塞事件循环"""
+        sink_threads = []
+        _, (results,), _ = self._run(
+            filter_obj, ["a", "b"], result_sink=lambda result: sink_threads.append(threading.get_ident())
+        )
+
+        assert len(sink_threads) == 2
+        assert threading.get_ident() not in sink_threads
+        assert all(r.success and not r.articles for r in results)
+
+    def test_tasks_created_in_bounded_window(self, filter_obj):
+        """测试同时存在的 feed 任务不超过 max_concurrency 个"""
+        in_flight = []
+        peak = []
+
+        async def fake_process(feed_info, http, executor):
+            in_flight.append(feed_info.url)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(feed_info.url)
+            return FeedResult(feed_info=feed_info, articles=[], success=True)
+
+        feed_infos = [FeedInfo(url=f"https://example.com/feed/{i}", title=str(i), feed_type="RSS") for i in range(7)]
+        with ArticleExtractor() as extractor:
+            processor = AsyncFeedProcessor(FeedParser(extractor, filter_obj), filter_obj, max_workers=2, max_concurrency=2)
+            processor._process_single_feed_async = fake_process
+            results = asyncio.run(processor.process_feeds_async(feed_infos))
+
+        assert [r.feed_info.url for r in results] == [f.url for f in feed_infos]
+        assert len(peak) == 7
+        assert max(peak) == 2
+
+
+class TestExtractAsyncErrors:
+    """异步提取请求错误测试"""
+
+    DESCRIPTION = "这是一段足够长的描述内容，用于在异步请求失败时作为回退内容返回给调用方。" * 2
+
+    def _extract(self, url_or_path):
+        async def main():
+            server = TestServer(_build_app([]))
+            await server.start_server()
+            try:
+                url = url_or_path
+                if url.startswith("/"):
+                    url = str(server.make_url(url))
+                with ArticleExtractor() as extractor:
+                    async with aiohttp.ClientSession() as http:
+                        return await extractor.extract_async(url, http, description=self.DESCRIPTION)
+            finally:
+                await server.close()
+
+        return asyncio.run(main())
+
+    @pytest.mark.parametrize("url", ["/loop", "htp:/bad url", "https://"])
+    def test_request_errors_fall_back_to_description(self, url):
+        """测试重定向过多和无效链接使用描述回退，不抛异常"""
+        result = self._extract(url)
+
+        assert result.extraction_method == "description-fallback"
+        assert result.content == self.DESCRIPTION
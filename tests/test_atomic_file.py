@@ -0,0 +1,47 @@
+"""原子文件写入测试"""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from feedland_parser.atomic_file import atomic_write, atomic_write_json
+from feedland_parser.config import Config
+
+
+class TestAtomicFile:
+    """atomic_write 测试类"""
+
+    def test_write_json(self, tmp_path):
+        """测试写入 JSON 并创建目录"""
+        path = tmp_path / "state" / "data.json"
+        atomic_write_json(str(path), {"名称": 1}, indent=2)
+
+        assert json.loads(path.read_text(encoding="utf-8")) == {"名称": 1}
+        assert os.listdir(path.parent) == ["data.json"]
+
+    def test_failed_replace_keeps_old_file(self, tmp_path):
+        """测试替换失败时旧文件保持不变，临时文件被删除"""
+        path = tmp_path / "data.json"
+        path.write_text("old", encoding="utf-8")
+
+        with patch("feedland_parser.atomic_file.os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                atomic_write(str(path), "new")
+
+        assert path.read_text(encoding="utf-8") == "old"
+        assert os.listdir(tmp_path) == ["data.json"]
+
+    def test_config_save_is_atomic(self, tmp_path):
+        """测试序列化失败时配置文件不会被截断"""
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({"url": "https://test.com/opml"}), encoding="utf-8")
+        config = Config(str(path))
+        config.load()
+        config.his = {"feed": object()}  # 无法序列化
+
+        with pytest.raises(TypeError):
+            config.save()
+
+        assert json.loads(path.read_text(encoding="utf-8")) == {"url": "https://test.com/opml"}
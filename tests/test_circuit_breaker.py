@@ -0,0 +1,210 @@
+"""按域名熔断测试"""
+
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from feedland_parser.article_extractor import ArticleExtractor
+from feedland_parser.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from feedland_parser.domain_blacklist import DomainBlacklist
+
+from .test_article_extractor import ARTICLE_HTML, _mock_response
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """可控制的时钟"""
+    now = [1000.0]
+    monkeypatch.setattr("feedland_parser.circuit_breaker.time.monotonic", lambda: now[0])
+    return now
+
+
+class TestCircuitBreaker:
+    """CircuitBreaker 测试类"""
+
+    def test_single_failure_does_not_open(self, clock):
+        """测试一次失败不会熔断"""
+        breaker = CircuitBreaker(min_calls=3)
+        assert breaker.record_failure("https://example.com/a") is False
+        assert breaker.allow("https://example.com/b")
+        assert breaker.state("example.com") == CLOSED
+
+    def test_opens_on_failure_rate(self, clock):
+        """测试窗口内失败率达到阈值时熔断"""
+        breaker = CircuitBreaker(window=4, min_calls=4, failure_rate=0.5)
+        breaker.record_failure("https://example.com/a")
+        breaker.record_success("https://www.example.com/b", 0.2)
+        breaker.record_success("https://example.com/c", 0.2)
+        assert breaker.record_failure("https://example.com/d") is True
+
+        assert breaker.state("https://example.com/") == OPEN
+        assert not breaker.allow("https://example.com/e")
+        assert breaker.allow("https://other.com/e")
+        assert breaker.open_domains() == {"example.com": 1}
+
+    def test_successes_push_failures_out_of_window(self, clock):
+        """测试失败移出窗口后不再统计"""
+        breaker = CircuitBreaker(window=3, min_calls=3, failure_rate=0.6)
+        breaker.record_failure("https://example.com/a")
+        for _ in range(3):
+            breaker.record_success("https://example.com/b")
+        breaker.record_failure("https://example.com/c")
+        assert breaker.state("example.com") == CLOSED
+
+    def test_slow_calls_count_as_failures(self, clock):
+        """测试慢请求计为失败"""
+        breaker = CircuitBreaker(window=3, min_calls=3, failure_rate=1.0, slow_call_duration=5)
+        breaker.record_success("https://example.com/a", 6)
+        breaker.record_success("https://example.com/b", 7)
+        breaker.record_success("https://example.com/c", 1)
+        assert breaker.state("example.com") == CLOSED
+        breaker.record_success("https://example.com/d", 9)
+        breaker.record_success("https://example.com/e", 9)
+        assert breaker.state("example.com") == CLOSED
+        breaker.record_success("https://example.com/f", 9)
+        assert breaker.state("example.com") == OPEN
+
+    def test_half_open_probe(self, clock):
+        """测试冷却结束后只放行一个探测请求，成功后恢复"""
+        breaker = CircuitBreaker(min_calls=1, cooldown=30)
+        breaker.record_failure("https://example.com/a")
+
+        clock[0] += 29
+        assert not breaker.allow("https://example.com/b")
+        clock[0] += 2
+        assert breaker.allow("https://example.com/b")
+        assert breaker.state("example.com") == HALF_OPEN
+        assert not breaker.allow("https://example.com/c")
+
+        breaker.record_success("https://example.com/b", 0.5)
+        assert breaker.state("example.com") == CLOSED
+        assert breaker.allow("https://example.com/c")
+        assert breaker.open_domains() == {}
+
+    def test_probe_failure_doubles_cooldown(self, clock):
+        """测试探测失败后冷却时间翻倍，不超过上限"""
+        breaker = CircuitBreaker(min_calls=1, cooldown=30, max_cooldown=50)
+        breaker.record_failure("https://example.com/a")
+        clock[0] += 31
+        assert breaker.allow("https://example.com/b")
+        assert breaker.record_failure("https://example.com/b") is True
+
+        clock[0] += 49
+        assert not breaker.allow("https://example.com/c")
+        clock[0] += 2
+        assert breaker.allow("https://example.com/c")
+        assert breaker.open_domains() == {"example.com": 2}
+
+    def test_probe_without_outcome_times_out(self, clock):
+        """测试探测请求一直没有结果时，超时后放行新的探测请求"""
+        breaker = CircuitBreaker(min_calls=1, cooldown=30)
+        breaker.record_failure("https://example.com/a")
+        clock[0] += 31
+        assert breaker.allow("https://example.com/b")
+
+        clock[0] += 119
+        assert not breaker.allow("https://example.com/c")
+        clock[0] += 2
+        assert breaker.allow("https://example.com/c")
+        assert not breaker.allow("https://example.com/d")
+
+    def test_release_grants_new_probe(self, clock):
+        """测试放弃探测后立即放行新的探测请求"""
+        breaker = CircuitBreaker(min_calls=1, cooldown=30)
+        breaker.record_failure("https://example.com/a")
+        clock[0] += 31
+        assert breaker.allow("https://example.com/b")
+
+        breaker.release("https://example.com/b")
+        assert breaker.state("example.com") == HALF_OPEN
+        assert breaker.allow("https://example.com/c")
+        assert not breaker.allow("https://example.com/d")
+
+
+class TestExtractorCircuitBreaker:
+    """ArticleExtractor 熔断测试类"""
+
+    def _extractor(self, **kwargs):
+        extractor = ArticleExtractor(**kwargs)
+        extractor._session = MagicMock()
+        return extractor
+
+    def test_open_circuit_skips_download(self, clock):
+        """测试熔断后不再下载该域名的文章"""
+        extractor = self._extractor(circuit_breaker=CircuitBreaker(min_calls=2, failure_rate=1.0))
+        extractor._session.get.side_effect = requests.exceptions.Timeout()
+
+        for i in range(3):
+            extractor.extract(f"https://example.com/{i}")
+
+        assert extractor._session.get.call_count == 2
+        assert extractor.circuit_breaker.state("example.com") == OPEN
+
+    def test_network_error_not_blacklisted_with_breaker(self, clock):
+        """测试配置熔断器时一次网络错误不会把域名加入黑名单"""
+        blacklist = DomainBlacklist()
+        extractor = self._extractor(blacklist=blacklist, circuit_breaker=CircuitBreaker())
+        extractor._session.get.side_effect = [requests.exceptions.Timeout(), _mock_response(ARTICLE_HTML)]
+
+        extractor.extract("https://example.com/a")
+        result = extractor.extract("https://example.com/b")
+
+        assert len(blacklist) == 0
+        assert result.success and result.extraction_method != "description-fallback"
+
+    def test_failed_blacklist_probe_reblocks_with_breaker(self, clock, monkeypatch):
+        """测试配置熔断器时，黑名单过期后的探测请求失败仍然重新拉黑"""
+        wall = [1_700_000_000.0]
+        monkeypatch.setattr("feedland_parser.domain_blacklist.time.time", lambda: wall[0])
+        blacklist = DomainBlacklist(base_ttl=60)
+        blacklist.add_to_blacklist("https://example.com/a")
+        extractor = self._extractor(blacklist=blacklist, circuit_breaker=CircuitBreaker())
+        extractor._session.get.side_effect = requests.exceptions.Timeout()
+
+        wall[0] += 61
+        extractor.extract("https://example.com/b")
+
+        assert extractor._session.get.call_count == 1
+        assert blacklist.get_blacklist_metadata()["example.com"]["block_count"] == 2
+        assert blacklist.is_blacklisted("https://example.com/c")
+
+    def test_probe_not_claimed_when_breaker_rejects(self, clock, monkeypatch):
+        """测试熔断器拒绝的请求不占用黑名单的探测名额"""
+        wall = [1_700_000_000.0]
+        monkeypatch.setattr("feedland_parser.domain_blacklist.time.time", lambda: wall[0])
+        blacklist = DomainBlacklist(base_ttl=60)
+        blacklist.add_to_blacklist("https://example.com/a")
+        breaker = CircuitBreaker(min_calls=1, cooldown=3600)
+        breaker.record_failure("https://example.com/a")
+        extractor = self._extractor(blacklist=blacklist, circuit_breaker=breaker)
+
+        wall[0] += 61
+        extractor.extract("https://example.com/b")
+
+        assert extractor._session.get.call_count == 0
+        assert not blacklist.is_probing("https://example.com/b")
+        assert not blacklist.is_blacklisted("https://example.com/c")
+
+    def test_one_strike_blacklist_without_breaker(self):
+        """测试未配置熔断器时保持一次网络错误即拉黑"""
+        blacklist = DomainBlacklist()
+        extractor = self._extractor(blacklist=blacklist)
+        extractor._session.get.side_effect = requests.exceptions.Timeout()
+
+        extractor.extract("https://example.com/a")
+
+        assert "example.com" in blacklist
+
+    def test_probe_released_on_unexpected_error(self, clock):
+        """测试探测请求抛出网络错误以外的异常时放弃探测，域名不会一直被拒绝"""
+        breaker = CircuitBreaker(min_calls=1, cooldown=30)
+        breaker.record_failure("https://example.com/a")
+        clock[0] += 31
+        extractor = self._extractor(circuit_breaker=breaker)
+        extractor._session.get.side_effect = ValueError("boom")
+
+        with pytest.raises(ValueError):
+            extractor.extract("https://example.com/b")
+
+        assert breaker.allow("https://example.com/c")
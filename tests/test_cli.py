@@ -7,7 +7,7 @@ import os
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-from feedland_parser.cli import parse_arguments, setup_logging, generate_output
+from feedland_parser.cli import parse_arguments, setup_logging, generate_output, resume_previous_run
 from feedland_parser.opml_parser import FeedInfo
 from feedland_parser.feed_parser import FeedResult
 
@@ -217,4 +217,43 @@ class TestCLI:
 
         # 确保可以反序列化
         parsed = json.loads(json_str)
-        assert len(parsed) == 1
\ No newline at end of file
+        assert len(parsed) == 1
+
+
+class TestResumePreviousRun:
+    """断点续传判断测试"""
+
+    def _filter(self, completed):
+        filter_obj = MagicMock()
+        filter_obj.completed_feeds.return_value = set(completed)
+        return filter_obj
+
+    def test_no_progress(self, tmp_path):
+        """测试上次运行正常完成时不续传"""
+        part = tmp_path / "result.jsonl.part"
+        part.write_text("{}\n")
+        filter_obj = self._filter([])
+
+        assert resume_previous_run(filter_obj, True, str(part)) is False
+        filter_obj.clear_progress.assert_not_called()
+
+    def test_resume_requested(self):
+        """测试指定 --resume 时续传"""
+        assert resume_previous_run(self._filter(["feed1"]), True, None) is True
+
+    def test_auto_resume_with_part_file(self, tmp_path):
+        """测试没有 --resume 但上次留下部分结果时自动续传，不截断已写出的文章"""
+        part = tmp_path / "result.jsonl.part"
+        part.write_text("{}\n")
+        filter_obj = self._filter(["feed1"])
+
+        assert resume_previous_run(filter_obj, False, str(part)) is True
+        filter_obj.clear_progress.assert_not_called()
+
+    def test_restart_without_part_file(self, tmp_path):
+        """测试没有部分结果时重新开始并清空运行进度"""
+        filter_obj = self._filter(["feed1"])
+
+        assert resume_previous_run(filter_obj, False, str(tmp_path / "missing.part")) is False
+        assert resume_previous_run(filter_obj, False, None) is False
+        assert filter_obj.clear_progress.call_count == 2
@@ -0,0 +1,71 @@
+"""单次遍历选择器匹配测试"""
+
+import lxml.html
+import pytest
+from lxml.cssselect import CSSSelector
+
+from feedland_parser.article_extractor import CSS_SELECTORS
+from feedland_parser.dom_matcher import SelectorSet, SimpleSelector, longest_matches
+
+
+HTML = """
+<html><body>
+  <main role="main">
+    <div id="main-content" class="content">
+      <article itemprop="articleBody" class="post-content entry-content">
+        <p>正文第一段</p><script>var ignored = "很长很长很长的脚本内容";</script>
+      </article>
+      <div class="article-body wide" data-testid="article-body"><p>较长的正文内容，比 article 更长一些</p></div>
+      <div class="my-article-body-wrapper"><p>短</p></div>
+      <section class="single-post"><!-- 注释 --><p>文章</p></section>
+    </div>
+  </main>
+</body></html>
+"""
+
+
+class TestSelectorSet:
+    """SelectorSet 测试类"""
+
+    def test_matches_same_elements_as_cssselect(self):
+        """测试匹配结果与 lxml.cssselect 一致"""
+        tree = lxml.html.document_fromstring(HTML)
+        selector_set = SelectorSet(CSS_SELECTORS)
+        elements = list(tree.iter())
+
+        for index, selector in enumerate(CSS_SELECTORS):
+            expected = set(CSSSelector(selector, translator="html")(tree))
+            actual = {e for e in elements if index in selector_set.match(e)}
+            assert actual == expected, selector
+
+    def test_compound_selector(self):
+        """测试标签、class 和属性组合"""
+        selector = SimpleSelector("div.article-body[data-testid^='article']")
+        tree = lxml.html.document_fromstring(HTML)
+
+        assert [e.get("data-testid") for e in tree.iter() if selector.matches(e)] == ["article-body"]
+
+    def test_unsupported_selector(self):
+        """测试带组合符的选择器不支持"""
+        with pytest.raises(ValueError):
+            SimpleSelector("article img")
+
+
+class TestLongestMatches:
+    """longest_matches 测试类"""
+
+    def test_longest_element_per_selector(self):
+        """测试每个选择器取文本最长的元素，不计 script 内容"""
+        tree = lxml.html.document_fromstring(HTML)
+        selector_set = SelectorSet(["div", "article", "[class*='article-body']"])
+
+        best = longest_matches(tree, selector_set)
+
+        assert best[0].get("id") == "main-content"
+        assert best[1].tag == "article"
+        assert best[2].get("data-testid") == "article-body"
+
+    def test_no_match(self):
+        """测试没有匹配时不返回该选择器"""
+        tree = lxml.html.document_fromstring("<html><body><p>x</p></body></html>")
+        assert longest_matches(tree, SelectorSet(["article"])) == {}
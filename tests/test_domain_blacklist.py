@@ -2,7 +2,7 @@
 
 import pytest
 from datetime import datetime
-from src.feedland_parser.domain_blacklist import DomainBlacklist
+from src.feedland_parser.domain_blacklist import DomainBlacklist, is_public_suffix, parse_rule
 
 
 class TestDomainBlacklist:
@@ -145,4 +145,198 @@ class TestDomainBlacklist:
 
         result = DomainBlacklist.get_domain_from_url("ftp://example.com")
         # ftp URL 也应该能提取域名
-        assert result == "example.com"
\ No newline at end of file
+        assert result == "example.com"
+
+
+class TestDomainBlacklistExpiry:
+    """黑名单过期、半开探测和持久化测试类"""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """可控制的时钟"""
+        now = [1_700_000_000.0]
+        monkeypatch.setattr("src.feedland_parser.domain_blacklist.time.time", lambda: now[0])
+        return now
+
+    def test_entry_expires_and_allows_one_probe(self, clock):
+        """测试过期后只放行一个探测请求"""
+        blacklist = DomainBlacklist(base_ttl=60)
+        blacklist.add_to_blacklist("https://example.com/a", reason="Timeout")
+        assert blacklist.is_blacklisted("https://example.com/b")
+
+        clock[0] += 61
+        assert not blacklist.is_blacklisted("https://example.com/b")
+        assert not blacklist.is_blacklisted("https://example.com/b")  # 查询不领取探测名额
+        assert blacklist.claim_probe("https://example.com/b")  # 探测请求
+        assert blacklist.is_blacklisted("https://example.com/c")  # 探测期间仍被拦截
+        assert not blacklist.claim_probe("https://example.com/c")
+
+    def test_claim_probe_without_entry(self, clock):
+        """测试不在黑名单中的域名总是可以请求，常驻和未过期的域名不能请求"""
+        blacklist = DomainBlacklist(initial_blacklist={"weixin.sogou.com"}, base_ttl=60)
+        blacklist.add_to_blacklist("https://example.com/a")
+
+        assert blacklist.claim_probe("https://test.org/a")
+        assert not blacklist.claim_probe("https://weixin.sogou.com/link")
+        assert not blacklist.claim_probe("https://example.com/b")
+        assert not blacklist.is_probing("https://example.com/b")
+
+    def test_probe_success_removes_entry(self, clock):
+        """测试探测成功后移出黑名单"""
+        blacklist = DomainBlacklist(base_ttl=60)
+        blacklist.add_to_blacklist("https://example.com/a")
+        blacklist.record_success("https://example.com/a")  # 拉黑前发出的请求，不代表已恢复
+        assert "example.com" in blacklist
+
+        clock[0] += 61
+        assert not blacklist.is_blacklisted("https://example.com/b")
+        blacklist.record_success("https://example.com/b")
+        assert len(blacklist) == 0
+        assert not blacklist.is_blacklisted("https://example.com/c")
+
+    def test_probe_failure_doubles_ttl(self, clock):
+        """测试探测失败后有效期按拉黑次数翻倍，不超过上限"""
+        blacklist = DomainBlacklist(base_ttl=60, max_ttl=200)
+        blacklist.add_to_blacklist("https://example.com/a")
+        blacklist.add_to_blacklist("https://example.com/b")  # 同时进行的请求失败，不延长有效期
+
+        clock[0] += 61
+        assert not blacklist.is_blacklisted("https://example.com/c")
+        assert blacklist.add_to_blacklist("https://example.com/c") is True
+        metadata = blacklist.get_blacklist_metadata()["example.com"]
+        assert metadata["fail_count"] == 3
+        assert metadata["block_count"] == 2
+
+        clock[0] += 119
+        assert blacklist.is_blacklisted("https://example.com/d")
+        clock[0] += 2
+        assert not blacklist.is_blacklisted("https://example.com/d")
+        blacklist.add_to_blacklist("https://example.com/d")
+        clock[0] += 199
+        assert blacklist.is_blacklisted("https://example.com/e")  # 上限 200 秒
+
+    def test_probe_timeout(self, clock):
+        """测试探测请求长时间没有结果时允许再次探测"""
+        blacklist = DomainBlacklist(base_ttl=60)
+        blacklist.add_to_blacklist("https://example.com/a")
+        clock[0] += 61
+        assert blacklist.claim_probe("https://example.com/b")
+        assert blacklist.is_blacklisted("https://example.com/c")
+        clock[0] += 121
+        assert not blacklist.is_blacklisted("https://example.com/c")
+        assert blacklist.claim_probe("https://example.com/c")
+
+    def test_initial_blacklist_never_expires(self, clock):
+        """测试常驻域名不会过期，也不会被移出"""
+        blacklist = DomainBlacklist(initial_blacklist={"weixin.sogou.com"}, base_ttl=60)
+        clock[0] += 10 ** 7
+        assert blacklist.is_blacklisted("https://weixin.sogou.com/link")
+        blacklist.record_success("https://weixin.sogou.com/link")
+        assert "weixin.sogou.com" in blacklist
+
+    def test_save_and_load(self, clock, tmp_path):
+        """测试保存到磁盘，下次运行继续生效"""
+        path = tmp_path / "state" / "blacklist.json"
+        blacklist = DomainBlacklist(initial_blacklist={"weixin.sogou.com"}, state_file=str(path), base_ttl=60)
+        blacklist.add_to_blacklist("https://example.com/a", reason="Timeout")
+        blacklist.save()
+
+        loaded = DomainBlacklist(state_file=str(path), base_ttl=60)
+        assert loaded.get_blacklist() == {"example.com"}
+        assert loaded.get_blacklist_metadata()["example.com"]["reason"] == "Timeout"
+        assert loaded.is_blacklisted("https://example.com/b")
+
+        clock[0] += 61
+        assert not loaded.is_blacklisted("https://example.com/b")  # 过期后仍然探测
+
+    def test_stale_entries_dropped_on_load(self, clock, tmp_path):
+        """测试过期很久的条目在加载时丢弃"""
+        path = tmp_path / "blacklist.json"
+        blacklist = DomainBlacklist(state_file=str(path), base_ttl=60, max_ttl=100)
+        blacklist.add_to_blacklist("https://example.com/a")
+        blacklist.save()
+
+        clock[0] += 161
+        assert len(DomainBlacklist(state_file=str(path), base_ttl=60, max_ttl=100)) == 0
+
+    def test_corrupt_state_file(self, tmp_path):
+        """测试损坏的文件不影响初始化"""
+        path = tmp_path / "blacklist.json"
+        path.write_text("{not json", encoding="utf-8")
+        assert len(DomainBlacklist(state_file=str(path))) == 0
+
+
+class TestDomainBlacklistRules:
+    """后缀规则和屏蔽列表导入测试类"""
+
+    def test_suffix_rule_matches_subdomains(self):
+        """测试后缀规则匹配域名本身及其子域名"""
+        blacklist = DomainBlacklist(initial_blacklist={"*.example.com", "exact.org"})
+
+        assert blacklist.is_blacklisted("https://example.com/a")
+        assert blacklist.is_blacklisted("https://cdn.example.com/a")
+        assert blacklist.is_blacklisted("https://a.b.EXAMPLE.com:8443/a")
+        assert blacklist.is_blacklisted("m.example.com")
+        assert not blacklist.is_blacklisted("https://notexample.com/a")
+        assert not blacklist.is_blacklisted("https://sub.exact.org/a")
+        assert blacklist.is_blacklisted("https://www.exact.org/a")
+        assert blacklist.get_blacklist() == {"*.example.com", "exact.org"}
+        assert len(blacklist) == 2
+
+    def test_parse_rule_formats(self):
+        """测试各种规则格式"""
+        assert parse_rule("example.com") == ("example.com", False)
+        assert parse_rule("*.Example.com") == ("example.com", True)
+        assert parse_rule(".example.com") == ("example.com", True)
+        assert parse_rule("||example.com^") == ("example.com", True)
+        assert parse_rule("0.0.0.0 ads.example.com  # 广告") == ("ads.example.com", False)
+        assert parse_rule("127.0.0.1\tlocalhost") is None
+        assert parse_rule("# 注释") is None
+        assert parse_rule("! adblock 注释") is None
+        assert parse_rule("||example.com/path^") is None
+
+    def test_public_suffix_rules_ignored(self):
+        """测试覆盖整个公共后缀的规则被忽略"""
+        blacklist = DomainBlacklist()
+        assert blacklist.add_rule("*.com") is False
+        assert blacklist.add_rule("*.co.uk") is False
+        assert blacklist.add_rule("*.github.io") is False
+        assert blacklist.add_rule("*.someone.github.io") is True
+        assert not blacklist.is_blacklisted("https://other.github.io/")
+        assert blacklist.is_blacklisted("https://blog.someone.github.io/")
+        assert is_public_suffix("co.uk")
+        assert not is_public_suffix("example.co.uk")
+
+    def test_load_rules_file(self, tmp_path):
+        """测试从屏蔽列表文件导入规则"""
+        path = tmp_path / "blocklist.txt"
+        path.write_text(
+            "# 共享屏蔽列表\n0.0.0.0 tracker.net\n||ads.example.org^\n*.spam.cn\n\n*.com\n",
+            encoding="utf-8"
+        )
+        blacklist = DomainBlacklist()
+
+        assert blacklist.load_rules(str(path)) == 3
+        assert blacklist.is_blacklisted("https://tracker.net/x")
+        assert blacklist.is_blacklisted("https://img.ads.example.org/x")
+        assert blacklist.is_blacklisted("https://a.spam.cn/x")
+        assert not blacklist.is_blacklisted("https://example.com/x")
+        assert blacklist.load_rules(str(tmp_path / "missing.txt")) == 0
+
+    def test_lookup_independent_of_rule_count(self):
+        """测试大量规则时查找仍然正确"""
+        blacklist = DomainBlacklist()
+        blacklist.add_rules(f"*.site{i}.com" for i in range(20000))
+
+        assert len(blacklist) == 20000
+        assert blacklist.is_blacklisted("https://a.b.site19999.com/x")
+        assert not blacklist.is_blacklisted("https://site20000.com/x")
+
+    def test_rules_not_persisted(self, tmp_path):
+        """测试常驻规则不写入状态文件"""
+        path = tmp_path / "blacklist.json"
+        blacklist = DomainBlacklist(initial_blacklist={"*.example.com", "exact.org"}, state_file=str(path))
+        blacklist.add_to_blacklist("https://dead.net/a")
+        blacklist.save()
+
+        assert DomainBlacklist(state_file=str(path)).get_blacklist() == {"dead.net"}
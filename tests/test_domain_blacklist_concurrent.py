@@ -149,3 +149,70 @@ class TestDomainBlacklistConcurrent:
 
         # 所有长度检查都应该在 0-50 之间
         assert all(0 <= length <= 50 for length in results["lengths"])
+
+    def test_lookup_does_not_take_lock(self):
+        """测试查询不加锁：写锁被占用时查询仍然立即返回"""
+        blacklist = DomainBlacklist(initial_blacklist={"weixin.sogou.com", "*.example.org"})
+        blacklist.add_to_blacklist("https://dead.com/a")
+        results = []
+
+        def lookup():
+            for url in ("https://dead.com/b", "https://weixin.sogou.com/c", "https://cdn.example.org/d",
+                        "https://alive.com/e"):
+                results.append(blacklist.is_blacklisted(url))
+            results.append(len(blacklist))
+
+        with blacklist._lock:
+            thread = threading.Thread(target=lookup)
+            thread.start()
+            thread.join(timeout=2)
+            assert not thread.is_alive()
+
+        assert results == [True, True, True, False, 3]
+
+    def test_record_success_for_unlisted_domain_does_not_take_lock(self):
+        """测试不在黑名单中的域名记录成功时不加锁"""
+        blacklist = DomainBlacklist(initial_blacklist={"weixin.sogou.com"})
+        blacklist.add_to_blacklist("https://dead.com/a")
+
+        def record():
+            blacklist.record_success("https://alive.com/a")
+            blacklist.record_success("https://weixin.sogou.com/b")
+
+        with blacklist._lock:
+            thread = threading.Thread(target=record)
+            thread.start()
+            thread.join(timeout=2)
+            assert not thread.is_alive()
+
+        blacklist.record_success("https://dead.com/b")  # 未过期：拉黑前发出的请求
+        assert blacklist.get_blacklist() == {"weixin.sogou.com", "dead.com"}
+
+    def test_readers_see_published_snapshots_in_order(self):
+        """测试快照按写入顺序原子发布：看到第 i 个域名时前面的域名都可见"""
+        blacklist = DomainBlacklist()
+        count = 300
+        done = threading.Event()
+        violations = []
+
+        def write():
+            for i in range(count):
+                blacklist.add_to_blacklist(f"https://site{i}.com/a")
+            done.set()
+
+        def read():
+            while not done.is_set():
+                # 从后往前查询：后写入的域名可见时，之后查询的前面的域名必须可见
+                visible = [blacklist.is_blacklisted(f"site{i}.com") for i in range(count - 1, -1, -30)]
+                if visible != sorted(visible):
+                    violations.append(visible)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        writer = threading.Thread(target=write)
+        for t in readers + [writer]:
+            t.start()
+        for t in readers + [writer]:
+            t.join()
+
+        assert violations == []
+        assert len(blacklist) == count
@@ -0,0 +1,244 @@
+"""FeedParser 单元测试（不访问网络）"""
+
+import pytest
+import json
+import tempfile
+import os
+import requests
+from unittest.mock import MagicMock
+
+from feedland_parser.article_extractor import ArticleContent, ArticleExtractor
+from feedland_parser.feed_parser import FeedParser
+from feedland_parser.filter import Filter
+from feedland_parser.config import Config
+from feedland_parser.opml_parser import FeedInfo
+from feedland_parser.parallel_processor import ParallelFeedProcessor
+
+
+RSS_XML = b"""<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0"><channel><title>Example</title>
+<item><title>Post</title><link>https://example.com/post</link>
+<pubDate>Mon, 10 Feb 2025 10:00:00 GMT</pubDate></item>
+</channel></rss>"""
+
+
+def _mock_response(status_code: int = 200, content: bytes = b"", headers: dict = None):
+    """构造一个模拟的 requests.Response"""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    response.url = "https://example.com/feed.xml"
+    response.headers.update(headers or {})
+    return response
+
+
+class TestConditionalGet:
+    """条件请求（ETag / Last-Modified）测试"""
+
+    @pytest.fixture
+    def filter_obj(self):
+        """创建带校验信息的 Filter"""
+        config_data = {
+            "url": "https://test.com/opml",
+            "his": {"https://example.com/feed.xml": "2025-02-09T10:00:00"},
+            "his_validators": {
+                "https://example.com/feed.xml": {"etag": '"v1"', "modified": "Sun, 09 Feb 2025 10:00:00 GMT"}
+            },
+        }
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump(config_data, f)
+            temp_file = f.name
+
+        config = Config(temp_file)
+        config.load()
+        filter_obj = Filter(config)
+        filter_obj.load_history()
+
+        yield filter_obj
+
+        os.unlink(temp_file)
+
+    @pytest.fixture
+    def feed_info(self):
+        return FeedInfo(url="https://example.com/feed.xml", title="Example", feed_type="RSS")
+
+    def test_validators_sent(self, filter_obj, feed_info):
+        """测试请求时带上保存的校验信息"""
+        parser = FeedParser(MagicMock(), filter_obj)
+        parser._session = MagicMock()
+        parser._session.get.return_value = _mock_response(304)
+
+        parser.parse_feed(feed_info)
+
+        headers = parser._session.get.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == '"v1"'
+        assert headers["If-Modified-Since"] == "Sun, 09 Feb 2025 10:00:00 GMT"
+
+    def test_not_modified_skips_articles(self, filter_obj, feed_info):
+        """测试 304 时直接返回空结果，不解析文章"""
+        parser = FeedParser(MagicMock(), filter_obj)
+        parser._session = MagicMock()
+        parser._session.get.return_value = _mock_response(304)
+        parser._parse_articles = MagicMock()
+
+        result = parser.parse_feed(feed_info)
+
+        assert result.success
+        assert result.not_modified
+        assert result.articles == []
+        parser._parse_articles.assert_not_called()
+
+    def test_new_validators_saved(self, filter_obj, feed_info):
+        """测试成功解析后保存新的校验信息"""
+        parser = FeedParser(MagicMock(), filter_obj)
+        parser._session = MagicMock()
+        parser._session.get.return_value = _mock_response(200, RSS_XML, {
+            "ETag": '"v2"', "Last-Modified": "Mon, 10 Feb 2025 10:00:00 GMT"
+        })
+        parser._parse_articles = MagicMock(return_value=([], 0))
+
+        processor = ParallelFeedProcessor(parser, filter_obj, max_workers=1)
+        result = processor._process_single_feed(feed_info)
+
+        assert result.etag == '"v2"'
+        assert filter_obj.get_validators(feed_info.url) == {"etag": '"v2"', "modified": "Mon, 10 Feb 2025 10:00:00 GMT"}
+
+    def test_validators_kept_when_all_extractions_fail(self, filter_obj, feed_info):
+        """测试条目全部提取失败（历史记录未前进）时不保存新的校验信息，下次运行重新获取"""
+        old_validators = filter_obj.get_validators(feed_info.url)
+        parser = FeedParser(MagicMock(), filter_obj)
+        parser._session = MagicMock()
+        parser._session.get.return_value = _mock_response(200, RSS_XML, {"ETag": '"v2"'})
+        parser.article_extractor.extract.return_value = ArticleContent(
+            title="t", url="u", published=None, author=None, content="", success=False, extraction_method="failed"
+        )
+
+        processor = ParallelFeedProcessor(parser, filter_obj, max_workers=1)
+        result = processor._process_single_feed(feed_info)
+
+        assert result.success and result.failed_articles > 0 and not result.articles
+        assert filter_obj.get_validators(feed_info.url) == old_validators
+
+
+class TestFeedFetch:
+    """通过共享会话获取 feed 测试"""
+
+    def test_feed_parsed_from_downloaded_bytes(self):
+        """测试下载的字节交给 feedparser 解析"""
+        parser = FeedParser(MagicMock(), None)
+        parser._session = MagicMock()
+        parser._session.get.return_value = _mock_response(200, RSS_XML, {"Content-Type": "application/rss+xml"})
+
+        feed = parser._fetch_feed_with_retry("https://example.com/feed.xml")
+
+        assert feed.status == 200
+        assert feed.entries[0].link == "https://example.com/post"
+        assert parser._session.get.call_args.kwargs["timeout"] == (3, 10)
+
+    def test_timeout_not_retried(self):
+        """测试超时不重试"""
+        parser = FeedParser(MagicMock(), None)
+        parser._session = MagicMock()
+        parser._session.get.side_effect = requests.exceptions.Timeout()
+
+        assert parser._fetch_feed_with_retry("https://example.com/feed.xml") is None
+        assert parser._session.get.call_count == 1
+
+    def test_http_error_retried(self):
+        """测试 HTTP 错误重试后返回 None"""
+        parser = FeedParser(MagicMock(), None, max_retries=2)
+        parser._session = MagicMock()
+        parser._session.get.return_value = _mock_response(503)
+
+        assert parser._fetch_feed_with_retry("https://example.com/feed.xml") is None
+        assert parser._session.get.call_count == 2
+
+    def test_fetch_article_jobs(self):
+        """测试流水线第一阶段只生成待提取的文章"""
+        extractor = MagicMock()
+        parser = FeedParser(extractor, None)
+        parser._session = MagicMock()
+        parser._session.get.return_value = _mock_response(200, RSS_XML, {"ETag": '"v1"'})
+
+        result, jobs = parser.fetch_article_jobs(FeedInfo(url="https://example.com/feed.xml", title="Example", feed_type="RSS"))
+
+        assert result.success and result.etag == '"v1"'
+        assert [job.url for job in jobs] == ["https://example.com/post"]
+        extractor.extract.assert_not_called()
+
+
+FULL_TEXT = "这是一段 feed 内嵌的完整正文内容，长度足够判定为全文，不需要再下载文章页面。" * 30
+
+FULL_TEXT_RSS = f"""<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">
+<channel><title>Example</title>
+<item><title>Post</title><link>https://example.com/post</link>
+<pubDate>Mon, 10 Feb 2025 10:00:00 GMT</pubDate>
+<description>摘要</description>
+<content:encoded><![CDATA[<p>{FULL_TEXT}</p><img src="https://example.com/a.jpg" width="800" height="600">]]></content:encoded>
+</item></channel></rss>""".encode("utf-8")
+
+
+class TestFeedFullText:
+    """feed 自带全文时跳过文章下载测试"""
+
+    @pytest.fixture
+    def filter_obj(self):
+        """创建空历史记录的 Filter"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump({"url": "https://test.com/opml", "his": {}}, f)
+            temp_file = f.name
+
+        config = Config(temp_file)
+        config.load()
+        filter_obj = Filter(config)
+        filter_obj.load_history()
+
+        yield filter_obj
+
+        os.unlink(temp_file)
+
+    @pytest.fixture
+    def feed_info(self):
+        return FeedInfo(url="https://example.com/feed.xml", title="Example", feed_type="RSS")
+
+    def _parse(self, filter_obj, feed_info, **kwargs):
+        """解析 FULL_TEXT_RSS，返回结果和文章下载使用的会话"""
+        extractor = ArticleExtractor()
+        extractor._session = MagicMock()
+        extractor._session.get.side_effect = requests.exceptions.ConnectionError()
+        parser = FeedParser(extractor, filter_obj, **kwargs)
+        parser._session = MagicMock()
+        parser._session.get.return_value = _mock_response(200, FULL_TEXT_RSS, {"Content-Type": "application/rss+xml"})
+        return parser.parse_feed(feed_info), extractor._session
+
+    def test_full_text_used_without_request(self, filter_obj, feed_info):
+        """测试内嵌全文直接生成文章，不请求文章页面"""
+        result, session = self._parse(filter_obj, feed_info)
+
+        article = result.articles[0]
+        assert FULL_TEXT[:20] in article["content"]
+        assert article["images"] == ["https://example.com/a.jpg"]
+        session.get.assert_not_called()
+
+    def test_disabled_downloads_page(self, filter_obj, feed_info):
+        """测试关闭后仍然下载文章页面"""
+        _, session = self._parse(filter_obj, feed_info, feed_full_text=False)
+
+        session.get.assert_called_once()
+
+    def test_per_feed_override(self, filter_obj, feed_info):
+        """测试按 feed 覆盖全局设置"""
+        _, session = self._parse(filter_obj, feed_info, full_text_overrides={feed_info.url: False})
+        session.get.assert_called_once()
+
+        result, session = self._parse(filter_obj, feed_info, feed_full_text=False,
+                                      full_text_overrides={feed_info.url: True})
+        assert FULL_TEXT[:20] in result.articles[0]["content"]
+        session.get.assert_not_called()
+
+    def test_short_content_downloads_page(self, filter_obj, feed_info):
+        """测试内嵌内容不够长时下载文章页面"""
+        _, session = self._parse(filter_obj, feed_info, full_text_min_length=100000)
+
+        session.get.assert_called_once()
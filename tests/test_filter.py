@@ -313,4 +313,64 @@ class TestFilter:
         assert len(results) == 3
         # 验证最终值
         assert filter_obj._history["feed1"] == "2025-02-10T11:00:00Z"  # 最后更新的值
-        assert filter_obj._history["feed2"] == "2025-02-10T12:00:00Z"
\ No newline at end of file
+        assert filter_obj._history["feed2"] == "2025-02-10T12:00:00Z"
+
+    def test_update_and_get_validators(self, filter_obj):
+        """测试更新和获取 feed 缓存校验信息"""
+        filter_obj.update_validators("https://test.com/feed.xml", etag='"abc"', modified="Mon, 10 Feb 2025 12:00:00 GMT")
+
+        validators = filter_obj.get_validators("https://test.com/feed.xml")
+        assert validators == {"etag": '"abc"', "modified": "Mon, 10 Feb 2025 12:00:00 GMT"}
+        assert filter_obj.get_validators("https://not-exist.com/feed.xml") == {}
+
+    def test_update_validators_empty_removes(self, filter_obj):
+        """测试没有校验信息时移除记录"""
+        filter_obj.update_validators("https://test.com/feed.xml", etag='"abc"')
+        filter_obj.update_validators("https://test.com/feed.xml")
+        assert filter_obj.get_validators("https://test.com/feed.xml") == {}
+
+    def test_save_and_load_validators(self, filter_obj):
+        """测试校验信息与历史记录一起保存"""
+        filter_obj.load_history()
+        filter_obj.update_validators("https://example.com/feed1.xml", etag='"v1"')
+        filter_obj.save_history()
+
+        new_filter = Filter(filter_obj.config)
+        new_filter.load_history()
+        assert new_filter.get_validators("https://example.com/feed1.xml") == {"etag": '"v1"'}
+
+    def test_clear_history_clears_validators(self, filter_obj):
+        """测试清空历史记录同时清空校验信息"""
+        filter_obj.update_validators("https://test.com/feed.xml", etag='"abc"')
+        filter_obj.clear_history()
+        assert filter_obj.get_validators("https://test.com/feed.xml") == {}
+
+    def test_checkpoint_saves_only_completed_feeds(self, filter_obj):
+        """测试检查点只保存已完成 feed 的新记录，并记录运行进度"""
+        filter_obj.load_history()
+        done, running = "https://example.com/feed1.xml", "https://example.com/feed2.xml"
+        filter_obj.update_id(done, "2025-02-10T10:00:00Z")
+        filter_obj.update_id(running, "2025-02-10T11:00:00Z")
+        filter_obj.mark_completed(done)
+        filter_obj.save_history(completed_only=True)
+
+        with open(filter_obj.config.config_path, encoding="utf-8") as f:
+            saved = json.load(f)
+        assert saved["his"][done] == "2025-02-10T10:00:00Z"
+        assert saved["his"][running] == "2025-02-09T09:00:00Z"
+        assert saved["his_run"] == {"completed": [done]}
+
+        resumed = Filter(Config(filter_obj.config.config_path))
+        resumed.config.load()
+        resumed.load_history()
+        assert resumed.completed_feeds() == {done}
+
+    def test_clear_progress_removes_run(self, filter_obj):
+        """测试运行完成后不再保存运行进度"""
+        filter_obj.load_history()
+        filter_obj.mark_completed("https://example.com/feed1.xml")
+        filter_obj.clear_progress()
+        filter_obj.save_history()
+
+        with open(filter_obj.config.config_path, encoding="utf-8") as f:
+            assert "his_run" not in json.load(f)
@@ -0,0 +1,165 @@
+"""历史记录存储测试"""
+
+import json
+import sqlite3
+
+import pytest
+
+from feedland_parser.config import Config
+from feedland_parser.filter import Filter
+from feedland_parser.history_store import (
+    HistoryMigrationError, JsonHistoryStore, SqliteHistoryStore, open_history_store
+)
+
+
+@pytest.fixture
+def config(tmp_path):
+    """包含旧版历史记录的配置文件"""
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps({
+        "url": "https://test.com/opml",
+        "his": {"https://a.com/feed": "2025-02-09T10:00:00Z"},
+        "his_validators": {"https://a.com/feed": {"etag": '"v1"'}},
+    }), encoding="utf-8")
+    config = Config(str(path))
+    config.load()
+    config.history_db = str(tmp_path / "state" / "history.db")
+    return config
+
+
+class TestSqliteHistoryStore:
+    """SqliteHistoryStore 测试类"""
+
+    def test_write_and_load(self, tmp_path):
+        """测试增量写入、删除和运行进度"""
+        store = SqliteHistoryStore(str(tmp_path / "history.db"))
+        store.write(
+            {"https://a.com/feed": "1", "https://b.com/feed": "2"},
+            {"https://a.com/feed": {"etag": '"x"', "modified": "Mon, 10 Feb 2025 10:00:00 GMT"}},
+            completed=["https://a.com/feed"]
+        )
+        store.write({"https://b.com/feed": None, "https://a.com/feed": "3"}, {"https://a.com/feed": {"etag": '"y"'}})
+
+        state = store.load()
+        assert state.history == {"https://a.com/feed": "3"}
+        assert state.validators == {"https://a.com/feed": {"etag": '"y"'}}
+        assert state.completed == {"https://a.com/feed"}
+
+        store.write({}, {}, completed=["https://b.com/feed"], clear_run=True)
+        assert store.load().completed == {"https://b.com/feed"}
+        store.close()
+
+    def test_wal_mode_and_concurrent_reader(self, tmp_path):
+        """测试使用 WAL 模式，写入时其他连接可以读取"""
+        path = str(tmp_path / "history.db")
+        store = SqliteHistoryStore(path)
+        store.write({"https://a.com/feed": "1"}, {})
+
+        reader = sqlite3.connect(path)
+        assert reader.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        reader.execute("BEGIN")
+        assert reader.execute("SELECT last_id FROM history").fetchall() == [("1",)]
+
+        store.write({"https://a.com/feed": "2"}, {})  # 读事务未结束时仍可写入
+        reader.rollback()
+        assert reader.execute("SELECT last_id FROM history").fetchall() == [("2",)]
+        reader.close()
+        store.close()
+
+    def test_migrate_from_config(self, config):
+        """测试首次打开时把 config.json 中的历史记录迁移到数据库"""
+        store = open_history_store(config)
+
+        state = store.load()
+        assert state.history == {"https://a.com/feed": "2025-02-09T10:00:00Z"}
+        assert state.validators == {"https://a.com/feed": {"etag": '"v1"'}}
+        with open(config.config_path, encoding="utf-8") as f:
+            saved = json.load(f)
+        assert "his" not in saved and "his_validators" not in saved
+        assert saved["url"] == "https://test.com/opml"
+        store.close()
+
+    def test_migration_refused_when_db_has_records(self, config):
+        """测试数据库已有记录时拒绝迁移（不静默忽略），数据库和配置文件保持不变"""
+        store = SqliteHistoryStore(config.history_db)
+        store.write({"https://a.com/feed": "newer"}, {})
+
+        with pytest.raises(HistoryMigrationError):
+            store.migrate_from(config)
+        assert store.load().history == {"https://a.com/feed": "newer"}
+        assert "his" in config
+        store.close()
+
+        with pytest.raises(HistoryMigrationError):
+            open_history_store(config)
+
+    def test_default_db_per_config_file(self, tmp_path):
+        """测试默认数据库与配置文件放在一起，不同配置文件互不影响"""
+        stores = []
+        for name in ("a", "b"):
+            path = tmp_path / name / "config.json"
+            path.parent.mkdir()
+            path.write_text(json.dumps({"url": "https://test.com/opml"}), encoding="utf-8")
+            config = Config(str(path))
+            config.load()
+            assert config.history_db == str(tmp_path / name / "config.history.db")
+            stores.append(open_history_store(config))
+
+        stores[0].write({"https://shared.com/feed": "a"}, {}, completed=["https://shared.com/feed"])
+        stores[1].write({"https://shared.com/feed": "b"}, {})
+
+        assert stores[0].load().history == {"https://shared.com/feed": "a"}
+        assert stores[1].load().completed == set()
+        for store in stores:
+            store.close()
+
+    def test_json_backend(self, config):
+        """测试 json 存储保留在配置文件中"""
+        config.history_backend = "json"
+        store = open_history_store(config)
+        assert isinstance(store, JsonHistoryStore)
+        assert store.load().history == {"https://a.com/feed": "2025-02-09T10:00:00Z"}
+
+
+class TestFilterWithSqliteStore:
+    """Filter 使用 SQLite 存储测试类"""
+
+    def test_only_changed_feeds_written(self, config, monkeypatch):
+        """测试只写入有变化的 feed"""
+        store = open_history_store(config)
+        filter_obj = Filter(config, store=store)
+        filter_obj.load_history()
+        filter_obj.update_id("https://b.com/feed", "2025-02-10T10:00:00Z")
+        filter_obj.update_validators("https://a.com/feed", etag='"v1"')  # 没有变化
+
+        writes = []
+        write = store.write
+        monkeypatch.setattr(store, "write", lambda *args, **kwargs: (writes.append(args), write(*args, **kwargs)))
+        filter_obj.save_history()
+        filter_obj.save_history()
+
+        assert writes[0][0] == {"https://b.com/feed": "2025-02-10T10:00:00Z"}
+        assert writes[1][0] == {}
+        assert Filter(config, store=store).load_history()["https://b.com/feed"] == "2025-02-10T10:00:00Z"
+        store.close()
+
+    def test_checkpoint_and_resume(self, config):
+        """测试检查点只写入已完成的 feed，重新加载后可以续传"""
+        store = open_history_store(config)
+        filter_obj = Filter(config, store=store)
+        filter_obj.load_history()
+        filter_obj.update_id("https://a.com/feed", "done")
+        filter_obj.update_id("https://b.com/feed", "running")
+        filter_obj.mark_completed("https://a.com/feed")
+        filter_obj.save_history(completed_only=True)
+
+        resumed = Filter(config, store=store)
+        history = resumed.load_history()
+        assert history == {"https://a.com/feed": "done"}
+        assert resumed.completed_feeds() == {"https://a.com/feed"}
+
+        filter_obj.clear_progress()
+        filter_obj.save_history()
+        assert store.load().completed == set()
+        assert store.load().history["https://b.com/feed"] == "running"
+        store.close()
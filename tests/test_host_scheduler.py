@@ -0,0 +1,87 @@
+"""主机调度器测试"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from feedland_parser.host_scheduler import HostScheduler
+
+
+class TestHostScheduler:
+    """HostScheduler 测试类"""
+
+    def test_get_host(self):
+        """测试主机名提取"""
+        assert HostScheduler.get_host("https://Example.com:8080/a?b=1") == "example.com"
+        assert HostScheduler.get_host("not a url") == ""
+
+    def test_max_in_flight_threads(self):
+        """测试多线程下同一主机并发数不超过上限"""
+        scheduler = HostScheduler(max_in_flight=2)
+        lock = threading.Lock()
+        state = {"current": 0, "peak": 0}
+
+        def request():
+            with scheduler.slot("https://example.com/article"):
+                with lock:
+                    state["current"] += 1
+                    state["peak"] = max(state["peak"], state["current"])
+                time.sleep(0.02)
+                with lock:
+                    state["current"] -= 1
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for future in [executor.submit(request) for _ in range(16)]:
+                future.result()
+
+        assert state["peak"] == 2
+        assert scheduler.in_flight("example.com") == 0
+
+    def test_hosts_are_independent(self):
+        """测试不同主机互不影响"""
+        scheduler = HostScheduler(max_in_flight=1)
+        host_a = scheduler.acquire("https://a.com/1")
+        start = time.monotonic()
+        host_b = scheduler.acquire("https://b.com/1")
+
+        assert time.monotonic() - start < 0.1
+        scheduler.release(host_a)
+        scheduler.release(host_b)
+
+    def test_min_interval(self):
+        """测试同一主机请求间隔"""
+        scheduler = HostScheduler(max_in_flight=5, min_interval=0.05)
+        starts = []
+
+        for _ in range(3):
+            with scheduler.slot("https://example.com/a"):
+                starts.append(time.monotonic())
+
+        gaps = [b - a for a, b in zip(starts, starts[1:])]
+        assert all(gap >= 0.045 for gap in gaps)
+
+    def test_invalid_url_not_limited(self):
+        """测试无法解析主机的 URL 不受限制"""
+        scheduler = HostScheduler(max_in_flight=1)
+        with scheduler.slot("invalid"):
+            with scheduler.slot("invalid"):
+                pass
+
+    def test_async_slot(self):
+        """测试异步模式下的并发限制"""
+        scheduler = HostScheduler(max_in_flight=1)
+        state = {"current": 0, "peak": 0}
+
+        async def request():
+            async with scheduler.slot_async("https://example.com/a"):
+                state["current"] += 1
+                state["peak"] = max(state["peak"], state["current"])
+                await asyncio.sleep(0.01)
+                state["current"] -= 1
+
+        async def main():
+            await asyncio.gather(*(request() for _ in range(5)))
+
+        asyncio.run(main())
+        assert state["peak"] == 1
@@ -0,0 +1,165 @@
+"""HTTP 响应磁盘缓存测试"""
+
+import os
+import time
+from email.utils import formatdate
+from unittest.mock import MagicMock
+
+import requests
+
+from feedland_parser.article_extractor import ArticleExtractor
+from feedland_parser.http_cache import HttpCache, freshness_lifetime
+
+
+HTML = ("<html><body><article><p>" + "这是一段用于测试 HTTP 缓存的正文内容，长度足够。" * 20 + "</p></article></body></html>").encode("utf-8")
+
+
+def _mock_response(status_code: int = 200, content: bytes = HTML, headers: dict = None):
+    """构造一个模拟的 requests.Response"""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    response.url = "https://example.com/a"
+    response.encoding = "utf-8"
+    response.headers.update(headers or {})
+    return response
+
+
+class TestFreshness:
+    """缓存有效期计算测试"""
+
+    def test_cache_control(self):
+        """测试 Cache-Control 指令"""
+        assert freshness_lifetime({"Cache-Control": "public, max-age=600"}) == 600
+        assert freshness_lifetime({"cache-control": "no-cache"}) == 0
+        assert freshness_lifetime({"Cache-Control": "no-store, max-age=600"}) is None
+
+    def test_expires(self):
+        """测试 Expires 和默认有效期"""
+        lifetime = freshness_lifetime({"Expires": formatdate(time.time() + 100, usegmt=True)})
+        assert 90 < lifetime <= 100
+        assert freshness_lifetime({"Expires": "invalid"}) == 0
+        assert freshness_lifetime({}, default_ttl=30) == 30
+
+
+class TestHttpCache:
+    """HttpCache 测试类"""
+
+    def test_put_and_get(self, tmp_path):
+        """测试保存和读取"""
+        cache = HttpCache(str(tmp_path))
+        assert cache.put("https://example.com/a", 200, {"Cache-Control": "max-age=60"}, b"body", "utf-8")
+
+        cached = cache.get("https://example.com/a")
+        assert cached.content == b"body"
+        assert cached.fresh
+        assert cached.entry.encoding == "utf-8"
+        assert cache.get("https://example.com/b") is None
+
+    def test_uncacheable_responses_skipped(self, tmp_path):
+        """测试不可缓存或无法复用的响应不保存"""
+        cache = HttpCache(str(tmp_path))
+
+        assert not cache.put("https://example.com/a", 200, {"Cache-Control": "no-store"}, b"body")
+        assert not cache.put("https://example.com/a", 404, {"Cache-Control": "max-age=60"}, b"body")
+        assert not cache.put("https://example.com/a", 200, {}, b"body")
+        assert cache.put("https://example.com/a", 200, {"ETag": '"v1"'}, b"body")
+        assert not cache.get("https://example.com/a").fresh
+
+    def test_identical_bodies_stored_once(self, tmp_path):
+        """测试相同内容只保存一份"""
+        cache = HttpCache(str(tmp_path))
+        cache.put("https://example.com/a", 200, {"ETag": '"a"'}, b"same")
+        cache.put("https://example.com/b", 200, {"ETag": '"b"'}, b"same")
+
+        assert len(cache) == 2
+        assert cache.total_size == 4
+
+    def test_put_same_content_twice(self, tmp_path):
+        """测试同一 URL 以相同内容再次保存（内容未变的刷新）后仍可读取"""
+        cache = HttpCache(str(tmp_path))
+        cache.put("https://example.com/a", 200, {"ETag": '"v1"'}, b"body")
+        assert cache.put("https://example.com/a", 200, {"ETag": '"v2"', "Cache-Control": "max-age=60"}, b"body")
+
+        cached = cache.get("https://example.com/a")
+        assert cached.content == b"body"
+        assert cached.entry.etag == '"v2"'
+        assert len(cache) == 1
+        assert cache.total_size == 4
+
+    def test_put_changed_content_removes_old_body(self, tmp_path):
+        """测试同一 URL 内容变化后删除旧内容文件"""
+        cache = HttpCache(str(tmp_path))
+        cache.put("https://example.com/a", 200, {"ETag": '"v1"'}, b"old")
+        cache.put("https://example.com/a", 200, {"ETag": '"v2"'}, b"new body")
+
+        assert cache.get("https://example.com/a").content == b"new body"
+        assert cache.total_size == 8
+        bodies = [f for _, _, files in os.walk(tmp_path / "bodies") for f in files]
+        assert len(bodies) == 1
+
+    def test_lru_eviction(self, tmp_path):
+        """测试超过大小上限时淘汰最近最少使用的条目"""
+        cache = HttpCache(str(tmp_path), max_size=10)
+        cache.put("https://example.com/a", 200, {"ETag": '"a"'}, b"aaaa")
+        cache.put("https://example.com/b", 200, {"ETag": '"b"'}, b"bbbb")
+        cache.get("https://example.com/a")
+        cache.put("https://example.com/c", 200, {"ETag": '"c"'}, b"cccc")
+
+        assert cache.get("https://example.com/b") is None
+        assert cache.get("https://example.com/a").content == b"aaaa"
+        assert cache.total_size == 8
+        bodies = [f for _, _, files in os.walk(tmp_path / "bodies") for f in files]
+        assert len(bodies) == 2
+
+    def test_index_persisted(self, tmp_path):
+        """测试索引保存后可以重新加载"""
+        cache = HttpCache(str(tmp_path))
+        cache.put("https://example.com/a", 200, {"ETag": '"v1"'}, b"body")
+        cache.close()
+
+        reloaded = HttpCache(str(tmp_path))
+        cached = reloaded.get("https://example.com/a")
+        assert cached.content == b"body"
+        assert cached.entry.etag == '"v1"'
+
+    def test_refresh(self, tmp_path):
+        """测试重新验证后更新有效期"""
+        cache = HttpCache(str(tmp_path))
+        cache.put("https://example.com/a", 200, {"ETag": '"v1"'}, b"body")
+        cache.refresh("https://example.com/a", {"Cache-Control": "max-age=60"})
+
+        assert cache.get("https://example.com/a").fresh
+
+
+class TestExtractorCache:
+    """文章下载使用缓存测试"""
+
+    def test_fresh_cache_skips_request(self, tmp_path):
+        """测试缓存有效期内不发起请求"""
+        extractor = ArticleExtractor(http_cache=HttpCache(str(tmp_path)))
+        extractor._session = MagicMock()
+        extractor._session.get.return_value = _mock_response(headers={"Cache-Control": "max-age=600"})
+
+        first = extractor._fetch_page("https://example.com/a")
+        second = extractor._fetch_page("https://example.com/a")
+
+        assert extractor._session.get.call_count == 1
+        assert second.fetcher == "cache"
+        assert second.text == first.text
+
+    def test_stale_cache_revalidated(self, tmp_path):
+        """测试过期缓存使用条件请求重新验证，304 时复用缓存内容"""
+        extractor = ArticleExtractor(http_cache=HttpCache(str(tmp_path)))
+        extractor._session = MagicMock()
+        extractor._session.get.side_effect = [
+            _mock_response(headers={"ETag": '"v1"'}),
+            _mock_response(304, b""),
+        ]
+
+        first = extractor._fetch_page("https://example.com/a")
+        second = extractor._fetch_page("https://example.com/a")
+
+        assert extractor._session.get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+        assert second.ok
+        assert second.text == first.text
@@ -0,0 +1,146 @@
+"""按域名自适应超时测试"""
+
+import json
+from unittest.mock import MagicMock
+
+import requests
+
+from feedland_parser.article_extractor import ArticleExtractor
+from feedland_parser.circuit_breaker import CLOSED, OPEN, CircuitBreaker
+from feedland_parser.latency_tracker import LatencyTracker
+
+from .test_article_extractor import ARTICLE_HTML, _mock_response
+
+DEFAULT = (3, 10)
+
+
+class TestLatencyTracker:
+    """LatencyTracker 测试类"""
+
+    def test_default_until_enough_samples(self):
+        """测试样本不足时使用默认超时"""
+        tracker = LatencyTracker(min_samples=3)
+        tracker.record("https://example.com/a", 0.2)
+        tracker.record("https://example.com/b", 0.2)
+        assert tracker.timeout_for("https://example.com/c", DEFAULT) == DEFAULT
+        assert tracker.timeout_for("https://other.com/c", DEFAULT) == DEFAULT
+
+    def test_fast_host_gets_short_timeout(self):
+        """测试响应快的域名使用较短的超时（不低于下限）"""
+        tracker = LatencyTracker(min_timeout=2, max_timeout=30)
+        for _ in range(10):
+            tracker.record("https://fast.com/a", 0.3)
+        assert tracker.timeout_for("https://www.fast.com/b", DEFAULT) == (2, 2)
+
+    def test_slow_host_gets_longer_timeout(self):
+        """测试响应慢但正常的域名超时超过默认值（不超过上限）"""
+        tracker = LatencyTracker(min_timeout=2, max_timeout=30)
+        for elapsed in (8, 9, 11, 9, 10):
+            tracker.record("https://slow.com/a", elapsed)
+        connect, read = tracker.timeout_for("https://slow.com/b", DEFAULT)
+        assert connect == 3
+        assert 11 * 1.5 <= read <= 30
+
+        tracker.record("https://slow.com/c", 100)
+        assert tracker.timeout_for("https://slow.com/b", DEFAULT)[1] == 30
+
+    def test_timeout_raises_estimate(self):
+        """测试超时后下一次的超时增大"""
+        tracker = LatencyTracker(min_timeout=1, max_timeout=30)
+        for _ in range(5):
+            tracker.record("https://example.com/a", 1.0)
+        before = tracker.timeout_for("https://example.com/a", DEFAULT)[1]
+        tracker.record_timeout("https://example.com/a", before)
+        assert tracker.timeout_for("https://example.com/a", DEFAULT)[1] > before
+
+    def test_save_and_load(self, tmp_path):
+        """测试保存到磁盘，长时间没有访问的域名在加载时丢弃"""
+        path = tmp_path / "state" / "latency.json"
+        tracker = LatencyTracker(state_file=str(path))
+        for _ in range(5):
+            tracker.record("https://example.com/a", 0.5)
+        tracker.record("https://stale.com/a", 0.5)
+        tracker.save()
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+        data["stale.com"]["updated_at"] = 0
+        path.write_text(json.dumps(data), encoding="utf-8")
+
+        loaded = LatencyTracker(state_file=str(path))
+        assert len(loaded) == 1
+        assert loaded.timeout_for("https://example.com/b", DEFAULT) == tracker.timeout_for(
+            "https://example.com/b", DEFAULT
+        )
+
+
+class TestExtractorAdaptiveTimeout:
+    """ArticleExtractor 自适应超时测试类"""
+
+    def _extractor(self, tracker):
+        extractor = ArticleExtractor(latency_tracker=tracker)
+        extractor._session = MagicMock()
+        return extractor
+
+    def test_request_uses_derived_timeout(self):
+        """测试请求使用按域名推导的超时，并记录耗时"""
+        tracker = LatencyTracker(min_timeout=2)
+        for _ in range(5):
+            tracker.record("https://example.com/x", 0.1)
+        extractor = self._extractor(tracker)
+        extractor._session.get.return_value = _mock_response(ARTICLE_HTML)
+
+        extractor.extract("https://example.com/a")
+        extractor.extract("https://other.com/a")
+
+        timeouts = [call.kwargs["timeout"] for call in extractor._session.get.call_args_list]
+        assert timeouts == [(2, 2), (3, 10)]
+        assert len(tracker) == 2
+
+    def test_timeout_recorded(self):
+        """测试请求超时按本次使用的超时记录"""
+        tracker = LatencyTracker()
+        extractor = self._extractor(tracker)
+        extractor._session.get.side_effect = requests.exceptions.Timeout()
+
+        extractor.extract("https://example.com/a")
+
+        assert tracker._stats["example.com"].samples[-1] == 10
+
+    def _slow_extractor(self, monkeypatch, tracker, elapsed):
+        """每次请求耗时 elapsed 秒、配置了熔断器的提取器"""
+        now = [1000.0]
+        monkeypatch.setattr("feedland_parser.article_extractor.time.monotonic", lambda: now[0])
+
+        def get(url, **kwargs):
+            now[0] += elapsed
+            return _mock_response(ARTICLE_HTML)
+
+        extractor = ArticleExtractor(
+            latency_tracker=tracker,
+            circuit_breaker=CircuitBreaker(min_calls=3, failure_rate=1.0, slow_call_duration=8),
+        )
+        extractor._session = MagicMock()
+        extractor._session.get.side_effect = get
+        return extractor
+
+    def test_slow_healthy_host_not_tripped(self, monkeypatch):
+        """测试响应慢但正常的域名不计为慢请求，不会熔断"""
+        tracker = LatencyTracker(max_timeout=30)
+        for elapsed in (9, 10, 11, 10, 9):
+            tracker.record("https://slow.com/x", elapsed)
+        extractor = self._slow_extractor(monkeypatch, tracker, 10)
+
+        for i in range(5):
+            assert extractor.extract(f"https://slow.com/{i}").extraction_method != "description-fallback"
+
+        assert extractor.circuit_breaker.state("slow.com") == CLOSED
+        assert extractor._session.get.call_count == 5
+
+    def test_slow_call_threshold_without_tracker(self, monkeypatch):
+        """测试未启用自适应超时时仍按固定阈值统计慢请求"""
+        extractor = self._slow_extractor(monkeypatch, None, 10)
+
+        for i in range(3):
+            extractor.extract(f"https://slow.com/{i}")
+
+        assert extractor.circuit_breaker.state("slow.com") == OPEN
@@ -0,0 +1,113 @@
+"""JSON Lines 输出测试"""
+
+import json
+
+import pytest
+
+from feedland_parser.feed_parser import FeedResult
+from feedland_parser.opml_parser import FeedInfo
+from feedland_parser.output_writer import JsonlWriter, feed_record
+
+
+def _result(url="https://example.com/feed.xml", count=2, success=True):
+    feed_info = FeedInfo(url=url, title="Example Feed", feed_type="RSS")
+    articles = [
+        {"title": f"Article {i}", "url": f"https://example.com/{i}", "content": "正文", "_images_future": object()}
+        for i in range(count)
+    ]
+    return FeedResult(feed_info=feed_info, articles=articles, success=success)
+
+
+def _lines(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+class TestFeedRecord:
+    """feed_record 测试类"""
+
+    def test_internal_fields_removed(self):
+        """测试移除以 _ 开头的内部字段"""
+        record = feed_record(_result())
+        assert record["feed_url"] == "https://example.com/feed.xml"
+        assert record["feed_type"] == "RSS"
+        assert [a["title"] for a in record["articles"]] == ["Article 0", "Article 1"]
+        assert all("_images_future" not in a for a in record["articles"])
+
+    def test_failed_or_empty_result_skipped(self):
+        """测试失败或没有文章的结果不生成记录"""
+        assert feed_record(_result(success=False)) is None
+        assert feed_record(_result(count=0)) is None
+
+
+class TestJsonlWriter:
+    """JsonlWriter 测试类"""
+
+    def test_article_records(self, tmp_path):
+        """测试每篇文章一行，附带 feed 信息"""
+        path = tmp_path / "out" / "results.jsonl"
+        with JsonlWriter(str(path)) as writer:
+            writer.write_result(_result(count=2))
+            writer.write_result(_result(success=False))
+            writer.write_result(_result(url="https://other.com/feed", count=1))
+
+        lines = _lines(path)
+        assert writer.records == 3
+        assert [line["title"] for line in lines] == ["Article 0", "Article 1", "Article 0"]
+        assert lines[2]["feed_url"] == "https://other.com/feed"
+        assert "_images_future" not in lines[0]
+
+    def test_feed_records(self, tmp_path):
+        """测试每个 feed 一行"""
+        path = tmp_path / "results.jsonl"
+        writer = JsonlWriter(str(path), record="feed")
+        writer.write_result(_result(count=3))
+        writer.close()
+
+        lines = _lines(path)
+        assert len(lines) == 1
+        assert len(lines[0]["articles"]) == 3
+
+    def test_written_to_part_file_until_closed(self, tmp_path):
+        """测试完成前写入 .part 文件，完成后原子重命名"""
+        path = tmp_path / "results.jsonl"
+        writer = JsonlWriter(str(path))
+        writer.write_result(_result(count=1))
+
+        assert not path.exists()
+        assert len(_lines(writer.part_path)) == 1  # 每次写入后已刷新
+
+        writer.close()
+        assert path.exists()
+        assert not (tmp_path / "results.jsonl.part").exists()
+
+    def test_abort_keeps_partial_results(self, tmp_path):
+        """测试异常中断时保留已写入的部分结果"""
+        path = tmp_path / "results.jsonl"
+        with pytest.raises(RuntimeError):
+            with JsonlWriter(str(path)) as writer:
+                writer.write_result(_result(count=2))
+                raise RuntimeError("中断")
+
+        assert not path.exists()
+        assert len(_lines(writer.part_path)) == 2
+
+    def test_invalid_record(self, tmp_path):
+        """测试不支持的记录类型"""
+        with pytest.raises(ValueError):
+            JsonlWriter(str(tmp_path / "results.jsonl"), record="entry")
+
+    def test_append_resumes_part_file(self, tmp_path):
+        """测试续传时继续写入临时文件，并删除末尾写到一半的行"""
+        path = tmp_path / "results.jsonl"
+        writer = JsonlWriter(str(path))
+        writer.write_result(_result(count=1))
+        writer.abort()
+        with open(writer.part_path, "a", encoding="utf-8") as f:
+            f.write('{"title": "半')
+
+        with JsonlWriter(str(path), append=True) as resumed:
+            resumed.write_result(_result(url="https://other.com/feed", count=1))
+
+        lines = _lines(path)
+        assert [line["feed_url"] for line in lines] == ["https://example.com/feed.xml", "https://other.com/feed"]
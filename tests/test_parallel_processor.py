@@ -0,0 +1,169 @@
+"""ParallelFeedProcessor 测试（窗口提交和结果 sink）"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from feedland_parser.config import Config
+from feedland_parser.feed_parser import FeedResult
+from feedland_parser.filter import Filter
+from feedland_parser.opml_parser import FeedInfo
+from feedland_parser.parallel_processor import ParallelFeedProcessor
+from feedland_parser.pipeline_processor import PipelineFeedProcessor
+
+
+class TestParallelFeedProcessor:
+    """并行处理器测试"""
+
+    @pytest.fixture
+    def filter_obj(self):
+        """创建空历史记录的 Filter"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump({"url": "https://test.com/opml", "his": {}}, f)
+            temp_file = f.name
+
+        config = Config(temp_file)
+        config.load()
+        filter_obj = Filter(config)
+        filter_obj.load_history()
+
+        yield filter_obj
+
+        os.unlink(temp_file)
+
+    @pytest.fixture
+    def feeds(self):
+        return [FeedInfo(url=f"https://f{i}.com/feed", title=f"f{i}", feed_type="RSS") for i in range(20)]
+
+    def _parser(self):
+        """创建每个 feed 返回一篇文章的 FeedParser"""
+        parser = MagicMock()
+
+        def parse_feed(feed_info):
+            time.sleep(0.002)
+            return FeedResult(feed_info=feed_info, success=True, articles=[
+                {"url": f"{feed_info.url}/a", "content": "x" * 100, "_id": "2025-02-10T10:00:00"}
+            ])
+
+        parser.parse_feed.side_effect = parse_feed
+        return parser
+
+    def test_submission_window(self, filter_obj, feeds, monkeypatch):
+        """测试同时提交的 feed 不超过 max_pending"""
+        processor = ParallelFeedProcessor(self._parser(), filter_obj, max_workers=2, max_pending=3)
+        lock = threading.Lock()
+        state = {"pending": 0, "peak": 0, "submitted": 0}
+        real_submit = ThreadPoolExecutor.submit
+
+        def submit(executor, fn, *args, **kwargs):
+            with lock:
+                state["pending"] += 1
+                state["submitted"] += 1
+                state["peak"] = max(state["peak"], state["pending"])
+            future = real_submit(executor, fn, *args, **kwargs)
+            future.add_done_callback(lambda _: self._done(lock, state))
+            return future
+
+        monkeypatch.setattr(ThreadPoolExecutor, "submit", submit)
+        results = processor.process_feeds_parallel(feeds)
+
+        assert [r.feed_info.url for r in results] == [f.url for f in feeds]
+        assert state["submitted"] == 20
+        assert state["peak"] <= 3
+
+    @staticmethod
+    def _done(lock, state):
+        with lock:
+            state["pending"] -= 1
+
+    def test_result_sink(self, filter_obj, feeds):
+        """测试结果交给 sink 后不再保留文章内容，摘要仍然正确"""
+        processor = ParallelFeedProcessor(self._parser(), filter_obj, max_workers=4)
+        received = []
+
+        results = processor.process_feeds_parallel(feeds, result_sink=received.append)
+
+        assert sorted(r.feed_info.url for r in received) == sorted(f.url for f in feeds)
+        assert all(len(r.articles) == 1 for r in received)
+        assert all(r.articles == [] for r in results)
+        assert processor.get_summary(results)["total_articles"] == 20
+        assert filter_obj.get_last_id(feeds[0].url) == "2025-02-10T10:00:00"
+
+    def test_pipeline_result_sink(self, filter_obj, feeds):
+        """测试流水线引擎的结果 sink 和 feed 窗口"""
+        parser = MagicMock()
+        parser.max_articles = 5
+        parser.fetch_article_jobs.side_effect = lambda f: (FeedResult(feed_info=f, articles=[], success=True), [])
+        parser.finish_result.side_effect = lambda r, a, n: r
+        received = []
+
+        processor = PipelineFeedProcessor(parser, filter_obj, max_workers=2, max_pending=2)
+        results = processor.process_feeds_parallel(feeds, result_sink=received.append)
+
+        assert len(received) == 20
+        assert [r.feed_info.url for r in results] == [f.url for f in feeds]
+
+    def test_checkpoint_during_run(self, filter_obj, feeds):
+        """测试运行中保存检查点，正常完成后清除运行进度"""
+        processor = ParallelFeedProcessor(self._parser(), filter_obj, max_workers=2, checkpoint_interval=0.001)
+        checkpoints = []
+        save_history = filter_obj.save_history
+
+        def record_save(completed_only=False):
+            checkpoints.append((completed_only, len(filter_obj.completed_feeds())))
+            save_history(completed_only=completed_only)
+
+        filter_obj.save_history = record_save
+        processor.process_feeds_parallel(feeds, result_sink=lambda result: None)
+
+        assert any(completed_only and count > 0 for completed_only, count in checkpoints[:-1])
+        assert checkpoints[-1] == (False, 0)
+        with open(filter_obj.config.config_path, encoding="utf-8") as f:
+            assert "his_run" not in json.load(f)
+
+    def test_failed_feed_not_marked_completed(self, filter_obj, feeds):
+        """测试失败的 feed 不记录为已完成（续传时重试）"""
+        processor = ParallelFeedProcessor(MagicMock(), filter_obj, max_workers=1)
+        processor._checkpoint(FeedResult(feed_info=feeds[0], articles=[], success=False, error="x"), True)
+        processor._checkpoint(FeedResult(feed_info=feeds[1], articles=[], success=True), True)
+
+        assert filter_obj.completed_feeds() == {feeds[1].url}
+
+    def test_no_checkpoint_without_sink(self, filter_obj, feeds):
+        """测试没有 result_sink 时不保存检查点（结果尚未写出，中断后不能跳过这些文章）"""
+        processor = ParallelFeedProcessor(self._parser(), filter_obj, max_workers=2, checkpoint_interval=0.001)
+        checkpoints = []
+        save_history = filter_obj.save_history
+
+        def record_save(completed_only=False):
+            checkpoints.append(completed_only)
+            save_history(completed_only=completed_only)
+
+        filter_obj.save_history = record_save
+        processor.process_feeds_parallel(feeds)
+
+        assert checkpoints == [False]  # 只在全部完成后保存
+        assert filter_obj.completed_feeds() == set()
+
+    def test_failed_sink_not_marked_completed(self, filter_obj, feeds):
+        """测试 sink 写出失败的 feed 不记录为已完成"""
+        processor = ParallelFeedProcessor(self._parser(), filter_obj, max_workers=1)
+
+        def sink(result):
+            if result.feed_info.url == feeds[0].url:
+                raise OSError("磁盘已满")
+
+        completed = []
+        real_checkpoint = processor._checkpoint
+        processor._checkpoint = lambda result, persisted: (
+            completed.append((result.feed_info.url, persisted)), real_checkpoint(result, persisted)
+        )
+        processor.process_feeds_parallel(feeds[:2], result_sink=sink)
+
+        assert dict(completed) == {feeds[0].url: False, feeds[1].url: True}
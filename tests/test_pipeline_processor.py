@@ -0,0 +1,156 @@
+"""PipelineFeedProcessor 测试（使用模拟的 FeedParser 阶段）"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from feedland_parser.config import Config
+from feedland_parser.feed_parser import ArticleJob, FeedParser, FeedResult
+from feedland_parser.filter import Filter
+from feedland_parser.opml_parser import FeedInfo
+from feedland_parser.parallel_processor import ParallelFeedProcessor
+from feedland_parser.pipeline_processor import PipelineFeedProcessor
+
+
+def _job(feed: str, index: int) -> ArticleJob:
+    return ArticleJob(
+        url=f"https://{feed}.com/{index}",
+        title=f"{feed} {index}",
+        published=f"2025-02-{20 - index:02d}T10:00:00",
+        author=None,
+        description=None,
+        article_id=f"2025-02-{20 - index:02d}T10:00:00",
+        id_type="published",
+    )
+
+
+class TestPipelineFeedProcessor:
+    """流水线处理器测试"""
+
+    @pytest.fixture
+    def filter_obj(self):
+        """创建空历史记录的 Filter"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump({"url": "https://test.com/opml", "his": {}}, f)
+            temp_file = f.name
+
+        config = Config(temp_file)
+        config.load()
+        filter_obj = Filter(config)
+        filter_obj.load_history()
+
+        yield filter_obj
+
+        os.unlink(temp_file)
+
+    def _parser(self, filter_obj, jobs_per_feed: int = 3, failing=(), delay: float = 0.0, max_articles: int = 5):
+        """创建只替换网络阶段的 FeedParser"""
+        parser = FeedParser(MagicMock(), filter_obj, max_articles=max_articles)
+
+        def fetch_article_jobs(feed_info):
+            name = feed_info.title
+            result = FeedResult(feed_info=feed_info, articles=[], success=True)
+            return result, [_job(name, i) for i in range(jobs_per_feed)]
+
+        def extract_article(feed_info, job):
+            time.sleep(delay)
+            if job.url in failing:
+                return None
+            return {"title": job.title, "url": job.url, "published": job.published,
+                    "_id": job.article_id, "_id_type": job.id_type}
+
+        parser.fetch_article_jobs = MagicMock(side_effect=fetch_article_jobs)
+        parser.extract_article = MagicMock(side_effect=extract_article)
+        return parser
+
+    def _feeds(self, names):
+        return [FeedInfo(url=f"https://{n}.com/feed", title=n, feed_type="RSS") for n in names]
+
+    def test_results_ordered_and_complete(self, filter_obj):
+        """测试结果与输入顺序一致，文章按时间排序"""
+        parser = self._parser(filter_obj)
+        feeds = self._feeds(["a", "b", "c"])
+
+        results = PipelineFeedProcessor(parser, filter_obj, max_workers=2, article_workers=3).process_feeds_parallel(feeds)
+
+        assert [r.feed_info.url for r in results] == [f.url for f in feeds]
+        for result in results:
+            assert [a["url"] for a in result.articles] == [f"https://{result.feed_info.title}.com/{i}" for i in range(3)]
+        assert filter_obj.get_last_id("https://a.com/feed") == "2025-02-20T10:00:00"
+
+    def test_max_articles_refilled_after_failures(self, filter_obj):
+        """测试失败的文章由后续文章补位，成功数不超过 max_articles（与串行处理一致）"""
+        parser = self._parser(filter_obj, jobs_per_feed=6, failing={"https://a.com/0", "https://a.com/2"},
+                              max_articles=3)
+
+        result, = PipelineFeedProcessor(parser, filter_obj, article_workers=4).process_feeds_parallel(self._feeds(["a"]))
+
+        assert [a["url"] for a in result.articles] == ["https://a.com/1", "https://a.com/3", "https://a.com/4"]
+        assert parser.extract_article.call_count == 5
+
+    def test_same_result_as_thread_engine(self, filter_obj):
+        """测试与线程池引擎的结果一致"""
+        failing = {"https://b.com/1"}
+        pipeline = self._parser(filter_obj, failing=failing, max_articles=2)
+        results = PipelineFeedProcessor(pipeline, filter_obj).process_feeds_parallel(self._feeds(["a", "b"]))
+
+        serial = self._parser(filter_obj, failing=failing, max_articles=2)
+
+        def parse_feed(feed_info):
+            result, jobs = serial.fetch_article_jobs(feed_info)
+            articles, processed = [], 0
+            for job in jobs:
+                if len(articles) >= serial.max_articles:
+                    break
+                processed += 1
+                article = serial.extract_article(feed_info, job)
+                if article:
+                    articles.append(article)
+            return serial.finish_result(result, articles, processed)
+
+        serial.parse_feed = parse_feed
+        expected = ParallelFeedProcessor(serial, filter_obj).process_feeds_parallel(self._feeds(["a", "b"]))
+
+        assert [r.articles for r in results] == [r.articles for r in expected]
+
+    def test_article_queue_bounded(self, filter_obj):
+        """测试提交到文章线程池的文章数不超过队列上限"""
+        lock = threading.Lock()
+        state = {"current": 0, "peak": 0}
+        parser = self._parser(filter_obj, jobs_per_feed=5)
+        extract = parser.extract_article.side_effect
+
+        def tracked(feed_info, job):
+            with lock:
+                state["current"] += 1
+                state["peak"] = max(state["peak"], state["current"])
+            try:
+                time.sleep(0.005)
+                return extract(feed_info, job)
+            finally:
+                with lock:
+                    state["current"] -= 1
+
+        parser.extract_article.side_effect = tracked
+        processor = PipelineFeedProcessor(parser, filter_obj, max_workers=4, article_workers=2, queue_size=2)
+        results = processor.process_feeds_parallel(self._feeds([f"f{i}" for i in range(6)]))
+
+        assert all(len(r.articles) == 5 for r in results)
+        assert state["peak"] <= 2
+
+    def test_failed_feed(self, filter_obj):
+        """测试 feed 获取失败时直接返回失败结果"""
+        parser = self._parser(filter_obj)
+        parser.fetch_article_jobs = MagicMock(side_effect=lambda f: (
+            FeedResult(feed_info=f, articles=[], success=False, error="无法获取 feed 数据"), []
+        ))
+
+        result, = PipelineFeedProcessor(parser, filter_obj).process_feeds_parallel(self._feeds(["a"]))
+
+        assert not result.success
+        parser.extract_article.assert_not_called()
@@ -0,0 +1,107 @@
+"""cloudscraper 会话池测试"""
+
+import json
+import threading
+import time
+import pytest
+
+from feedland_parser import scraper_pool as scraper_pool_module
+from feedland_parser.article_extractor import ArticleExtractor
+from feedland_parser.scraper_pool import ScraperPool
+
+pytestmark = pytest.mark.skipif(
+    not scraper_pool_module.CLOUDSCRAPER_AVAILABLE, reason="未安装 cloudscraper"
+)
+
+
+class TestScraperPool:
+    """ScraperPool 测试类"""
+
+    def test_reuse_scraper_per_domain(self):
+        """测试同一域名复用 scraper"""
+        pool = ScraperPool()
+        a = pool.get("https://www.example.com/a")
+        b = pool.get("https://example.com/b")
+        c = pool.get("https://other.com/c")
+
+        assert a is b
+        assert a is not c
+        assert len(pool) == 2
+        pool.close()
+        assert len(pool) == 0
+
+    def test_scraper_per_thread(self, tmp_path):
+        """测试每个线程使用自己的 scraper，新实例继承其他线程的 cookies，保存时合并"""
+        cookie_file = tmp_path / "cookies.json"
+        pool = ScraperPool(cookie_file=str(cookie_file))
+        main = pool.get("https://example.com/a")
+        main.cookies.set("cf_clearance", "token", domain=".example.com", path="/")
+        others = []
+
+        def worker():
+            scraper = pool.get("https://example.com/b")
+            scraper.cookies.set("session", "s1", domain=".example.com", path="/")
+            others.append(scraper)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        assert others[0] is not main
+        assert others[0].cookies.get("cf_clearance", domain=".example.com") == "token"
+        assert pool.get("https://example.com/c") is main
+        assert len(pool) == 2
+
+        pool.close()
+        data = json.loads(cookie_file.read_text())
+        assert sorted(c["name"] for c in data["example.com"]) == ["cf_clearance", "session"]
+
+    def test_cookies_persisted(self, tmp_path):
+        """测试 cookies 保存后下次运行恢复"""
+        cookie_file = tmp_path / "state" / "cookies.json"
+
+        pool = ScraperPool(cookie_file=str(cookie_file))
+        scraper = pool.get("https://example.com/a")
+        scraper.cookies.set("cf_clearance", "token", domain=".example.com", path="/")
+        pool.close()
+
+        assert cookie_file.exists()
+        data = json.loads(cookie_file.read_text())
+        assert data["example.com"][0]["name"] == "cf_clearance"
+
+        new_pool = ScraperPool(cookie_file=str(cookie_file))
+        restored = new_pool.get("https://example.com/b")
+        assert restored.cookies.get("cf_clearance", domain=".example.com") == "token"
+        new_pool.close()
+
+    def test_expired_cookies_skipped(self, tmp_path):
+        """测试过期 cookies 不恢复"""
+        cookie_file = tmp_path / "cookies.json"
+        cookie_file.write_text(json.dumps({
+            "example.com": [{"name": "old", "value": "v", "domain": ".example.com",
+                             "path": "/", "expires": int(time.time()) - 60, "secure": False}]
+        }))
+
+        pool = ScraperPool(cookie_file=str(cookie_file))
+        assert pool.get("https://example.com/").cookies.get("old") is None
+
+    def test_unused_domains_kept_on_save(self, tmp_path):
+        """测试本次未使用的域名 cookies 保存时不丢失"""
+        cookie_file = tmp_path / "cookies.json"
+        cookie_file.write_text(json.dumps({
+            "kept.com": [{"name": "a", "value": "1", "domain": ".kept.com",
+                          "path": "/", "expires": None, "secure": False}]
+        }))
+
+        pool = ScraperPool(cookie_file=str(cookie_file))
+        pool.get("https://example.com/")
+        pool.close()
+
+        data = json.loads(cookie_file.read_text())
+        assert "kept.com" in data
+        assert "example.com" in data
+
+    def test_extractor_keeps_empty_pool(self):
+        """测试传入的空会话池不会被替换（空池的 len 为 0）"""
+        pool = ScraperPool()
+        assert ArticleExtractor(scraper_pool=pool).scraper_pool is pool
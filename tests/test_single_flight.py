@@ -0,0 +1,114 @@
+"""跨 feed 文章去重（single-flight）测试"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from feedland_parser.article_extractor import ArticleExtractor
+from feedland_parser.single_flight import SingleFlight
+
+from .test_article_extractor import ARTICLE_HTML, _mock_response
+
+
+class TestSingleFlight:
+    """SingleFlight 测试类"""
+
+    def test_concurrent_calls_share_one_execution(self):
+        """测试同时到达的相同 key 只执行一次"""
+        flight = SingleFlight()
+        calls = []
+        started = threading.Event()
+
+        def work():
+            calls.append(1)
+            started.set()
+            time.sleep(0.05)
+            return "result"
+
+        outputs = []
+        threads = [threading.Thread(target=lambda: outputs.append(flight.do("k", work))) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert sorted(outputs, key=lambda o: o[1]) == [("result", False)] + [("result", True)] * 4
+        assert flight.hits == 4
+
+    def test_completed_result_reused_and_bounded(self):
+        """测试已完成的结果被复用，超过上限时淘汰最早的结果"""
+        flight = SingleFlight(max_results=1)
+        assert flight.do("a", lambda: 1) == (1, False)
+        assert flight.do("a", lambda: 2) == (1, True)
+        flight.do("b", lambda: 3)
+        assert flight.do("a", lambda: 4) == (4, False)
+
+    def test_failure_not_cached(self):
+        """测试执行失败时异常传给调用方，之后重新执行"""
+        flight = SingleFlight()
+        with pytest.raises(ValueError):
+            flight.do("k", MagicMock(side_effect=ValueError("boom")))
+        assert flight.do("k", lambda: "ok") == ("ok", False)
+
+
+class TestExtractorDedup:
+    """ArticleExtractor 跨 feed 去重测试类"""
+
+    def _extractor(self, response):
+        extractor = ArticleExtractor(single_flight=SingleFlight())
+        extractor._session = MagicMock()
+        extractor._session.get.return_value = response
+        return extractor
+
+    def test_same_article_fetched_once(self):
+        """测试同一篇文章只下载一次，元数据使用各 feed 自己的条目"""
+        extractor = self._extractor(_mock_response(ARTICLE_HTML))
+
+        first = extractor.extract("https://example.com/a", title="源站标题", author="作者")
+        second = extractor.extract("https://EXAMPLE.com/a#comments", title="转载标题")
+
+        assert extractor._session.get.call_count == 1
+        assert second.content == first.content
+        assert second.images == first.images and second.images is not first.images
+        assert second.title == "转载标题"
+        assert second.author == "Unknown"
+        assert second.url == "https://EXAMPLE.com/a#comments"
+
+    def test_dedupe_key(self):
+        """测试 dedupe_key 相同的不同链接只下载一次，各自保留原始链接"""
+        extractor = self._extractor(_mock_response(ARTICLE_HTML))
+
+        extractor.extract("https://example.com/a?utm_source=rss", dedupe_key="https://example.com/a")
+        second = extractor.extract("https://example.com/a?utm_medium=x", dedupe_key="https://example.com/a")
+
+        assert extractor._session.get.call_count == 1
+        assert extractor._session.get.call_args.args[0] == "https://example.com/a?utm_source=rss"
+        assert second.url == "https://example.com/a?utm_medium=x"
+
+    def test_failed_extraction_uses_own_description(self):
+        """测试页面提取失败时各 feed 使用自己的描述回退，不重复下载"""
+        extractor = self._extractor(None)
+        extractor._session.get.side_effect = requests.exceptions.ConnectionError("boom")
+
+        description = "这是第二个 feed 中足够长的描述内容，用于在复用失败结果时回退。" * 2
+        extractor.extract("https://example.com/a")
+        second = extractor.extract("https://example.com/a", description=description)
+
+        assert extractor._session.get.call_count == 1
+        assert second.extraction_method == "description-fallback"
+        assert second.content == description
+
+    def test_disabled_by_default(self):
+        """测试未设置 single_flight 时每次都重新提取"""
+        extractor = ArticleExtractor()
+        extractor._session = MagicMock()
+        extractor._session.get.return_value = _mock_response(ARTICLE_HTML)
+
+        extractor.extract("https://example.com/a")
+        extractor.extract("https://example.com/a")
+
+        assert extractor._session.get.call_count == 2
@@ -0,0 +1,122 @@
+"""提取策略统计测试"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from feedland_parser.article_extractor import ArticleExtractor, FetchedPage
+from feedland_parser.strategy_stats import StrategyStats
+
+
+STRATEGIES = [SimpleNamespace(name=n) for n in ("Readability", "Newspaper3k", "CSS-Selectors")]
+
+PARAGRAPH = "这是一段用于测试策略统计的正文内容，长度足够让提取策略判定为有效正文。" * 5
+
+
+def _names(strategies):
+    return [s.name for s in strategies]
+
+
+class TestStrategyStats:
+    """StrategyStats 测试类"""
+
+    def test_default_order_without_stats(self):
+        """测试没有统计时保持默认顺序"""
+        stats = StrategyStats()
+        assert _names(stats.order("https://example.com/a", STRATEGIES)) == ["Readability", "Newspaper3k", "CSS-Selectors"]
+
+    def test_winner_tried_first(self):
+        """测试成功的策略排到最前面（按域名，忽略 www.）"""
+        stats = StrategyStats()
+        stats.record("https://www.example.com/a", "Readability", False)
+        stats.record("https://www.example.com/a", "CSS-Selectors", True)
+
+        assert _names(stats.order("https://example.com/b", STRATEGIES))[0] == "CSS-Selectors"
+        assert _names(stats.order("https://other.com/b", STRATEGIES))[0] == "Readability"
+
+    def test_failing_strategy_skipped(self):
+        """测试长期失败的策略被跳过，但至少保留一个"""
+        stats = StrategyStats(min_attempts=3)
+        for _ in range(3):
+            stats.record("https://example.com/a", "Readability", False)
+
+        assert "Readability" not in _names(stats.order("https://example.com/a", STRATEGIES))
+
+        only = [STRATEGIES[0]]
+        assert _names(stats.order("https://example.com/a", only)) == ["Readability"]
+
+    def test_periodic_exploration(self):
+        """测试每 explore_every 次按默认顺序尝试，排在后面的策略仍有机会运行"""
+        stats = StrategyStats(explore_every=3)
+        stats.record("https://example.com/a", "Readability", False)
+        stats.record("https://example.com/a", "CSS-Selectors", True)
+
+        orders = [_names(stats.order("https://example.com/a", STRATEGIES))[0] for _ in range(6)]
+        assert orders == ["CSS-Selectors", "CSS-Selectors", "Readability"] * 2
+
+        assert _names(StrategyStats(explore_every=0).order("https://example.com/a", STRATEGIES))[0] == "Readability"
+
+    def test_persisted_with_decay(self, tmp_path):
+        """测试统计保存后加载时衰减"""
+        state_file = tmp_path / "stats.json"
+        stats = StrategyStats(state_file=str(state_file), decay=0.5)
+        for _ in range(4):
+            stats.record("https://example.com/a", "Readability", False)
+        stats.save()
+
+        reloaded = StrategyStats(state_file=str(state_file), decay=0.5)
+        assert json.loads(state_file.read_text())["example.com"]["Readability"] == [0, 4]
+        assert reloaded.success_rate("https://example.com/a", "Readability") == 1 / 4
+
+    def test_small_counts_pruned_on_load(self, tmp_path):
+        """测试衰减后过小的统计被删除"""
+        state_file = tmp_path / "stats.json"
+        state_file.write_text(json.dumps({"example.com": {"Readability": [0, 0.6]}}))
+
+        assert len(StrategyStats(state_file=str(state_file), decay=0.5)) == 0
+
+
+class TestExtractorStrategyOrder:
+    """提取器按统计排序策略测试"""
+
+    def test_learned_strategy_tried_first(self):
+        """测试学习到的策略先尝试，失败的策略不再浪费尝试"""
+        extractor = ArticleExtractor()
+        readability = extractor._strategies[0]
+        readability.extract = MagicMock(return_value=None)
+        page = FetchedPage(url="https://example.com/a", status_code=200,
+                           text=f"<html><body><article><p>{PARAGRAPH}</p></article></body></html>")
+
+        first = extractor.extract_from_page(page)
+        second = extractor.extract_from_page(page)
+
+        assert first.success and second.success
+        assert second.extraction_method == first.extraction_method != "readability"
+        assert readability.extract.call_count == 1
+
+    def _stubbed(self, **results):
+        """按策略名替换提取结果的提取器"""
+        extractor = ArticleExtractor()
+        for strategy in extractor._strategies:
+            if strategy.name in results:
+                strategy.extract = MagicMock(return_value=results[strategy.name])
+        return extractor
+
+    def test_inapplicable_strategies_not_recorded(self):
+        """测试没有运行的策略（cloudscraper 未重新下载、页面不可用）不计入统计"""
+        extractor = self._stubbed(Readability=PARAGRAPH)
+        extractor.extract_from_page(FetchedPage(url="https://example.com/a", status_code=200, text="<html></html>"))
+        extractor.extract_from_page(FetchedPage(url="https://other.com/a", status_code=403, text="Forbidden"))
+
+        assert extractor.strategy_stats._stats == {"example.com": {"Readability": [1.0, 1.0]}}
+
+    def test_body_fallback_not_a_win(self):
+        """测试 CSS 选择器退回整页文本时结果可用，但不计为成功"""
+        extractor = self._stubbed(Readability=None, Newspaper3k=None)
+        page = FetchedPage(url="https://example.com/a", status_code=200,
+                           text=f"<html><body><div>{PARAGRAPH}</div></body></html>")
+
+        result = extractor.extract_from_page(page)
+
+        assert result.success and result.extraction_method == "css-selectors"
+        assert extractor.strategy_stats._stats["example.com"]["CSS-Selectors"] == [0.0, 1.0]
@@ -0,0 +1,104 @@
+"""文章 URL 规范化测试"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from feedland_parser.feed_parser import FeedParser
+from feedland_parser.opml_parser import FeedInfo
+from feedland_parser.url_canonicalizer import UrlCanonicalizer
+
+from .test_feed_parser import _mock_response
+
+
+class TestUrlCanonicalizer:
+    """UrlCanonicalizer 测试类"""
+
+    @pytest.fixture
+    def canonicalizer(self):
+        return UrlCanonicalizer()
+
+    def test_tracking_params_and_host(self, canonicalizer):
+        """测试删除跟踪参数、片段和默认端口，主机名小写，其余参数保持原样"""
+        url = "HTTPS://Example.COM:443/a?utm_source=rss&id=3&b=%2F&utm_medium=x&fbclid=1#comments"
+        assert canonicalizer(url) == "https://example.com/a?id=3&b=%2F"
+
+    def test_essential_params_kept(self, canonicalizer):
+        """测试公众号文章等依赖查询参数的链接不受影响"""
+        url = "https://mp.weixin.qq.com/s?__biz=MzA&mid=1&idx=1&sn=ab#rd"
+        assert canonicalizer(url) == "https://mp.weixin.qq.com/s?__biz=MzA&mid=1&idx=1&sn=ab"
+
+    def test_redirectors_unwrapped(self, canonicalizer):
+        """测试展开跳转服务，目标地址同样规范化"""
+        assert canonicalizer("https://www.google.com/url?q=https://example.com/p%3Fa%3D1&sa=D") == "https://example.com/p?a=1"
+        assert canonicalizer("https://link.zhihu.com/?target=https%3A//example.com/x%3Futm_source%3Dz") == "https://example.com/x"
+
+    def test_amp_variants(self):
+        """测试开启后只改写已知形式的 AMP 页面"""
+        canonicalizer = UrlCanonicalizer(normalize_mobile=True)
+        assert canonicalizer("https://example.com/amp/2025/story?amp=1") == "https://example.com/2025/story"
+        assert canonicalizer("https://example.com/news?id=3&outputType=amp") == "https://example.com/news?id=3"
+        assert canonicalizer(
+            "https://www-example-com.cdn.ampproject.org/c/s/www.example.com/amp/news"
+        ) == "https://www.example.com/news"
+
+    def test_mobile_hosts_and_amp_suffix_kept(self):
+        """测试 m. / amp. 主机和以 /amp 结尾的路径不改写"""
+        canonicalizer = UrlCanonicalizer(normalize_mobile=True)
+        assert canonicalizer("https://m.example.com/a") == "https://m.example.com/a"
+        assert canonicalizer("https://amp.example.com/a") == "https://amp.example.com/a"
+        assert canonicalizer("https://example.com/tags/amp") == "https://example.com/tags/amp"
+
+    def test_amp_off_by_default(self, canonicalizer):
+        """测试默认不改写 AMP 页面"""
+        assert canonicalizer("https://example.com/amp/story?amp=1") == "https://example.com/amp/story?amp=1"
+
+    def test_ipv6_and_hashbang(self, canonicalizer):
+        """测试保留 IPv6 地址的方括号和 #! 路由片段"""
+        assert canonicalizer("http://[2001:DB8::1]:8080/a#top") == "http://[2001:db8::1]:8080/a"
+        assert canonicalizer("https://[::1]/a") == "https://[::1]/a"
+        assert canonicalizer("https://example.com/#!/post/42") == "https://example.com/#!/post/42"
+
+    def test_options(self):
+        """测试自定义参数和关闭移动版规范化"""
+        canonicalizer = UrlCanonicalizer(strip_params=["from", "share_*"], normalize_mobile=False)
+        assert canonicalizer("https://m.example.com/a?from=rss&share_id=1&utm_source=x") == "https://m.example.com/a?utm_source=x"
+
+    def test_non_http_unchanged(self, canonicalizer):
+        """测试非 http(s) 链接原样返回"""
+        assert canonicalizer("ftp://example.com/file") == "ftp://example.com/file"
+
+
+class TestFeedParserCanonicalization:
+    """FeedParser 中的 URL 规范化测试类"""
+
+    RSS = b"""<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0" xmlns:feedburner="http://rssnamespace.org/feedburner/ext/1.0">
+<channel><title>Example</title>
+<item><title>A</title><link>https://feedproxy.google.com/~r/example/~3/abc/</link>
+<feedburner:origLink>https://example.com/a?utm_source=feedburner</feedburner:origLink>
+<pubDate>Mon, 10 Feb 2025 10:00:00 GMT</pubDate></item>
+<item><title>B</title><link>https://m.example.com/b?utm_medium=rss</link>
+<pubDate>Mon, 10 Feb 2025 09:00:00 GMT</pubDate></item>
+</channel></rss>"""
+
+    def _jobs(self, canonicalizer):
+        parser = FeedParser(MagicMock(), None, url_canonicalizer=canonicalizer)
+        parser._session = MagicMock()
+        parser._session.get.return_value = _mock_response(200, self.RSS)
+        _, jobs = parser.fetch_article_jobs(FeedInfo(url="https://example.com/feed.xml", title="Example", feed_type="RSS"))
+        return [(job.url, job.dedupe_key) for job in jobs]
+
+    def test_canonical_url_only_dedupe_key(self):
+        """测试规范化的链接只用作去重 key，文章保留原始链接，FeedBurner 使用原始链接"""
+        assert self._jobs(UrlCanonicalizer()) == [
+            ("https://example.com/a?utm_source=feedburner", "https://example.com/a"),
+            ("https://m.example.com/b?utm_medium=rss", "https://m.example.com/b"),
+        ]
+
+    def test_disabled(self):
+        """测试未设置规范化器时保持原始链接"""
+        assert self._jobs(None) == [
+            ("https://feedproxy.google.com/~r/example/~3/abc/", None),
+            ("https://m.example.com/b?utm_medium=rss", None),
+        ]